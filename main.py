@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
 # import faulthandler
+from packages.Startup.StartupTiming import mark_startup_step  # first, so it times the other imports
 import logging
 import signal
 import sys
 from traceback import format_exception
 import psutil
+
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    # the headless runner must not load any widget, so it's started before the gui imports below
+    from packages.Headless.HeadlessMuxing import run_headless
+
+    sys.exit(run_headless(sys.argv[1:]))
 from packages.Startup.MainApplication import MainApplication
 from packages.Startup import GlobalFiles
 from packages.Startup import GlobalIcons
@@ -19,6 +26,7 @@ if sys.platform == "win32":
     from packages.MainWindow import MainWindow
 else:
     from packages.MainWindowNonWindowsSystem import MainWindowNonWindowsSystem as MainWindow
+mark_startup_step("imports")
 
 # faulthandler.enable()
 window: MainWindow
@@ -86,4 +94,5 @@ if __name__ == "__main__":
     create_application()
     setup_application_font()
     create_window()
+    mark_startup_step("window shown")
     run_application()
@@ -0,0 +1,409 @@
+# Here we run a whole muxing batch from the command line, `main.py --headless --preset NAME --videos FOLDER ...`
+# the jobs are built from a saved preset and the given folders, then muxed by the same StartMuxingWorker the gui
+# uses, progress is printed to stdout as one json object per line, and no widget module is ever imported
+# with --validate the jobs are only checked by the ValidateQueueWorker and nothing is muxed or written
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import time
+import traceback
+from pathlib import Path
+from shutil import copy2
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer
+
+from packages.Startup import GlobalFiles
+from packages.Startup.Options import Options, read_option_file
+from packages.Tabs.FileMatching import get_matched_files_lists
+from packages.Tabs.FolderScan import get_folder_scan
+from packages.Tabs.GlobalSetting import GlobalSetting, get_files_names_absolute_list, \
+    get_readable_filesize, write_to_log_file
+from packages.Tabs.MuxSetting.Widgets.JobValidationResult import JobValidationResult
+from packages.Tabs.MuxSetting.Widgets.MuxPlan import create_mux_plan
+from packages.Tabs.MuxSetting.Widgets.MuxingJobs import create_muxing_jobs, calculate_size_after_muxing, \
+    delete_source_file_if_overwritten_enabled, rename_output_file_if_needed
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+from packages.Tabs.MuxSetting.Widgets.StartMuxingWorker import StartMuxingWorker, check_if_mkvpropedit_good
+from packages.Tabs.MuxSetting.Widgets.ValidateQueueWorker import ValidateQueueWorker
+from packages.Tabs.VideoTab.Widgets.GenerateMediaInfoFilesWorker import GenerateMediaInfoFilesWorker
+
+
+def print_event(event, **data):
+    data = {"event": event, **data}
+    sys.stdout.write(json.dumps(data, default=str) + "\n")
+    sys.stdout.flush()
+
+
+def setup_headless_logger():
+    logging.basicConfig(
+        format='(%(asctime)s): %(name)s [%(levelname)s]: %(message)s',
+        datefmt='%m/%d/%Y %I:%M:%S %p',
+        level=logging.DEBUG,
+        handlers=[
+            logging.FileHandler(filename=GlobalFiles.AppLogFilePath,
+                                encoding='utf-8', mode='a+'),
+        ]
+    )
+
+
+def get_headless_arguments(arguments):
+    parser = argparse.ArgumentParser(prog="main.py --headless",
+                                     description="Mux a batch of videos without the gui, using a saved preset")
+    parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
+    # read by StartupTiming before the arguments are parsed, it works the same with or without the gui
+    parser.add_argument("--profile-startup", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--preset", default="", help="preset name or number, the favorite preset by default")
+    parser.add_argument("--videos", default="", help="videos folder, the preset one by default")
+    parser.add_argument("--subtitles", action="append", default=[],
+                        help="subtitles folder, can be repeated, replaces the preset one")
+    parser.add_argument("--audios", action="append", default=[],
+                        help="audios folder, can be repeated, replaces the preset one")
+    parser.add_argument("--chapters", default="", help="chapters folder, the preset one by default")
+    parser.add_argument("--attachments", default="", help="attachments folder, the preset one by default")
+    parser.add_argument("--output", default="", help="destination folder, the preset one by default")
+    parser.add_argument("--overwrite-source", action="store_true", help="replace the source videos")
+    parser.add_argument("--use-mkvpropedit", action="store_true",
+                        help="modify the videos in place with mkvpropedit when possible")
+    parser.add_argument("--discard-old-attachments", action="store_true")
+    parser.add_argument("--discard-old-chapters", action="store_true")
+    parser.add_argument("--add-crc", action="store_true", help="add the crc of the output to its name")
+    parser.add_argument("--remove-old-crc", action="store_true", help="remove the old crc from the output name")
+    parser.add_argument("--abort-on-errors", action="store_true")
+    parser.add_argument("--keep-log-file", action="store_true", help="copy the muxing log to the destination")
+    parser.add_argument("--auto-match", action="store_true",
+                        help="match the subtitles, audios and chapters with the videos by season/episode and name "
+                             "instead of by their order")
+    parser.add_argument("--jobs", type=int, default=0, help="max concurrent jobs, the saved option by default")
+    parser.add_argument("--validate", action="store_true",
+                        help="only check the jobs and report their problems, without muxing or writing anything")
+    return parser.parse_args(arguments)
+
+
+def get_preset(preset_name):
+    if preset_name == "":
+        favorite_preset_id = Options.FavoritePresetId
+        if 0 <= favorite_preset_id < len(Options.DefaultPresets):
+            return Options.DefaultPresets[favorite_preset_id]
+        return Options.DefaultPresets[0]
+    for preset in Options.DefaultPresets:
+        if preset.Preset_Name == preset_name:
+            return preset
+    if preset_name.isdigit() and 1 <= int(preset_name) <= len(Options.DefaultPresets):
+        return Options.DefaultPresets[int(preset_name) - 1]
+    raise ValueError("No preset named \"" + preset_name + "\"")
+
+
+def get_files_list(folder_path, extensions):
+    if not os.path.isdir(folder_path):
+        raise ValueError("\"" + folder_path + "\" isn't a valid folder")
+    return get_folder_scan(folder_path).get_files_names(extensions or None)
+
+
+def get_unsupported_videos(videos_absolute_path_list):
+    unsupported_videos = []
+    generate_media_info_worker = GenerateMediaInfoFilesWorker(videos_absolute_path_list)
+    generate_media_info_worker.job_unsupported_file_signal.connect(unsupported_videos.append)
+    generate_media_info_worker.run()
+    return unsupported_videos
+
+
+def setup_videos(folder_path, extensions):
+    videos_names = get_files_list(folder_path, extensions)
+    videos_absolute_path_list = get_files_names_absolute_list(videos_names, folder_path)
+    unsupported_videos = get_unsupported_videos(videos_absolute_path_list)
+    for unsupported_video in unsupported_videos:
+        print_event("unsupported_video", video=unsupported_video)
+        index = videos_absolute_path_list.index(unsupported_video)
+        videos_names.pop(index)
+        videos_absolute_path_list.pop(index)
+    GlobalSetting.VIDEO_SOURCE_PATHS = [Path(folder_path)]
+    GlobalSetting.VIDEO_FILES_LIST = videos_names
+    GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST = videos_absolute_path_list
+    folder_scan = get_folder_scan(folder_path)
+    GlobalSetting.VIDEO_FILES_SIZE_LIST = [get_readable_filesize(folder_scan.get_file_size(video_name))
+                                           for video_name in videos_names]
+    GlobalSetting.VIDEO_SOURCE_MKV_ONLY = all(video_name.lower().endswith(".mkv") for video_name in videos_names)
+    GlobalSetting.VIDEO_TRACKS_INDEX.set_videos(videos_absolute_path_list)
+
+
+def setup_subtitles(folders_paths, preset):
+    for tab_index in range(len(folders_paths)):
+        files_names = get_files_list(folders_paths[tab_index], preset.Default_Subtitle_Extensions)
+        GlobalSetting.SUBTITLE_FILES_LIST[tab_index] = files_names
+        GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[tab_index] = get_files_names_absolute_list(
+            files_names, folders_paths[tab_index])
+        GlobalSetting.SUBTITLE_TRACK_NAME[tab_index] = ""
+        GlobalSetting.SUBTITLE_DELAY[tab_index] = 0.0
+        GlobalSetting.SUBTITLE_TAB_ENABLED[tab_index] = len(files_names) > 0
+        GlobalSetting.SUBTITLE_SET_DEFAULT[tab_index] = False
+        GlobalSetting.SUBTITLE_SET_FORCED[tab_index] = False
+        GlobalSetting.SUBTITLE_SET_ORDER[tab_index] = -1
+        GlobalSetting.SUBTITLE_LANGUAGE[tab_index] = preset.Default_Subtitle_Language
+    GlobalSetting.SUBTITLE_ENABLED = any(GlobalSetting.SUBTITLE_TAB_ENABLED.values())
+
+
+def setup_audios(folders_paths, preset):
+    for tab_index in range(len(folders_paths)):
+        files_names = get_files_list(folders_paths[tab_index], preset.Default_Audio_Extensions)
+        GlobalSetting.AUDIO_FILES_LIST[tab_index] = files_names
+        GlobalSetting.AUDIO_FILES_ABSOLUTE_PATH_LIST[tab_index] = get_files_names_absolute_list(
+            files_names, folders_paths[tab_index])
+        GlobalSetting.AUDIO_TRACK_NAME[tab_index] = ""
+        GlobalSetting.AUDIO_DELAY[tab_index] = 0.0
+        GlobalSetting.AUDIO_TAB_ENABLED[tab_index] = len(files_names) > 0
+        GlobalSetting.AUDIO_SET_DEFAULT[tab_index] = False
+        GlobalSetting.AUDIO_SET_FORCED[tab_index] = False
+        GlobalSetting.AUDIO_SET_ORDER[tab_index] = -1
+        GlobalSetting.AUDIO_LANGUAGE[tab_index] = preset.Default_Audio_Language
+    GlobalSetting.AUDIO_ENABLED = any(GlobalSetting.AUDIO_TAB_ENABLED.values())
+
+
+def setup_chapters(folder_path, preset):
+    if folder_path == "":
+        return
+    files_names = get_files_list(folder_path, preset.Default_Chapter_Extensions)
+    GlobalSetting.CHAPTER_FILES_LIST = files_names
+    GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST = get_files_names_absolute_list(files_names, folder_path)
+    GlobalSetting.CHAPTER_ENABLED = len(files_names) > 0
+
+
+# the lists without files are skipped, there's nothing to match or report for them
+def auto_match_files():
+    videos_paths = GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST
+    for tab_index in list(GlobalSetting.SUBTITLE_FILES_LIST.keys()):
+        if len(GlobalSetting.SUBTITLE_FILES_LIST[tab_index]) == 0:
+            continue
+        files_names, files_absolute_paths, matching_report, is_check_needed = get_matched_files_lists(
+            videos_paths, GlobalSetting.SUBTITLE_FILES_LIST[tab_index],
+            GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[tab_index])
+        GlobalSetting.SUBTITLE_FILES_LIST[tab_index] = files_names
+        GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[tab_index] = files_absolute_paths
+        print_event("files_matched", files="subtitles", tab=tab_index, check_needed=is_check_needed,
+                    report=matching_report)
+    for tab_index in list(GlobalSetting.AUDIO_FILES_LIST.keys()):
+        if len(GlobalSetting.AUDIO_FILES_LIST[tab_index]) == 0:
+            continue
+        files_names, files_absolute_paths, matching_report, is_check_needed = get_matched_files_lists(
+            videos_paths, GlobalSetting.AUDIO_FILES_LIST[tab_index],
+            GlobalSetting.AUDIO_FILES_ABSOLUTE_PATH_LIST[tab_index])
+        GlobalSetting.AUDIO_FILES_LIST[tab_index] = files_names
+        GlobalSetting.AUDIO_FILES_ABSOLUTE_PATH_LIST[tab_index] = files_absolute_paths
+        print_event("files_matched", files="audios", tab=tab_index, check_needed=is_check_needed,
+                    report=matching_report)
+    if len(GlobalSetting.CHAPTER_FILES_LIST) > 0:
+        files_names, files_absolute_paths, matching_report, is_check_needed = get_matched_files_lists(
+            videos_paths, GlobalSetting.CHAPTER_FILES_LIST, GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST)
+        GlobalSetting.CHAPTER_FILES_LIST = files_names
+        GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST = files_absolute_paths
+        print_event("files_matched", files="chapters", check_needed=is_check_needed, report=matching_report)
+
+
+def setup_attachments(folder_path):
+    if folder_path == "":
+        return
+    files_names = get_files_list(folder_path, None)
+    GlobalSetting.ATTACHMENT_FILES_LIST = files_names
+    GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST = get_files_names_absolute_list(files_names, folder_path)
+    GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST = [True] * len(files_names)
+    GlobalSetting.ATTACHMENT_ENABLED = len(files_names) > 0
+
+
+def setup_destination(destination_path, overwrite_source_files, create_folder=True):
+    GlobalSetting.OVERWRITE_SOURCE_FILES = False
+    if overwrite_source_files:
+        GlobalSetting.OVERWRITE_SOURCE_FILES = True
+        GlobalSetting.RANDOM_OUTPUT_SUFFIX = str(int(time.time()))
+        return
+    if destination_path == "" or destination_path.isspace():
+        raise ValueError("Enter a destination folder with --output, or use --overwrite-source")
+    if create_folder:
+        os.makedirs(destination_path, exist_ok=True)
+    if Path(destination_path) in GlobalSetting.VIDEO_SOURCE_PATHS:
+        raise ValueError("Source and destination videos are in the same folder")
+    GlobalSetting.DESTINATION_FOLDER_PATH = destination_path
+
+
+def setup_global_setting(arguments):
+    read_option_file(GlobalFiles.SettingJsonInfoFilePath)
+    preset = get_preset(arguments.preset)
+    Options.CurrentPreset = preset
+    if arguments.jobs > 0:
+        Options.Max_Concurrent_Jobs = arguments.jobs
+    setup_videos(arguments.videos or preset.Default_Video_Directory, preset.Default_Video_Extensions)
+    setup_subtitles(arguments.subtitles or [path for path in [preset.Default_Subtitle_Directory] if path != ""],
+                    preset)
+    setup_audios(arguments.audios or [path for path in [preset.Default_Audio_Directory] if path != ""], preset)
+    setup_chapters(arguments.chapters or preset.Default_Chapter_Directory, preset)
+    setup_attachments(arguments.attachments or preset.Default_Attachment_Directory)
+    if arguments.auto_match:
+        auto_match_files()
+    GlobalSetting.ATTACHMENT_DISCARD_OLD = arguments.discard_old_attachments
+    GlobalSetting.CHAPTER_DISCARD_OLD = arguments.discard_old_chapters
+    GlobalSetting.MUX_SETTING_ADD_CRC = arguments.add_crc
+    GlobalSetting.MUX_SETTING_REMOVE_OLD_CRC = arguments.add_crc or arguments.remove_old_crc
+    GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS = arguments.abort_on_errors
+    GlobalSetting.MUX_SETTING_KEEP_LOG_FILE = arguments.keep_log_file
+    GlobalSetting.USE_MKVPROPEDIT = arguments.use_mkvpropedit and check_if_mkvpropedit_good()
+    if not GlobalSetting.USE_MKVPROPEDIT:
+        setup_destination(arguments.output or preset.Default_Destination_Directory, arguments.overwrite_source,
+                          create_folder=not arguments.validate)
+
+
+def setup_log_file():
+    log_file_name = "muxing_log_file_" + time.strftime('%Y_%m_%d_%H_%M_%S', time.localtime()) + ".txt"
+    GlobalFiles.MuxingLogFilePath = os.path.join(GlobalFiles.MergeLogsFolderPath, log_file_name)
+    open(GlobalFiles.MuxingLogFilePath, 'w+').close()
+
+
+def print_job_validation(result: JobValidationResult):
+    print_event("job_validated", job=result.index, video=result.video_name, output=result.output_video_absolute_path,
+                errors=result.errors, warnings=result.warnings)
+
+
+def validate_queue(data):
+    validate_queue_worker = ValidateQueueWorker(data, create_mux_plan(), use_mkvpropedit=GlobalSetting.USE_MKVPROPEDIT)
+    validate_queue_worker.job_validated_signal.connect(print_job_validation)
+    validate_queue_worker.run()
+    results = validate_queue_worker.results
+    number_of_failed_jobs = len([result for result in results if len(result.errors) > 0])
+    print_event("queue_validated", jobs=len(results), failed=number_of_failed_jobs,
+                warned=len([result for result in results if len(result.errors) == 0 and len(result.warnings) > 0]),
+                mode=validate_queue_worker.validation_mode)
+    return 0 if number_of_failed_jobs == 0 and len(results) == len(data) else 1
+
+
+class HeadlessMuxing(QObject):
+    def __init__(self, data):
+        super().__init__()
+        self.data = data  # type: list[SingleJobData]
+        self.number_of_succeeded_jobs = 0
+        self.number_of_failed_jobs = 0
+        self.finish_status = ""
+        self.start_muxing_thread = QThread()
+        self.start_muxing_worker = StartMuxingWorker(self.data)
+        self.start_muxing_worker.moveToThread(self.start_muxing_thread)
+        self.start_muxing_thread.started.connect(self.start_muxing_worker.run)
+        self.start_muxing_worker.finished_all_jobs_signal.connect(self.finished_all_jobs)
+        self.start_muxing_worker.finished_paused_signal.connect(self.paused_done)
+        self.start_muxing_worker.cancel_signal.connect(self.cancel_done)
+        self.start_muxing_worker.progress_signal.connect(self.update_progress)
+        self.start_muxing_worker.crc_progress_signal.connect(self.update_crc_progress)
+        self.start_muxing_worker.job_started_signal.connect(self.new_job_started)
+        self.start_muxing_worker.job_succeeded_signal.connect(self.job_done_successfully)
+        self.start_muxing_worker.job_failed_signal.connect(self.job_error_occurred)
+
+    def start_muxing(self):
+        print_event("queue_started", jobs=len(self.data), max_concurrent_jobs=Options.Max_Concurrent_Jobs,
+                    use_mkvpropedit=GlobalSetting.USE_MKVPROPEDIT)
+        self.start_muxing_thread.start()
+
+    def cancel_muxing(self):
+        print_event("cancelling")
+        self.start_muxing_worker.cancel = True
+
+    def new_job_started(self, job_index):
+        print_event("job_started", job=job_index, video=self.data[job_index].video_name_absolute)
+
+    def update_progress(self, params: MuxingParams):
+        job = self.data[params.index]
+        if params.error:
+            job.done = True
+            job.error_occurred = True
+            job.muxing_message = params.message
+            return
+        if params.progress != job.progress:
+            job.progress = params.progress
+            print_event("progress", job=params.index, progress=params.progress)
+
+    def update_crc_progress(self, job_index, progress):
+        print_event("crc_progress", job=job_index, progress=progress)
+
+    def job_done_successfully(self, job_index):
+        job = self.data[job_index]
+        job.done = True
+        self.number_of_succeeded_jobs += 1
+        try:
+            delete_source_file_if_overwritten_enabled(job)
+            rename_output_file_if_needed(job)
+        except Exception as e:
+            write_to_log_file(traceback.format_exc())
+        print_event("job_succeeded", job=job_index, video=job.video_name_absolute,
+                    output=job.output_video_absolute_path, size=calculate_size_after_muxing(job), crc=job.new_crc)
+
+    def job_error_occurred(self, job_index):
+        job = self.data[job_index]
+        job.done = True
+        job.error_occurred = True
+        self.number_of_failed_jobs += 1
+        rename_output_file_if_needed(job)
+        if calculate_size_after_muxing(job) == 0:
+            try:
+                os.remove(job.output_video_absolute_path)
+            except Exception as e:
+                pass
+        print_event("job_failed", job=job_index, video=job.video_name_absolute, message=job.muxing_message)
+
+    def finished_all_jobs(self):
+        self.finish_muxing("done")
+
+    def paused_done(self):
+        self.finish_muxing("aborted")
+
+    def cancel_done(self):
+        self.finish_muxing("cancelled")
+
+    def finish_muxing(self, status):
+        self.finish_status = status
+        # the worker already asked its muxing and crc threads to quit, wait for them before the app exits
+        for thread in self.start_muxing_worker.start_muxing_process_threads + \
+                self.start_muxing_worker.start_crc_calculating_process_threads:
+            try:
+                thread.wait()
+            except RuntimeError:
+                pass  # already finished and deleted
+        self.start_muxing_thread.quit()
+        self.start_muxing_thread.wait()
+        if GlobalSetting.MUX_SETTING_KEEP_LOG_FILE and not GlobalSetting.OVERWRITE_SOURCE_FILES and \
+                not GlobalSetting.USE_MKVPROPEDIT:
+            try:
+                copy2(GlobalFiles.MuxingLogFilePath, GlobalSetting.DESTINATION_FOLDER_PATH)
+            except Exception as e:
+                write_to_log_file(e)
+        print_event("queue_finished", status=status, succeeded=self.number_of_succeeded_jobs,
+                    failed=self.number_of_failed_jobs, log_file=GlobalFiles.MuxingLogFilePath)
+        QCoreApplication.quit()
+
+
+def run_headless(arguments):
+    setup_headless_logger()
+    arguments = get_headless_arguments(arguments)
+    app = QCoreApplication(sys.argv[:1])
+    try:
+        GlobalFiles.detect_tools()
+        setup_global_setting(arguments)
+    except Exception as e:
+        write_to_log_file(traceback.format_exc())
+        print_event("error", message=str(e))
+        return 2
+    data = create_muxing_jobs()
+    if len(data) == 0:
+        print_event("error", message="No videos to mux")
+        return 2
+    if arguments.validate:
+        return validate_queue(data)
+    setup_log_file()
+    headless_muxing = HeadlessMuxing(data)
+    # python only handles ctrl+c while it runs, so wake it up every now and then from the qt event loop
+    signal.signal(signal.SIGINT, lambda signal_number, frame: headless_muxing.cancel_muxing())
+    wake_up_timer = QTimer()
+    wake_up_timer.timeout.connect(lambda: None)
+    wake_up_timer.start(250)
+    QTimer.singleShot(0, headless_muxing.start_muxing)
+    app.exec()
+    if headless_muxing.finish_status == "done" and headless_muxing.number_of_failed_jobs == 0:
+        return 0
+    return 1
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QFrame, QVBoxLayout
 
 from packages.Startup import GlobalIcons
 from packages.Startup.Options import Options, get_names_list_of_presets, save_options
+from packages.Startup.StartupTiming import profile_widget_construction
 from packages.Startup.InitializeScreenResolution import width_factor, height_factor
 from packages.Startup.Version import Version
 from packages.Tabs.GlobalSetting import GlobalSetting
@@ -40,7 +41,8 @@ class MainWindow(MyMainWindow):
         self.resize(int(width_factor * 1160), int(height_factor * 635))
         self.setWindowTitle("MKV Muxing Batch GUI v" + str(Version))
         self.setWindowIcon(GlobalIcons.AppIcon)
-        self.tabs = TabsManager()
+        with profile_widget_construction("TabsManager"):
+            self.tabs = TabsManager()
         self.tabs_frame = QFrame()
         self.tabs_layout = QVBoxLayout()
         self.setup_tabs_layout()
@@ -49,6 +51,7 @@ class MainWindow(MyMainWindow):
         self.update_theme()
         Options.CurrentPreset = Options.DefaultPresets[Options.FavoritePresetId]
         self.show_window()
+        self.tabs.start_tools_detection()
         self.update_theme()
         self.check_if_need_to_show_choose_preset_dialog(parent=self.window())
         self.tabs.set_preset_options()
@@ -5,6 +5,7 @@ from PySide6.QtWidgets import QFrame, QVBoxLayout
 from packages.Startup import GlobalIcons
 from packages.Startup.InitializeScreenResolution import width_factor, height_factor
 from packages.Startup.Options import Options, save_options, get_names_list_of_presets
+from packages.Startup.StartupTiming import profile_widget_construction
 from packages.Startup.Version import Version
 from packages.Tabs.GlobalSetting import GlobalSetting
 from packages.Tabs.TabsManager import TabsManager
@@ -32,13 +33,15 @@ class MainWindowNonWindowsSystem(MyMainWindow):
         self.resize(int(width_factor * 1100), int(height_factor * 635))
         self.setWindowTitle("MKV Muxing Batch GUI v" + str(Version))
         self.setWindowIcon(GlobalIcons.AppIcon)
-        self.tabs = TabsManager()
+        with profile_widget_construction("TabsManager"):
+            self.tabs = TabsManager()
         self.tabs_frame = QFrame()
         self.tabs_layout = QVBoxLayout()
         self.setup_tabs_layout()
         self.setCentralWidget(self.tabs_frame)
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         self.show_window()
+        self.tabs.start_tools_detection()
         self.check_if_need_to_show_choose_preset_dialog(parent=self.window())
         self.tabs.set_preset_options()
         self.connect_signals()
@@ -1,13 +1,17 @@
+import atexit
+import json
 import logging
 import os
+import shutil
 import struct
 import subprocess
 import sys
+import threading
+import time
+import uuid
 from os import listdir
 from pathlib import Path
 
-from packages.Widgets.MissingFilesMessage import MissingFilesMessage
-
 
 def create_app_data_folder():
     """
@@ -50,6 +54,9 @@ def get_files_names_absolute_list(files_names, folder_path):
 
 
 def delete_old_media_files():
+    # media info is kept in MediaInfoCacheFilePath now, older versions left one json file per video here
+    if not os.path.isdir(MediaInfoFolderPath):
+        return
     only_media_info_files = get_files_names_absolute_list(files_names=listdir(MediaInfoFolderPath),
                                                           folder_path=MediaInfoFolderPath)
     for file_name in only_media_info_files:
@@ -57,6 +64,61 @@ def delete_old_media_files():
             os.remove(file_name)
         except Exception as e:
             pass
+    try:
+        os.rmdir(MediaInfoFolderPath)
+    except Exception as e:
+        pass
+
+
+# every running instance, gui or headless, keeps its job files in its own folder under Jobs, named by its process id
+# and a random suffix, so it never touches the files of a batch another instance is muxing
+def get_muxing_jobs_folder_path():
+    return os.path.join(MuxingJobsRootFolderPath, str(os.getpid()) + "_" + uuid.uuid4().hex[:8])
+
+
+def delete_muxing_job_files():
+    shutil.rmtree(MuxingJobsFolderPath, ignore_errors=True)
+
+
+def is_process_running(process_id):
+    if sys.platform == "win32":
+        import ctypes
+        process_query_limited_information = 0x1000
+        still_active = 259
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        process_handle = kernel32.OpenProcess(process_query_limited_information, False, process_id)
+        if not process_handle:
+            # access denied means the process exists but belongs to another user
+            return ctypes.get_last_error() == 5
+        exit_code = ctypes.c_ulong()
+        try:
+            if not kernel32.GetExitCodeProcess(process_handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == still_active
+        finally:
+            kernel32.CloseHandle(process_handle)
+    try:
+        os.kill(process_id, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def delete_orphan_muxing_jobs_folders():
+    # an instance that crashed or got killed never ran its atexit cleanup, so its job folder is removed here
+    # once its process id isn't running anymore
+    if not os.path.isdir(MuxingJobsRootFolderPath):
+        return
+    for folder_name in listdir(MuxingJobsRootFolderPath):
+        process_id = folder_name.split("_", 1)[0]
+        if not process_id.isdigit() or int(process_id) == os.getpid():
+            continue
+        if not is_process_running(int(process_id)):
+            shutil.rmtree(os.path.join(MuxingJobsRootFolderPath, folder_name), ignore_errors=True)
 
 
 script_path = sys.argv[0]  # get path of the this file
@@ -82,31 +144,128 @@ else:
 AppDataFolderPath = create_app_data_folder()
 MergeLogsFolderPath = os.path.join(os.path.abspath(AppDataFolderPath), Path('Logs'))
 MediaInfoFolderPath = os.path.join(os.path.abspath(AppDataFolderPath), Path('MediaInfo'))
+MediaInfoCacheFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "media_info_cache.db")
+MuxingJobsRootFolderPath = os.path.join(os.path.abspath(AppDataFolderPath), Path('Jobs'))
+MuxingJobsFolderPath = get_muxing_jobs_folder_path()
 os.makedirs(MergeLogsFolderPath, exist_ok=True)
-os.makedirs(MediaInfoFolderPath, exist_ok=True)
+delete_orphan_muxing_jobs_folders()
+os.makedirs(MuxingJobsFolderPath, exist_ok=True)
 delete_old_media_files()
+atexit.register(delete_muxing_job_files)
 
 
-def get_mkvmerge_version():
-    with open(TestMkvmergeFilePath, "w+", encoding="UTF-8") as test_file:
-        try:
-            command = add_double_quotation(MKVMERGE_PATH) + " -V"
-            mux_process = subprocess.run(command, shell=True, stdout=test_file, env=ENVIRONMENT)
-        except:
-            return ""
-    with open(TestMkvmergeFilePath, "r+", encoding="UTF-8") as test_file:
-        return test_file.readline().rstrip()
+def get_tool_version(tool_path):
+    try:
+        command = add_double_quotation(tool_path) + " -V"
+        version_process = subprocess.run(command, shell=True, stdout=subprocess.PIPE, env=ENVIRONMENT)
+    except:
+        return ""
+    output_lines = version_process.stdout.decode("UTF-8", errors="replace").splitlines()
+    if len(output_lines) == 0:
+        return ""
+    return output_lines[0].rstrip()
+
+
+def get_tool_absolute_path(tool_path):
+    tool_absolute_path = shutil.which(tool_path, path=ENVIRONMENT.get("PATH"))
+    if tool_absolute_path is None:
+        return ""
+    return os.path.abspath(tool_absolute_path)
+
+
+def read_tools_cache():
+    try:
+        with open(ToolsCacheFilePath, "r", encoding="UTF-8") as tools_cache_file:
+            return json.load(tools_cache_file)
+    except Exception as e:
+        return {}
 
 
-def get_mkvpropedit_version():
-    with open(TestMkvpropeditFilePath, "w+", encoding="UTF-8") as test_file:
+def write_tools_cache(tools_cache):
+    try:
+        with open(ToolsCacheFilePath, "w+", encoding="UTF-8") as tools_cache_file:
+            json.dump(tools_cache, tools_cache_file, indent=4)
+    except Exception as e:
+        logging.error(e)
+
+
+def get_cached_tool_version(tool_path, tool_name, tools_cache):
+    # the version of a binary only changes with the binary itself, so it's kept by path, size and modification time
+    global ToolsVersionChecksCount
+    tool_absolute_path = get_tool_absolute_path(tool_path)
+    if tool_absolute_path == "":
+        return ""
+    tool_stat = os.stat(tool_absolute_path)
+    cached_tool = tools_cache.get(tool_absolute_path, {})
+    if cached_tool.get("file_size") == tool_stat.st_size and \
+            cached_tool.get("modified_time") == tool_stat.st_mtime_ns and tool_name in cached_tool.get("version", ""):
+        return cached_tool["version"]
+    ToolsVersionChecksCount += 1
+    tool_version = get_tool_version(tool_absolute_path)
+    if tool_name in tool_version:
+        tools_cache[tool_absolute_path] = {
+            "file_size": tool_stat.st_size,
+            "modified_time": tool_stat.st_mtime_ns,
+            "version": tool_version,
+        }
+    return tool_version
+
+
+def detect_tool(portable_tool_path, tool_name, tools_cache):
+    tool_version = get_cached_tool_version(portable_tool_path, tool_name, tools_cache)
+    if tool_name in tool_version:
+        logging.info(tool_name + " OK")
+        return portable_tool_path, tool_version
+    logging.warning("Could not use portable " + tool_name + ". Trying system version...")
+    tool_version = get_cached_tool_version(tool_name, tool_name, tools_cache)
+    if tool_name in tool_version:
+        logging.info(tool_name + " OK")
+        return tool_name, tool_version
+    raise Exception(tool_name + " file! ")
+
+
+def detect_tools():
+    global MKVMERGE_PATH, MKVMERGE_VERSION, MKVPROPEDIT_PATH, MKVPROPEDIT_VERSION
+    global ToolsDetected, ToolsVersionChecksCount, ToolsDetectionTime
+    detection_start_time = time.perf_counter()
+    ToolsVersionChecksCount = 0
+    tools_cache = read_tools_cache()
+    old_tools_cache = json.dumps(tools_cache, sort_keys=True)
+    try:
+        try:
+            MKVMERGE_PATH, MKVMERGE_VERSION = detect_tool(MKVMERGE_PATH, "mkvmerge", tools_cache)
+        except Exception as e:
+            MKVMERGE_VERSION = "mkvmerge: not found!"
+            raise e
         try:
-            command = add_double_quotation(MKVPROPEDIT_PATH) + " -V"
-            mux_process = subprocess.run(command, shell=True, stdout=test_file, env=ENVIRONMENT)
-        except:
-            return ""
-    with open(TestMkvpropeditFilePath, "r+", encoding="UTF-8") as test_file:
-        return test_file.readline().rstrip()
+            MKVPROPEDIT_PATH, MKVPROPEDIT_VERSION = detect_tool(MKVPROPEDIT_PATH, "mkvpropedit", tools_cache)
+        except Exception as e:
+            MKVPROPEDIT_VERSION = "mkvpropedit: not found!"
+            raise e
+        ToolsDetected = True
+    finally:
+        if json.dumps(tools_cache, sort_keys=True) != old_tools_cache:
+            write_tools_cache(tools_cache)
+        ToolsDetectionTime = time.perf_counter() - detection_start_time
+        tools_detected_event.set()
+
+
+# a binary broken or replaced in place can keep its size and modification time, so when a tool fails to start its
+# version is checked again, and its cache entry is dropped if it doesn't answer anymore
+def recheck_tool_version(tool_path, tool_name):
+    if tool_name in get_tool_version(tool_path):
+        return True
+    logging.error(tool_name + " doesn't start anymore: " + tool_path)
+    tool_absolute_path = get_tool_absolute_path(tool_path)
+    with tools_cache_lock:
+        tools_cache = read_tools_cache()
+        if tools_cache.pop(tool_absolute_path, None) is not None:
+            write_tools_cache(tools_cache)
+    return False
+
+
+def wait_for_tools_detection():
+    tools_detected_event.wait()
 
 
 def update_enviro_if_not_windows():
@@ -175,42 +334,23 @@ try:
     LanguagesFilePath = os.path.join(os.path.abspath(LanguagesFolderPath), "iso639_language_list.json")
     AppLogFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "app_log.txt")
     MuxingLogFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "muxing_log_file.txt")
-    TestMkvmergeFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "test_mkvmerge.txt")
-    TestMkvpropeditFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "test_mkvpropedit.txt")
     mkvpropeditJsonJobFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "mkvpropeditJob.json")
     mkvmergeJsonJobFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "MkvmergeJob.json")
-    mkvmergeJsonInfoFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "MkvmergeInfo.json")
     SettingJsonInfoFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "setting.json")
     TaskBarLibFilePath = os.path.join(os.path.abspath(DLLFolderPath), "TaskbarLib.tlb")
     MKVPROPEDIT_PATH = os.path.join(os.path.abspath(ToolsFolderPath), "mkvpropedit")
     MKVMERGE_PATH = os.path.join(os.path.abspath(ToolsFolderPath), "mkvmerge")
+    ToolsCacheFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "tools_cache.json")
+    StartupProfileFilePath = os.path.join(os.path.abspath(AppDataFolderPath), "startup_profile.txt")
     ENVIRONMENT = os.environ.copy()
     update_enviro_if_not_windows()
-    MKVPROPEDIT_VERSION = get_mkvpropedit_version()
-    MKVMERGE_VERSION = get_mkvmerge_version()
-    if "mkvmerge" not in MKVMERGE_VERSION:
-        logging.warning("Could not use portable mkvmerge. Trying system version...")
-        MKVMERGE_PATH = "mkvmerge"
-        MKVMERGE_VERSION = get_mkvmerge_version()
-        if "mkvmerge" not in MKVMERGE_VERSION:
-            MKVMERGE_VERSION = "mkvmerge: not found!"
-            raise Exception("mkvmerge file! ")
-        else:
-            logging.info("mkvmerge OK")
-    else:
-        logging.info("mkvmerge OK")
-    if "mkvpropedit" not in MKVPROPEDIT_VERSION:
-        logging.warning("Could not use portable mkvpropedit. Trying system version...")
-        MKVPROPEDIT_PATH = "mkvpropedit"
-        MKVPROPEDIT_VERSION = get_mkvpropedit_version()
-        if "mkvpropedit" not in MKVPROPEDIT_VERSION:
-            MKVPROPEDIT_VERSION = "mkvpropedit: not found!"
-            raise Exception("mkvpropedit file! ")
-        else:
-            logging.info("mkvpropedit OK")
-    else:
-        logging.info("mkvpropedit OK")
 except Exception as e:
     logging.error(e)
-    missing_files_message = MissingFilesMessage(error_message=str(e))
-    missing_files_message.execute()
+# mkvmerge and mkvpropedit are found by detect_tools(), the gui runs it in the background once the window shows
+MKVPROPEDIT_VERSION = ""
+MKVMERGE_VERSION = ""
+ToolsDetected = False
+ToolsVersionChecksCount = 0  # tools that had to be run to get their version, the others came from the cache
+ToolsDetectionTime = 0.0
+tools_detected_event = threading.Event()
+tools_cache_lock = threading.Lock()
@@ -1,3 +1,4 @@
+# Icons are loaded from disk the first time they are used, not when this module is imported
 from PySide6.QtGui import QIcon, QPixmap
 
 from packages.Startup.GlobalFiles import OkIconPath, ErrorIconPath, ErrorBigIconPath, SubtitleLightIconPath, \
@@ -11,49 +12,61 @@ from packages.Startup.GlobalFiles import OkIconPath, ErrorIconPath, ErrorBigIcon
     EmptyIconPath, TrueCheckIconPath, PresetLightIconPath, PresetDarkIconPath, SelectedItemIconPath, \
     UnSelectedItemIconPath
 
-OkIcon = QIcon(QPixmap(OkIconPath))
-EmptyIcon = QIcon(QPixmap(EmptyIconPath))
-TrueCheckIcon = QIcon(QPixmap(TrueCheckIconPath))
-PresetLightIcon = QIcon(QPixmap(PresetLightIconPath))
-PresetDarkIcon = QIcon(QPixmap(PresetDarkIconPath))
-SelectedItemIcon = QIcon(QPixmap(SelectedItemIconPath))
-UnSelectedItemIcon = QIcon(QPixmap(UnSelectedItemIconPath))
-ErrorIcon = QIcon(QPixmap(ErrorIconPath))
-ErrorBigIcon = QIcon(QPixmap(ErrorBigIconPath))
-SubtitleLightIcon = QIcon(QPixmap(SubtitleLightIconPath))
-SubtitleDarkIcon = QIcon(QPixmap(SubtitleDarkIconPath))
-SwitchIcon = QIcon(QPixmap(SwitchIconPath))
-RefreshIcon = QIcon(QPixmap(RefreshIconPath))
-QuestionIcon = QIcon(QPixmap(QuestionIconPath))
-NoMarkIcon = QIcon(QPixmap(NoMarkIconPath))
-PlusIcon = QIcon(QPixmap(PlusIconPath))
-TrashLightIcon = QIcon(QPixmap(TrashLightIconPath))
-TrashDarkIcon = QIcon(QPixmap(TrashDarkIconPath))
-RenameIcon = QIcon(QPixmap(RenameIconPath))
-RedDashIcon = QIcon(QPixmap(RedDashIconPath))
-InfoIcon = QIcon(QPixmap(InfoIconPath))
-AboutIcon = QIcon(QPixmap(AboutIconPath))
-InfoSettingIcon = QIcon(QPixmap(InfoSettingIconPath))
-WarningCheckBigIcon = QIcon(QPixmap(WarningCheckBigIconPath))
-WarningCheckIcon = QIcon(QPixmap(WarningCheckIconPath))
-StartMultiplexingIcon = QIcon(QPixmap(StartMultiplexingIconPath))
-PauseMultiplexingIcon = QIcon(QPixmap(PauseMultiplexingIconPath))
-AddToQueueIcon = QIcon(QPixmap(AddToQueueIconPath))
-CleanIcon = QIcon(QPixmap(ClearIconPath))
-TopLightIcon = QIcon(QPixmap(TopLightIconPath))
-DownLightIcon = QIcon(QPixmap(DownLightIconPath))
-UpLightIcon = QIcon(QPixmap(UpLightIconPath))
-BottomLightIcon = QIcon(QPixmap(BottomLightIconPath))
-TopDarkIcon = QIcon(QPixmap(TopDarkIconPath))
-DownDarkIcon = QIcon(QPixmap(DownDarkIconPath))
-UpDarkIcon = QIcon(QPixmap(UpDarkIconPath))
-BottomDarkIcon = QIcon(QPixmap(BottomDarkIconPath))
-SelectFolderIcon = QIcon(QPixmap(FolderIconPath))
-SettingIcon = QIcon(QPixmap(SettingIconPath))
-TelegramIcon = QIcon(QPixmap(TelegramIconPath))
-TwitterIcon = QIcon(QPixmap(TwitterIconPath))
-LeftArrowIcon = QIcon(QPixmap(LeftArrowIconPath))
-RightArrowIcon = QIcon(QPixmap(RightArrowIconPath))
-DonationsIcon = QIcon(QPixmap(DonationsIconPath))
-ThemeIcon = QIcon(QPixmap(ThemeIconPath))
-AppIcon = QIcon(QPixmap(AppIconPath))
+ICONS_PATHS = {
+    "OkIcon": OkIconPath,
+    "EmptyIcon": EmptyIconPath,
+    "TrueCheckIcon": TrueCheckIconPath,
+    "PresetLightIcon": PresetLightIconPath,
+    "PresetDarkIcon": PresetDarkIconPath,
+    "SelectedItemIcon": SelectedItemIconPath,
+    "UnSelectedItemIcon": UnSelectedItemIconPath,
+    "ErrorIcon": ErrorIconPath,
+    "ErrorBigIcon": ErrorBigIconPath,
+    "SubtitleLightIcon": SubtitleLightIconPath,
+    "SubtitleDarkIcon": SubtitleDarkIconPath,
+    "SwitchIcon": SwitchIconPath,
+    "RefreshIcon": RefreshIconPath,
+    "QuestionIcon": QuestionIconPath,
+    "NoMarkIcon": NoMarkIconPath,
+    "PlusIcon": PlusIconPath,
+    "TrashLightIcon": TrashLightIconPath,
+    "TrashDarkIcon": TrashDarkIconPath,
+    "RenameIcon": RenameIconPath,
+    "RedDashIcon": RedDashIconPath,
+    "InfoIcon": InfoIconPath,
+    "AboutIcon": AboutIconPath,
+    "InfoSettingIcon": InfoSettingIconPath,
+    "WarningCheckBigIcon": WarningCheckBigIconPath,
+    "WarningCheckIcon": WarningCheckIconPath,
+    "StartMultiplexingIcon": StartMultiplexingIconPath,
+    "PauseMultiplexingIcon": PauseMultiplexingIconPath,
+    "AddToQueueIcon": AddToQueueIconPath,
+    "CleanIcon": ClearIconPath,
+    "TopLightIcon": TopLightIconPath,
+    "DownLightIcon": DownLightIconPath,
+    "UpLightIcon": UpLightIconPath,
+    "BottomLightIcon": BottomLightIconPath,
+    "TopDarkIcon": TopDarkIconPath,
+    "DownDarkIcon": DownDarkIconPath,
+    "UpDarkIcon": UpDarkIconPath,
+    "BottomDarkIcon": BottomDarkIconPath,
+    "SelectFolderIcon": FolderIconPath,
+    "SettingIcon": SettingIconPath,
+    "TelegramIcon": TelegramIconPath,
+    "TwitterIcon": TwitterIconPath,
+    "LeftArrowIcon": LeftArrowIconPath,
+    "RightArrowIcon": RightArrowIconPath,
+    "DonationsIcon": DonationsIconPath,
+    "ThemeIcon": ThemeIconPath,
+    "AppIcon": AppIconPath,
+}
+loaded_icons = {}  # icon name -> QIcon
+
+
+def __getattr__(name):
+    icon_path = ICONS_PATHS.get(name)
+    if icon_path is None:
+        raise AttributeError("module " + __name__ + " has no attribute " + name)
+    if name not in loaded_icons:
+        loaded_icons[name] = QIcon(QPixmap(icon_path))
+    return loaded_icons[name]
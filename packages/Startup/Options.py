@@ -1,6 +1,5 @@
 import json
 from pathlib import Path
-from PySide6.QtWidgets import QWidget
 from packages.Startup.GlobalFiles import SettingJsonInfoFilePath
 from packages.Widgets.SingleDefaultPresetsData import SingleDefaultPresetsData
 
@@ -19,13 +18,20 @@ def get_names_list_of_presets():
     return names_list
 
 
-class Options(QWidget):
+class Options:
     DefaultPresets = [SingleDefaultPresetsData()]
     CurrentPreset = SingleDefaultPresetsData()
     FavoritePresetId = 0
     Dark_Mode = False
     Attachment_Expert_Mode_Info_Message_Show = True
     Choose_Preset_On_Startup = False
+    Max_Concurrent_Jobs = 1
+    Inline_CRC = False
+    Pregenerate_Job_Files = True
+    Max_Concurrent_Probes = 8
+    Keep_Media_Info_Cache = True
+    Watch_Source_Folders = False
+    Subfolders_Depth = 0
 
 
 def save_options():
@@ -59,7 +65,14 @@ def save_options():
         "FavoritePresetId": Options.FavoritePresetId,
         "Dark_Mode": Options.Dark_Mode,
         "Attachment_Expert_Mode_Info_Message_Show": Options.Attachment_Expert_Mode_Info_Message_Show,
-        "Choose_Preset_On_Startup": Options.Choose_Preset_On_Startup
+        "Choose_Preset_On_Startup": Options.Choose_Preset_On_Startup,
+        "Max_Concurrent_Jobs": Options.Max_Concurrent_Jobs,
+        "Inline_CRC": Options.Inline_CRC,
+        "Pregenerate_Job_Files": Options.Pregenerate_Job_Files,
+        "Max_Concurrent_Probes": Options.Max_Concurrent_Probes,
+        "Keep_Media_Info_Cache": Options.Keep_Media_Info_Cache,
+        "Watch_Source_Folders": Options.Watch_Source_Folders,
+        "Subfolders_Depth": Options.Subfolders_Depth
     }
     options_file_path = Path(SettingJsonInfoFilePath)
     with open(options_file_path, "w+", encoding="UTF-8") as option_file:
@@ -136,4 +149,20 @@ def read_option_file(option_file):
             Options.Choose_Preset_On_Startup = get_data_from_json(json_data=data,
                                                                   attribute="Choose_Preset_On_Startup",
                                                                   default_value=False)
+            Options.Max_Concurrent_Jobs = get_data_from_json(json_data=data,
+                                                             attribute="Max_Concurrent_Jobs",
+                                                             default_value=1)
+            Options.Inline_CRC = get_data_from_json(json_data=data, attribute="Inline_CRC", default_value=False)
+            Options.Pregenerate_Job_Files = get_data_from_json(json_data=data, attribute="Pregenerate_Job_Files",
+                                                               default_value=True)
+            Options.Max_Concurrent_Probes = get_data_from_json(json_data=data,
+                                                               attribute="Max_Concurrent_Probes",
+                                                               default_value=8)
+            Options.Keep_Media_Info_Cache = get_data_from_json(json_data=data,
+                                                               attribute="Keep_Media_Info_Cache",
+                                                               default_value=True)
+            Options.Watch_Source_Folders = get_data_from_json(json_data=data,
+                                                              attribute="Watch_Source_Folders",
+                                                              default_value=False)
+            Options.Subfolders_Depth = get_data_from_json(json_data=data, attribute="Subfolders_Depth", default_value=0)
     save_options()
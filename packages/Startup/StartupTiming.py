@@ -0,0 +1,121 @@
+# Here we note how long each startup step took since the app started, main.py imports it first
+# Run with --profile-startup (or MKV_MUXING_BATCH_GUI_PROFILE_STARTUP=1) to also time every imported module and
+# the main widgets construction, the report is written to GlobalFiles.StartupProfileFilePath
+import importlib.machinery
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+startup_start_time = time.perf_counter()
+startup_steps = []  # [(step name, seconds since start)]
+StartupProfilingEnabled = "--profile-startup" in sys.argv[1:] or \
+                          os.environ.get("MKV_MUXING_BATCH_GUI_PROFILE_STARTUP", "") not in ["", "0"]
+modules_import_times = []  # [(module name, self seconds, total seconds)]
+widgets_construction_times = []  # [(widget name, seconds)]
+# module loaders that are created for one module only, so we can safely wrap their exec_module
+TIMED_LOADERS_TYPES = (importlib.machinery.SourceFileLoader, importlib.machinery.SourcelessFileLoader,
+                       importlib.machinery.ExtensionFileLoader)
+
+
+class ImportTimeProfiler:
+    def __init__(self):
+        self.children_times = []  # time spent importing children, for each module being imported right now
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if isinstance(spec.loader, TIMED_LOADERS_TYPES):
+                    spec.loader.exec_module = self.get_timed_exec_module(fullname, spec.loader.exec_module)
+                return spec
+        return None
+
+    def get_timed_exec_module(self, module_name, exec_module):
+        def timed_exec_module(module):
+            if threading.current_thread() is not threading.main_thread():
+                return exec_module(module)
+            start_time = time.perf_counter()
+            self.children_times.append(0.0)
+            try:
+                exec_module(module)
+            finally:
+                total_time = time.perf_counter() - start_time
+                children_time = self.children_times.pop()
+                if len(self.children_times) > 0:
+                    self.children_times[-1] += total_time
+                modules_import_times.append((module_name, total_time - children_time, total_time))
+
+        return timed_exec_module
+
+
+import_time_profiler = ImportTimeProfiler()
+if StartupProfilingEnabled:
+    sys.meta_path.insert(0, import_time_profiler)
+
+
+def mark_startup_step(step_name):
+    startup_steps.append((step_name, time.perf_counter() - startup_start_time))
+
+
+@contextmanager
+def profile_widget_construction(widget_name):
+    if not StartupProfilingEnabled:
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        widgets_construction_times.append((widget_name, time.perf_counter() - start_time))
+
+
+def get_milliseconds_text(seconds):
+    return str(round(seconds * 1000, 1)) + " ms"
+
+
+def get_startup_timing_report():
+    return ", ".join(step_name + " " + str(int(step_time * 1000)) + " ms" for step_name, step_time in startup_steps)
+
+
+def get_startup_profile_report():
+    lines = ["Startup steps:"]
+    for step_name, step_time in startup_steps:
+        lines.append("  " + step_name.ljust(40) + get_milliseconds_text(step_time))
+    lines.append("")
+    lines.append("Widgets construction (includes their children):")
+    for widget_name, widget_time in widgets_construction_times:
+        lines.append("  " + widget_name.ljust(40) + get_milliseconds_text(widget_time))
+    lines.append("")
+    lines.append("Modules import (" + str(len(modules_import_times)) + " modules, slowest first):")
+    lines.append("  " + "module".ljust(60) + "self".rjust(12) + "total".rjust(12))
+    for module_name, self_time, total_time in sorted(modules_import_times, key=lambda x: x[1], reverse=True):
+        lines.append("  " + module_name.ljust(60) + get_milliseconds_text(self_time).rjust(12) +
+                     get_milliseconds_text(total_time).rjust(12))
+    return "\n".join(lines) + "\n"
+
+
+def write_startup_profile_report():
+    from packages.Startup.GlobalFiles import StartupProfileFilePath
+
+    if import_time_profiler in sys.meta_path:
+        sys.meta_path.remove(import_time_profiler)
+    with open(StartupProfileFilePath, "w", encoding="UTF-8") as report_file:
+        report_file.write(get_startup_profile_report())
+    return StartupProfileFilePath
+
+
+def log_startup_timing_report(extra_info=""):
+    report = "Startup timing: " + get_startup_timing_report()
+    if extra_info != "":
+        report += " | " + extra_info
+    logging.info(report)
+    if StartupProfilingEnabled:
+        try:
+            logging.info("Startup profile written to " + write_startup_profile_report())
+        except Exception as e:
+            logging.error("Can't write the startup profile: " + str(e))
\ No newline at end of file
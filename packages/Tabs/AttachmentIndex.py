@@ -0,0 +1,69 @@
+# Here we pick the files each job really needs to attach, fonts with the same name as an attachment already in the
+# video are skipped like before, and byte identical files under different names or folders are only attached once
+# the content hash of a file is only needed when another file of the job has the same size, it's computed once for the
+# whole session and kept by the file path, validated against the file size and modification time
+import hashlib
+import os
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+attachments_hashes = {}  # normalized file path -> (file size, st_mtime_ns, content hash)
+
+
+def get_attachment_key(file_path):
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+def get_file_stat(file_path):
+    try:
+        file_stat = os.stat(file_path)
+        return file_stat.st_size, file_stat.st_mtime_ns
+    except OSError:
+        return -1, -1
+
+
+def get_attachment_hash(file_path, file_size, file_modified_time):
+    key = get_attachment_key(file_path)
+    cached_hash = attachments_hashes.get(key)
+    if cached_hash is not None and cached_hash[0] == file_size and cached_hash[1] == file_modified_time:
+        return cached_hash[2]
+    content_hash = hashlib.blake2b(digest_size=16)
+    try:
+        with open(file_path, "rb") as attachment_file:
+            for chunk in iter(lambda: attachment_file.read(HASH_CHUNK_SIZE), b""):
+                content_hash.update(chunk)
+    except OSError:
+        return None
+    attachments_hashes[key] = (file_size, file_modified_time, content_hash.digest())
+    return content_hash.digest()
+
+
+# existing_attachments_names are the names of the attachments already in the video, they are ignored when the old
+# attachments are discarded
+def get_attachments_to_add(files_to_attach, existing_attachments_names, discard_old, allow_duplicates):
+    if allow_duplicates:
+        return list(files_to_attach)
+    existing_attachments_names = set() if discard_old else set(existing_attachments_names)
+    files_by_size = {}  # file size -> [(file path, modification time)] of the files that will be attached
+    added_hashes = {}  # file size -> content hashes of these files, only filled once two files share a size
+    result = []
+    for file_to_attach in files_to_attach:
+        if os.path.basename(file_to_attach) in existing_attachments_names:
+            continue
+        file_size, file_modified_time = get_file_stat(file_to_attach)
+        if file_size == -1:
+            # let mkvmerge report the missing file
+            result.append(file_to_attach)
+            continue
+        same_size_files = files_by_size.setdefault(file_size, [])
+        if len(same_size_files) > 0:
+            if file_size not in added_hashes:
+                added_hashes[file_size] = {get_attachment_hash(file_path, file_size, modified_time)
+                                           for file_path, modified_time in same_size_files}
+            content_hash = get_attachment_hash(file_to_attach, file_size, file_modified_time)
+            if content_hash is not None and content_hash in added_hashes[file_size]:
+                continue
+            added_hashes[file_size].add(content_hash)
+        same_size_files.append((file_to_attach, file_modified_time))
+        result.append(file_to_attach)
+    return result
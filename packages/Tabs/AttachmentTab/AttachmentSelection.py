@@ -1,5 +1,5 @@
 from PySide6.QtCore import Signal
-from PySide6.QtWidgets import QVBoxLayout, QGroupBox
+from PySide6.QtWidgets import QVBoxLayout, QGroupBox, QWidget
 
 from packages.Startup.Options import Options
 from packages.Tabs.AttachmentTab.Widgets.AllowDuplicateAttachmentsCheckBox import AllowDuplicateAttachmentsCheckBox
@@ -12,19 +12,21 @@ from packages.Tabs.AttachmentTab.Widgets.DiscardOldAttachmentsCheckBox import Di
 from packages.Tabs.AttachmentTab.Widgets.ExpertModeCheckBox import ExpertModeCheckBox
 from packages.Tabs.AttachmentTab.Widgets.MatchAttachmentWidget import MatchAttachmentWidget
 from packages.Widgets.RefreshFilesButton import RefreshFilesButton
+from packages.Tabs.FolderScan import get_cached_file_size, get_folder_scan, forget_folder_scan
+from packages.Tabs.FolderWatcher import add_new_files_names, get_folder_watcher, get_watched_folder_changes, \
+    is_same_folder
 from packages.Tabs.GlobalSetting import *
-from packages.Tabs.GlobalSetting import sort_names_like_windows, get_readable_filesize, get_files_names_absolute_list, \
-    get_file_name_absolute_path
+from packages.Tabs.GlobalSetting import sort_names_like_windows, get_readable_filesize, get_files_names_absolute_list
 from packages.Widgets.InvalidPathDialog import *
 # noinspection PyAttributeOutsideInit
 from packages.Widgets.WarningDialog import WarningDialog
 
 
 def get_files_size_list(files_list, folder_path):
+    folder_scan = get_folder_scan(folder_path)
     files_size_list = []
     for i in range(len(files_list)):
-        file_name_absolute = get_file_name_absolute_path(file_name=files_list[i], folder_path=folder_path)
-        file_size_bytes = os.path.getsize(file_name_absolute)
+        file_size_bytes = max(folder_scan.get_file_size(files_list[i]), 0)
         files_size_list.append(get_readable_filesize(size_bytes=file_size_bytes))
     return files_size_list
 
@@ -33,12 +35,12 @@ def get_files_size_with_absolute_path_list(files_name_absolute_path):
     files_size_list = []
     for i in range(len(files_name_absolute_path)):
         file_name_absolute = files_name_absolute_path[i]
-        file_size_bytes = os.path.getsize(file_name_absolute)
+        file_size_bytes = get_cached_file_size(file_name_absolute)
         files_size_list.append(get_readable_filesize(size_bytes=file_size_bytes))
     return files_size_list
 
 
-class AttachmentSelectionSetting(GlobalSetting):
+class AttachmentSelectionSetting(QWidget, GlobalSetting):
     tab_clicked_signal = Signal()
     activation_signal = Signal(bool)
 
@@ -85,6 +87,7 @@ class AttachmentSelectionSetting(GlobalSetting):
         # self.attachment_main_groupBox.setFocusProxy(Qt.FocusPolicy.NoFocus)
 
     def update_folder_path(self, new_path: str):
+        forget_folder_scan(new_path)
         if self.expert_mode_checkBox.isChecked():
             if new_path != "":
                 self.attachment_source_lineEdit.set_text_safe_change(new_path)
@@ -147,17 +150,28 @@ class AttachmentSelectionSetting(GlobalSetting):
             invalid_path_dialog = InvalidPathDialog(parent=self)
             invalid_path_dialog.execute()
 
+    def update_files_from_folder_watch(self, folder_path, changed_files_names):
+        if self.expert_mode_checkBox.isChecked() or self.is_drag_and_drop or \
+                not is_same_folder(folder_path, self.folder_path):
+            return
+        listed_files_names = self.get_files_list(self.folder_path)
+        new_files, removed_files, modified_files = get_watched_folder_changes(
+            self.files_names_list, listed_files_names, changed_files_names)
+        if len(new_files) == 0 and len(removed_files) == 0 and len(modified_files) == 0:
+            return
+        removed_files = set(removed_files)
+        files_checked = dict(zip(self.files_names_list, self.files_checked_list))
+        self.files_names_list = add_new_files_names(
+            [file_name for file_name in self.files_names_list if file_name not in removed_files], new_files,
+            listed_files_names)
+        self.files_checked_list = [files_checked.get(file_name, True) for file_name in self.files_names_list]
+        self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list, self.folder_path)
+        self.files_size_list = get_files_size_list(files_list=self.files_names_list, folder_path=self.folder_path)
+        self.update_total_size()
+        self.show_files_list()
+
     def get_files_list(self, folder_path):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, folder_path)
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            if os.path.getsize(temp_files_names_absolute[i]) == 0:
-                continue
-            result.append(temp_files_names[i])
-        return result
+        return get_folder_scan(folder_path).get_files_names()
 
     def show_files_list(self):
         self.table.show_files_list(files_names_list=self.files_names_list,
@@ -166,6 +180,7 @@ class AttachmentSelectionSetting(GlobalSetting):
         self.update_other_classes_variables()
 
     def update_other_classes_variables(self):
+        get_folder_watcher().watch_folder(self, self.folder_path)
         # self.change_global_last_path_directory()
         self.change_global_attachment_list()
         self.attachment_source_lineEdit.set_current_folder_path(self.folder_path)
@@ -225,6 +240,7 @@ class AttachmentSelectionSetting(GlobalSetting):
                 GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST.append(False)
 
     def connect_signals(self):
+        get_folder_watcher().folder_changed_signal.connect(self.update_files_from_folder_watch)
         self.attachment_source_button.clicked_signal.connect(self.update_folder_path)
         self.attachment_source_lineEdit.edit_finished_signal.connect(self.update_folder_path)
         self.attachment_refresh_files_button.clicked_signal.connect(self.update_folder_path)
@@ -350,6 +366,7 @@ class AttachmentSelectionSetting(GlobalSetting):
                     continue
                 new_files_absolute_path_list.append(path)
             else:
+                forget_folder_scan(path)
                 new_files_absolute_path_list.extend(
                     sort_names_like_windows(get_files_names_absolute_list(self.get_files_list(path), path)))
 
@@ -108,7 +108,10 @@ class AttachmentMatchingTable(TableWidget):
         for i in range(len(path_list)):
             self.set_row_number(row_number=i + 1, row_index=i)
             self.set_row_file_name(file_name=path_list[i].name, row_index=i)
-            self.set_row_file_size(file_size=path_list[i].total_size, row_index=i)
+            if path_list[i].is_scanned:
+                self.set_row_file_size(file_size=path_list[i].total_size, row_index=i)
+            else:
+                self.set_row_scanning(row_index=i)
         self.show()
         self.checking_row_updates = True
 
@@ -122,6 +125,11 @@ class AttachmentMatchingTable(TableWidget):
         file_size_item.setToolTip(get_readable_filesize(file_size))
         self.setItem(row_index, self.column_ids["Size"], file_size_item)
 
+    def set_row_scanning(self, row_index):
+        file_size_item = QTableWidgetItem("Scanning...")
+        file_size_item.setToolTip("The folder size is being read")
+        self.setItem(row_index, self.column_ids["Size"], file_size_item)
+
     def set_row_file_name(self, file_name, row_index, is_checked=True):
         file_name_item = QTableWidgetItem(" " + file_name)
         file_name_item.setToolTip(file_name)
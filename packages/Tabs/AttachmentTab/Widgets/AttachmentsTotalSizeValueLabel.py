@@ -1,7 +1,6 @@
-import os
-
 from PySide6.QtWidgets import QLabel
 
+from packages.Tabs.FolderScan import get_cached_file_size
 from packages.Tabs.GlobalSetting import get_readable_filesize
 
 
@@ -16,7 +15,7 @@ class AttachmentsTotalSizeValueLabel(QLabel):
         total_size_bytes = 0
         for i in range(len(files_names_absolute_list)):
             if files_checked_list[i]:
-                file_size = os.path.getsize(files_names_absolute_list[i])
+                file_size = get_cached_file_size(files_names_absolute_list[i])
                 total_size_bytes += file_size
         self.total_size_bytes = total_size_bytes
         self.total_size_readable = get_readable_filesize(self.total_size_bytes)
@@ -28,13 +27,13 @@ class AttachmentsTotalSizeValueLabel(QLabel):
         self.setText(self.total_size_readable)
 
     def attachment_checked(self, file_absolute_name):
-        file_size = os.path.getsize(file_absolute_name)
+        file_size = get_cached_file_size(file_absolute_name)
         self.total_size_bytes += file_size
         self.total_size_readable = get_readable_filesize(self.total_size_bytes)
         self.setText(self.total_size_readable)
 
     def attachment_unchecked(self, file_absolute_name):
-        file_size = os.path.getsize(file_absolute_name)
+        file_size = get_cached_file_size(file_absolute_name)
         self.total_size_bytes -= file_size
         self.total_size_readable = get_readable_filesize(self.total_size_bytes)
         self.setText(self.total_size_readable)
@@ -1,14 +1,15 @@
-import logging
 import os
 from typing import List
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QThread
 from PySide6.QtWidgets import QHBoxLayout, QWidget
 
 from packages.Tabs.AttachmentTab.Widgets.AttachmentMatchingTable import AttachmentMatchingTable
 from packages.Tabs.AttachmentTab.Widgets.MatchAttachmentToolsLayout import MatchAttachmentToolsLayout
+from packages.Tabs.AttachmentTab.Widgets.ScanAttachmentPathsWorker import ScanAttachmentPathsWorker
 from packages.Widgets.PathData import PathData
 from packages.Tabs.AttachmentTab.Widgets.VideoMatchingTable import VideoMatchingTable
+from packages.Tabs.FolderScan import get_folder_scan
 from packages.Tabs.GlobalSetting import GlobalSetting, get_readable_filesize, sort_names_like_windows
 
 
@@ -25,6 +26,8 @@ class MatchAttachmentWidget(QWidget):
         self.total_size_bytes = 0
         self.match_tools_layout = MatchAttachmentToolsLayout(parent=parent)
         self.sync_slideBar_check = False
+        self.scan_paths_threads = []  # (QThread, ScanAttachmentPathsWorker) of the scans started
+        self.paths_rows_indexes = {}  # id of a PathData -> its row, checked before it is used
         self.attachment_table.setAcceptDrops(True)
         self.connect_signals()
         self.main_layout = QHBoxLayout()
@@ -105,6 +108,7 @@ class MatchAttachmentWidget(QWidget):
         self.attachment_table.select_row(new_selected_row)
 
     def clear_attachment_table(self):
+        self.stop_scanning_paths()
         self.paths_list.clear()
         self.attachment_table.clear_table()
 
@@ -119,90 +123,99 @@ class MatchAttachmentWidget(QWidget):
         self.attachment_table.setAcceptDrops(True)
         self.match_tools_layout.enable_editable_widgets()
 
+    # the top folder is listed with one scandir, its files sizes come with it and its subfolders are scanned in the
+    # background, their rows show their sizes as soon as they're read
     def update_paths(self, path):
         self.clear_paths()
-        paths_list = sort_names_like_windows(os.listdir(path))
-        paths_list = [os.path.join(path, file) for file in paths_list]
-        for path in paths_list:
-            if os.path.isdir(path):
-                try:
-                    temp_path = PathData()
-                    temp_path.name = os.path.basename(path)
-                    temp_path.absolute_name = path
-                    temp_path.files_list = [os.path.join(path, file) for file in os.listdir(path)]
-                    temp_path.files_list = [file for file in temp_path.files_list if
-                                            os.path.isfile(file) and os.path.getsize(file) != 0]
-                    total_size = 0
-                    for file in temp_path.files_list:
-                        file_name_absolute = file
-                        file_size_bytes = os.path.getsize(file_name_absolute)
-                        total_size += file_size_bytes
-                    temp_path.total_size = total_size
-                    self.paths_list.append(temp_path)
-                except Exception as e:
-                    logging.error(e)
-                    continue
+        folder_scan = get_folder_scan(path)
+        files_names = set(folder_scan.get_files_names())
+        paths_to_scan = []
+        for name in sort_names_like_windows(folder_scan.folders_names + list(files_names)):
+            temp_path = PathData()
+            temp_path.name = name
+            temp_path.absolute_name = os.path.join(path, name)
+            if name in files_names:
+                temp_path.files_list = [temp_path.absolute_name]
+                temp_path.total_size = folder_scan.get_file_size(name)
             else:
-                try:
-                    if os.path.getsize(path) == 0:
-                        continue
-                    temp_path = PathData()
-                    temp_path.name = os.path.basename(path)
-                    temp_path.absolute_name = path
-                    temp_path.files_list = [path]
-                    temp_path.total_size = os.path.getsize(path)
-                    self.paths_list.append(temp_path)
-                except Exception as e:
-                    logging.error(e)
-                    continue
+                temp_path.is_scanned = False
+                paths_to_scan.append(temp_path)
+            self.paths_list.append(temp_path)
         self.attachment_table.show_paths_list(path_list=self.paths_list.copy())
         GlobalSetting.ATTACHMENT_PATH_DATA_LIST = self.paths_list.copy()
         self.update_total_size()
         self.update_is_there_old_paths()
+        self.scan_paths(paths_to_scan)
 
     def update_paths_with_drag_and_drop(self, paths_list):
+        paths_to_scan = []
         for path in paths_list:
-            if os.path.isdir(path):
-                try:
-                    temp_path = PathData()
-                    temp_path.name = os.path.basename(path)
-                    temp_path.absolute_name = path
-                    temp_path.files_list = [os.path.join(path, file) for file in os.listdir(path)]
-                    temp_path.files_list = [file for file in temp_path.files_list if
-                                            os.path.isfile(file) and os.path.getsize(file) != 0]
-                    total_size = 0
-                    for file in temp_path.files_list:
-                        file_name_absolute = file
-                        file_size_bytes = os.path.getsize(file_name_absolute)
-                        total_size += file_size_bytes
-                    temp_path.total_size = total_size
-                    self.paths_list.append(temp_path)
-                except Exception as e:
-                    logging.error(e)
-                    continue
-            else:
-                try:
-                    if os.path.getsize(path) == 0:
-                        continue
-                    temp_path = PathData()
-                    temp_path.name = os.path.basename(path)
-                    temp_path.absolute_name = path
-                    temp_path.files_list = [path]
-                    temp_path.total_size = os.path.getsize(path)
-                    self.paths_list.append(temp_path)
-                except Exception as e:
-                    logging.error(e)
-                    continue
+            temp_path = PathData()
+            temp_path.name = os.path.basename(path)
+            temp_path.absolute_name = path
+            temp_path.is_scanned = False
+            paths_to_scan.append(temp_path)
+            self.paths_list.append(temp_path)
         self.attachment_table.show_paths_list(path_list=self.paths_list.copy())
         GlobalSetting.ATTACHMENT_PATH_DATA_LIST = self.paths_list.copy()
         self.drag_and_dropped_signal.emit()
         self.update_total_size()
         self.update_is_there_old_paths()
+        self.scan_paths(paths_to_scan)
         # self.is_drag_and_drop = True
         # self.folder_path = ""
         # self.chapter_source_lineEdit.stop_check_path = True
         # self.chapter_source_lineEdit.setText(self.drag_and_dropped_text)
 
+    def scan_paths(self, paths_to_scan):
+        self.scan_paths_threads = [(thread, worker) for thread, worker in self.scan_paths_threads
+                                   if not thread.isFinished()]
+        if len(paths_to_scan) == 0:
+            return
+        scan_paths_thread = QThread()
+        scan_paths_worker = ScanAttachmentPathsWorker(paths_to_scan)
+        scan_paths_worker.moveToThread(scan_paths_thread)
+        scan_paths_thread.started.connect(scan_paths_worker.run)
+        scan_paths_worker.path_scanned_signal.connect(self.update_scanned_path)
+        scan_paths_worker.finished_all_jobs_signal.connect(self.remove_failed_paths)
+        scan_paths_worker.finished_all_jobs_signal.connect(scan_paths_thread.quit)
+        self.scan_paths_threads.append((scan_paths_thread, scan_paths_worker))
+        scan_paths_thread.start()
+
+    # the running scans stop after the path they're reading
+    def stop_scanning_paths(self):
+        for scan_paths_thread, scan_paths_worker in self.scan_paths_threads:
+            if scan_paths_thread.isRunning():
+                scan_paths_worker.stop = True
+                scan_paths_thread.quit()
+                scan_paths_thread.wait()
+        self.scan_paths_threads = []
+
+    def update_scanned_path(self, path_data):
+        row_index = self.get_path_row_index(path_data)
+        # the path can be deleted or the list cleared while it was being scanned
+        if row_index == -1:
+            return
+        self.attachment_table.set_row_file_size(file_size=path_data.total_size, row_index=row_index)
+        self.update_total_size()
+
+    # the rows are only indexed again when the list changed since the last scanned path
+    def get_path_row_index(self, path_data):
+        row_index = self.paths_rows_indexes.get(id(path_data), -1)
+        if row_index < len(self.paths_list) and self.paths_list[row_index] is path_data:
+            return row_index
+        self.paths_rows_indexes = {id(listed_path_data): i for i, listed_path_data in enumerate(self.paths_list)}
+        return self.paths_rows_indexes.get(id(path_data), -1)
+
+    def remove_failed_paths(self):
+        if all(path_data.is_attachable for path_data in self.paths_list):
+            return
+        self.paths_list = [path_data for path_data in self.paths_list if path_data.is_attachable]
+        GlobalSetting.ATTACHMENT_PATH_DATA_LIST = self.paths_list.copy()
+        self.attachment_table.show_paths_list(path_list=self.paths_list.copy())
+        self.update_total_size()
+        self.update_is_there_old_paths()
+
     def update_total_size(self):
         self.total_size_bytes = 0
         for path in self.paths_list:
@@ -210,6 +223,7 @@ class MatchAttachmentWidget(QWidget):
         self.update_total_size_readable_signal.emit(get_readable_filesize(self.total_size_bytes))
 
     def clear_paths(self):
+        self.stop_scanning_paths()
         self.paths_list.clear()
         GlobalSetting.ATTACHMENT_PATH_DATA_LIST.clear()
         self.attachment_table.show_paths_list(path_list=self.paths_list)
@@ -0,0 +1,99 @@
+import os
+import traceback
+
+from PySide6.QtCore import QObject, Signal
+
+from packages.Tabs.FolderScan import FolderScan
+from packages.Tabs.GlobalSetting import GlobalSetting, write_to_log_file
+from packages.Widgets.PathData import PathData
+
+attachment_paths_scans = None
+
+
+# a failed path left in the list would match every later path to the wrong video
+def remove_failed_attachment_paths():
+    GlobalSetting.ATTACHMENT_PATH_DATA_LIST = [path_data for path_data in GlobalSetting.ATTACHMENT_PATH_DATA_LIST
+                                               if path_data.is_attachable]
+
+
+# the jobs read the files of every attachment path, so the queue is set up once all of them are known
+def is_scanning_attachment_paths():
+    return len(get_attachment_paths_scans().running_scans_workers) > 0
+
+
+def get_attachment_paths_scans():
+    global attachment_paths_scans
+    if attachment_paths_scans is None:
+        attachment_paths_scans = AttachmentPathsScans()
+    return attachment_paths_scans
+
+
+# Lives in the GUI thread and tells when the last running scan is done, its failed paths are already dropped then
+class AttachmentPathsScans(QObject):
+    all_scans_finished_signal = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.running_scans_workers = []
+
+    def add_scan(self, scan_worker):
+        self.running_scans_workers.append(scan_worker)
+        scan_worker.finished_all_jobs_signal.connect(self.scan_finished)
+
+    def scan_finished(self):
+        self.running_scans_workers = [scan_worker for scan_worker in self.running_scans_workers
+                                      if not scan_worker.is_finished]
+        if len(self.running_scans_workers) > 0:
+            return
+        remove_failed_attachment_paths()
+        self.all_scans_finished_signal.emit()
+
+
+# a folder is listed with one scandir that gives every file size, a file needs a single stat
+def scan_attachment_path(path_data: PathData):
+    if os.path.isdir(path_data.absolute_name):
+        folder_scan = FolderScan(path_data.absolute_name)
+        files_names = folder_scan.get_files_names()
+        path_data.files_list = [os.path.join(path_data.absolute_name, file_name) for file_name in files_names]
+        path_data.total_size = sum(folder_scan.get_file_size(file_name) for file_name in files_names)
+    else:
+        file_size = os.stat(path_data.absolute_name).st_size
+        if file_size == 0:
+            return False
+        path_data.files_list = [path_data.absolute_name]
+        path_data.total_size = file_size
+    return True
+
+
+# Fills the files and the total size of the attachment paths in the background, each path is sent as soon as it's
+# scanned so its row shows its size right away, the folders that can't be read and the empty files are marked and
+# dropped once the scan is done
+class ScanAttachmentPathsWorker(QObject):
+    path_scanned_signal = Signal(object)  # PathData with its files and size filled
+    finished_all_jobs_signal = Signal()
+
+    def __init__(self, paths_data):
+        super().__init__()
+        self.paths_data = paths_data
+        self.stop = False
+        self.is_finished = False
+        get_attachment_paths_scans().add_scan(self)
+
+    def run(self):
+        for path_data in self.paths_data:
+            if self.stop:
+                break
+            try:
+                is_attachable = scan_attachment_path(path_data)
+            except Exception as e:
+                write_to_log_file(traceback.format_exc())
+                is_attachable = False
+            if not is_attachable:
+                path_data.files_list = []
+                path_data.total_size = 0
+                path_data.is_attachable = False
+            path_data.is_scanned = True
+            if is_attachable:
+                self.path_scanned_signal.emit(path_data)
+        self.is_finished = True
+        self.finished_all_jobs_signal.emit()
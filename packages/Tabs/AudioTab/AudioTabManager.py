@@ -1,5 +1,5 @@
 from PySide6.QtCore import Signal
-from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QWidget
 
 from packages.Tabs.AudioTab.AudioSelection import AudioSelectionSetting
 from packages.Tabs.AudioTab.Widgets.AudioTabComboBox import AudioTabComboBox
@@ -7,7 +7,7 @@ from packages.Tabs.AudioTab.Widgets.AudioTabDeleteButton import AudioTabDeleteBu
 from packages.Tabs.GlobalSetting import GlobalSetting
 
 
-class AudioTabManager(GlobalSetting):
+class AudioTabManager(QWidget, GlobalSetting):
     activation_signal = Signal(bool)
     tab_clicked_signal = Signal()
 
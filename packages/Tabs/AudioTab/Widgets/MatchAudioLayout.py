@@ -29,6 +29,7 @@ class MatchAudioLayout(QHBoxLayout):
         )
         self.match_tools_layout.refresh_audio_table_signal.connect(self.show_audio_files_after_swapping_deleting)
         self.match_tools_layout.selected_audio_row_signal.connect(self.change_selected_audio_row)
+        self.match_tools_layout.audio_files_matched_signal.connect(self.show_audio_files)
 
     def setup_layout(self):
         self.addWidget(self.video_table, 50)
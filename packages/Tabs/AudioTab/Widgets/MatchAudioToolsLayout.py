@@ -8,12 +8,17 @@ from packages.Tabs.AudioTab.Widgets.MoveAudioDownButton import MoveAudioDownButt
 from packages.Tabs.AudioTab.Widgets.MoveAudioToButton import MoveAudioToButton
 from packages.Tabs.AudioTab.Widgets.MoveAudioTopButton import MoveAudioTopButton
 from packages.Tabs.AudioTab.Widgets.MoveAudioUpButton import MoveAudioUpButton
+from packages.Widgets.AutoMatchButton import AutoMatchButton
+from packages.Widgets.InfoDialog import InfoDialog
+from packages.Widgets.WarningDialog import WarningDialog
+from packages.Tabs.FileMatching import get_matched_files_lists
 from packages.Tabs.GlobalSetting import GlobalSetting
 
 
 class MatchAudioToolsLayout(QVBoxLayout):
     refresh_audio_table_signal = Signal()
     selected_audio_row_signal = Signal(int)
+    audio_files_matched_signal = Signal()
 
     def __init__(self, tab_index, parent=None):
         super().__init__()
@@ -26,6 +31,7 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.move_audio_bottom_button = MoveAudioBottomButton()
         self.move_audio_to_button = MoveAudioToButton()
         self.delete_audio_button = DeleteAudioButton()
+        self.auto_match_audio_button = AutoMatchButton("audio")
         self.setup_shortcuts()
         self.setup_layout()
         self.connect_signals()
@@ -53,6 +59,7 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.delete_audio_button.delete_happened_signal.connect(
             self.update_global_audio_files_list_order_deleting)
         self.delete_audio_button.selected_row_after_delete.connect(self.change_selected_audio_row)
+        self.auto_match_audio_button.clicked_signal.connect(self.auto_match_audio_files)
 
     def setup_layout(self):
         self.addStretch()
@@ -67,6 +74,8 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.addWidget(self.move_audio_down_button)
         self.addSpacing(10)
         self.addWidget(self.delete_audio_button)
+        self.addSpacing(10)
+        self.addWidget(self.auto_match_audio_button)
         self.addStretch()
 
     def set_selected_row(self, selected_row, max_index):
@@ -104,6 +113,9 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.delete_audio_shortcut = QShortcut(QKeySequence("Delete"), self.audio_tab)
         self.delete_audio_shortcut.activated.connect(self.delete_audio_button.clicked_button)
 
+        self.auto_match_audio_shortcut = QShortcut(QKeySequence("Ctrl+E"), self.audio_tab)
+        self.auto_match_audio_shortcut.activated.connect(self.auto_match_audio_button.clicked_button)
+
     def refresh_audio_table(self):
         self.refresh_audio_table_signal.emit()
 
@@ -118,6 +130,7 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.move_audio_bottom_button.setEnabled(False)
         self.move_audio_to_button.setEnabled(False)
         self.delete_audio_button.setEnabled(False)
+        self.auto_match_audio_button.setEnabled(False)
 
         self.move_audio_up_shortcut.setEnabled(False)
         self.move_audio_top_shortcut.setEnabled(False)
@@ -125,6 +138,7 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.move_audio_bottom_shortcut.setEnabled(False)
         self.move_audio_to_shortcut.setEnabled(False)
         self.delete_audio_shortcut.setEnabled(False)
+        self.auto_match_audio_shortcut.setEnabled(False)
 
     def enable_editable_widgets(self):
         self.move_audio_up_button.setEnabled(True)
@@ -133,6 +147,7 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.move_audio_bottom_button.setEnabled(True)
         self.move_audio_to_button.setEnabled(True)
         self.delete_audio_button.setEnabled(True)
+        self.auto_match_audio_button.setEnabled(True)
 
         self.move_audio_up_shortcut.setEnabled(True)
         self.move_audio_top_shortcut.setEnabled(True)
@@ -140,6 +155,7 @@ class MatchAudioToolsLayout(QVBoxLayout):
         self.move_audio_bottom_shortcut.setEnabled(True)
         self.move_audio_to_shortcut.setEnabled(True)
         self.delete_audio_shortcut.setEnabled(True)
+        self.auto_match_audio_shortcut.setEnabled(True)
 
     def update_global_audio_files_list_order_to_top(self, index_to_move):
         while index_to_move > 0:
@@ -210,3 +226,20 @@ class MatchAudioToolsLayout(QVBoxLayout):
         del GlobalSetting.AUDIO_FILES_LIST[self.tab_index][index_to_delete]
         del GlobalSetting.AUDIO_FILES_ABSOLUTE_PATH_LIST[self.tab_index][index_to_delete]
         self.refresh_audio_table()
+
+    def auto_match_audio_files(self):
+        if len(GlobalSetting.AUDIO_FILES_LIST[self.tab_index]) == 0 or len(GlobalSetting.VIDEO_FILES_LIST) == 0:
+            return
+        new_files_names, new_files_absolute_paths, matching_report, is_check_needed = get_matched_files_lists(
+            GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST, GlobalSetting.AUDIO_FILES_LIST[self.tab_index],
+            GlobalSetting.AUDIO_FILES_ABSOLUTE_PATH_LIST[self.tab_index])
+        GlobalSetting.AUDIO_FILES_LIST[self.tab_index] = new_files_names
+        GlobalSetting.AUDIO_FILES_ABSOLUTE_PATH_LIST[self.tab_index] = new_files_absolute_paths
+        self.audio_files_matched_signal.emit()
+        if is_check_needed:
+            matching_dialog = WarningDialog(window_title="Audio Matching", info_message=matching_report,
+                                            parent=self.audio_tab)
+        else:
+            matching_dialog = InfoDialog(window_title="Audio Matching", info_message=matching_report,
+                                         parent=self.audio_tab)
+        matching_dialog.execute()
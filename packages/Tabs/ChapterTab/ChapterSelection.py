@@ -2,6 +2,7 @@ from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QGroupBox,
     QVBoxLayout,
+    QWidget,
 )
 
 from packages.Startup.Options import Options
@@ -12,6 +13,9 @@ from packages.Tabs.ChapterTab.Widgets.ChapterSourceLineEdit import ChapterSource
 from packages.Tabs.ChapterTab.Widgets.DiscardOldChaptersCheckBox import DiscardOldChaptersCheckBox
 from packages.Tabs.ChapterTab.Widgets.MatchChapterLayout import MatchChapterLayout
 from packages.Widgets.RefreshFilesButton import RefreshFilesButton
+from packages.Tabs.FolderScan import get_folder_scan, forget_folder_scan
+from packages.Tabs.FolderWatcher import add_new_files_names, get_folder_watcher, get_watched_folder_changes, \
+    get_watched_files_names_absolute_list, is_same_folder
 from packages.Tabs.GlobalSetting import *
 from packages.Widgets.InvalidPathDialog import *
 from packages.Widgets.WarningDialog import WarningDialog
@@ -19,7 +23,7 @@ from packages.Widgets.YesNoDialog import *
 
 
 # noinspection PyAttributeOutsideInit
-class ChapterSelectionSetting(GlobalSetting):
+class ChapterSelectionSetting(QWidget, GlobalSetting):
     tab_clicked_signal = Signal()
     activation_signal = Signal(bool)
 
@@ -53,6 +57,7 @@ class ChapterSelectionSetting(GlobalSetting):
 
     # noinspection PyUnresolvedReferences
     def connect_signals(self):
+        get_folder_watcher().folder_changed_signal.connect(self.update_files_from_folder_watch)
         self.chapter_main_groupBox.toggled.connect(self.activate_tab)
         self.chapter_source_button.clicked_signal.connect(self.update_folder_path)
         self.chapter_source_lineEdit.edit_finished_signal.connect(self.update_folder_path)
@@ -104,6 +109,7 @@ class ChapterSelectionSetting(GlobalSetting):
         self.chapter_main_groupBox.setChecked(True)
 
     def update_folder_path(self, new_path: str):
+        forget_folder_scan(new_path)
         if new_path != "":
             self.chapter_source_lineEdit.set_text_safe_change(new_path)
             self.update_files_lists(new_path)
@@ -162,31 +168,30 @@ class ChapterSelectionSetting(GlobalSetting):
             self.update_files_lists(self.folder_path)
             self.show_chapter_files_list()
 
+    def update_files_from_folder_watch(self, folder_path, changed_files_names):
+        if self.is_drag_and_drop or not is_same_folder(folder_path, self.folder_path):
+            return
+        listed_files_names = self.get_files_list(self.folder_path)
+        new_files, removed_files, modified_files = get_watched_folder_changes(
+            self.files_names_list, listed_files_names, changed_files_names)
+        if len(new_files) == 0 and len(removed_files) == 0:
+            return
+        self.files_names_list = add_new_files_names(
+            [file_name for file_name in self.files_names_list if file_name not in removed_files], new_files,
+            listed_files_names)
+        self.files_names_absolute_list = get_watched_files_names_absolute_list(self.files_names_list, self.folder_path)
+        self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
+        self.show_chapter_files_list()
+
     def get_files_list(self, folder_path):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, folder_path)
-        current_extensions = self.chapter_extensions_comboBox.currentData()
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            if os.path.getsize(temp_files_names_absolute[i]) == 0:
-                continue
-            for j in range(len(current_extensions)):
-                temp_file_extension_start_index = temp_files_names[i].rfind(".")
-                if temp_file_extension_start_index == -1:
-                    continue
-                temp_file_extension = temp_files_names[i][temp_file_extension_start_index + 1:]
-                if temp_file_extension.lower() == current_extensions[j].lower():
-                    result.append(temp_files_names[i])
-                    break
-        return result
+        return get_folder_scan(folder_path).get_files_names(self.chapter_extensions_comboBox.currentData())
 
     def show_chapter_files_list(self):
         self.update_other_classes_variables()
         self.chapter_match_layout.show_chapter_files()
 
     def update_other_classes_variables(self):
+        get_folder_watcher().watch_folder(self, self.folder_path)
         # self.change_global_last_path_directory()
         self.change_global_chapter_list()
         self.chapter_source_button.set_is_there_old_file(len(self.files_names_list) > 0)
@@ -322,6 +327,7 @@ class ChapterSelectionSetting(GlobalSetting):
                         new_files_absolute_path_list.append(path)
                         break
             else:
+                forget_folder_scan(path)
                 new_files_absolute_path_list.extend(
                     sort_names_like_windows(get_files_names_absolute_list(self.get_files_list(path), path)))
 
@@ -28,6 +28,7 @@ class MatchChapterLayout(QHBoxLayout):
         )
         self.match_tools_layout.refresh_chapter_table_signal.connect(self.show_chapter_files_after_swapping_deleting)
         self.match_tools_layout.selected_chapter_row_signal.connect(self.change_selected_chapter_row)
+        self.match_tools_layout.chapter_files_matched_signal.connect(self.show_chapter_files)
 
     def setup_layout(self):
         self.addWidget(self.video_table, 50)
@@ -8,7 +8,11 @@ from packages.Tabs.ChapterTab.Widgets.MoveChapterDownButton import MoveChapterDo
 from packages.Tabs.ChapterTab.Widgets.MoveChapterToButton import MoveChapterToButton
 from packages.Tabs.ChapterTab.Widgets.MoveChapterTopButton import MoveChapterTopButton
 from packages.Tabs.ChapterTab.Widgets.MoveChapterUpButton import MoveChapterUpButton
+from packages.Tabs.FileMatching import get_matched_files_lists
 from packages.Tabs.GlobalSetting import GlobalSetting
+from packages.Widgets.AutoMatchButton import AutoMatchButton
+from packages.Widgets.InfoDialog import InfoDialog
+from packages.Widgets.WarningDialog import WarningDialog
 
 
 def update_global_chapter_files_list_order_to_top(index_to_move):
@@ -75,6 +79,7 @@ def update_global_chapter_files_list_order_to_bottom(index_to_move):
 class MatchChapterToolsLayout(QVBoxLayout):
     refresh_chapter_table_signal = Signal()
     selected_chapter_row_signal = Signal(int)
+    chapter_files_matched_signal = Signal()
 
     def __init__(self, parent=None):
         super().__init__()
@@ -85,11 +90,13 @@ class MatchChapterToolsLayout(QVBoxLayout):
         self.move_chapter_bottom_button = MoveChapterBottomButton()
         self.move_chapter_to_button = MoveChapterToButton()
         self.delete_chapter_button = DeleteChapterButton()
+        self.auto_match_chapter_button = AutoMatchButton("chapter")
         self.setup_shortcuts()
         self.setup_layout()
         self.connect_signals()
 
     def connect_signals(self):
+        self.auto_match_chapter_button.clicked_signal.connect(self.auto_match_chapter_files)
         self.move_chapter_up_button.swap_happened_signal.connect(self.refresh_chapter_table)
         self.move_chapter_up_button.selected_row_after_swap.connect(self.change_selected_chapter_row)
         self.move_chapter_top_button.swap_happened_signal.connect(self.refresh_chapter_table)
@@ -126,6 +133,8 @@ class MatchChapterToolsLayout(QVBoxLayout):
         self.addWidget(self.move_chapter_down_button)
         self.addSpacing(10)
         self.addWidget(self.delete_chapter_button)
+        self.addSpacing(10)
+        self.addWidget(self.auto_match_chapter_button)
         self.addStretch()
 
     def set_selected_row(self, selected_row, max_index):
@@ -162,6 +171,9 @@ class MatchChapterToolsLayout(QVBoxLayout):
         self.delete_chapter_shortcut = QShortcut(QKeySequence("Delete"), self.chapter_tab)
         self.delete_chapter_shortcut.activated.connect(self.delete_chapter_button.clicked_button)
 
+        self.auto_match_chapter_shortcut = QShortcut(QKeySequence("Ctrl+E"), self.chapter_tab)
+        self.auto_match_chapter_shortcut.activated.connect(self.auto_match_chapter_button.clicked_button)
+
     def refresh_chapter_table(self):
         self.refresh_chapter_table_signal.emit()
 
@@ -176,6 +188,7 @@ class MatchChapterToolsLayout(QVBoxLayout):
         self.move_chapter_bottom_button.setEnabled(False)
         self.move_chapter_to_button.setEnabled(False)
         self.delete_chapter_button.setEnabled(False)
+        self.auto_match_chapter_button.setEnabled(False)
 
         self.move_chapter_up_shortcut.setEnabled(False)
         self.move_chapter_top_shortcut.setEnabled(False)
@@ -183,6 +196,7 @@ class MatchChapterToolsLayout(QVBoxLayout):
         self.move_chapter_bottom_shortcut.setEnabled(False)
         self.move_chapter_to_shortcut.setEnabled(False)
         self.delete_chapter_shortcut.setEnabled(False)
+        self.auto_match_chapter_shortcut.setEnabled(False)
 
     def enable_editable_widgets(self):
         self.move_chapter_up_button.setEnabled(True)
@@ -191,6 +205,7 @@ class MatchChapterToolsLayout(QVBoxLayout):
         self.move_chapter_bottom_button.setEnabled(True)
         self.move_chapter_to_button.setEnabled(True)
         self.delete_chapter_button.setEnabled(True)
+        self.auto_match_chapter_button.setEnabled(True)
 
         self.move_chapter_up_shortcut.setEnabled(True)
         self.move_chapter_top_shortcut.setEnabled(True)
@@ -198,8 +213,26 @@ class MatchChapterToolsLayout(QVBoxLayout):
         self.move_chapter_bottom_shortcut.setEnabled(True)
         self.move_chapter_to_shortcut.setEnabled(True)
         self.delete_chapter_shortcut.setEnabled(True)
+        self.auto_match_chapter_shortcut.setEnabled(True)
 
     def update_global_chapter_files_list_order_deleting(self, index_to_delete):
         del GlobalSetting.CHAPTER_FILES_LIST[index_to_delete]
         del GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST[index_to_delete]
         self.refresh_chapter_table()
+
+    def auto_match_chapter_files(self):
+        if len(GlobalSetting.CHAPTER_FILES_LIST) == 0 or len(GlobalSetting.VIDEO_FILES_LIST) == 0:
+            return
+        new_files_names, new_files_absolute_paths, matching_report, is_check_needed = get_matched_files_lists(
+            GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST, GlobalSetting.CHAPTER_FILES_LIST,
+            GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST)
+        GlobalSetting.CHAPTER_FILES_LIST = new_files_names
+        GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST = new_files_absolute_paths
+        self.chapter_files_matched_signal.emit()
+        if is_check_needed:
+            matching_dialog = WarningDialog(window_title="Chapter Matching", info_message=matching_report,
+                                            parent=self.chapter_tab)
+        else:
+            matching_dialog = InfoDialog(window_title="Chapter Matching", info_message=matching_report,
+                                         parent=self.chapter_tab)
+        matching_dialog.execute()
@@ -0,0 +1,193 @@
+# Here we pair each video with the subtitle, audio or chapter file made for it, from the season and episode numbers and
+# the words of their names, instead of their positions in the lists
+# Every file is read once into an index by episode number and by word, so each video only scores the few files that
+# share its episode (or its rarest word) and the whole matching stays close to linear in the number of files
+import os
+import re
+
+SEASON_EPISODE_PATTERNS = [
+    re.compile(r"(?<![a-z0-9])s(\d{1,3})[ ._-]*e(\d{1,4})(?!\d)", re.IGNORECASE),  # S01E02
+    re.compile(r"(?<![a-z0-9])(\d{1,2})x(\d{1,4})(?!\d)", re.IGNORECASE),  # 1x02
+]
+EPISODE_PATTERN = re.compile(r"(?<![a-z0-9])(?:e|ep|episode|#)[ ._-]*(\d{1,4})(?!\d)", re.IGNORECASE)
+SEASON_PATTERN = re.compile(r"(?<![a-z0-9])(?:s|season)[ ._-]*(\d{1,3})(?!\d)", re.IGNORECASE)
+BRACKETS_PATTERN = re.compile(r"\[[^\]]*\]|\([^)]*\)|\{[^}]*\}")
+# numbers that are never the episode: resolutions, codecs, audio channels and years
+NOT_EPISODE_NUMBERS_PATTERN = re.compile(
+    r"(?<![a-z0-9])(?:\d{3,4}[pi]|[xh][ ._]?26[45]|10 ?bits?|\d\.\d|(?:19|20)\d\d)(?![a-z0-9])", re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r"(?<![a-z0-9])(\d{1,4})(?![a-z0-9])", re.IGNORECASE)
+WORD_PATTERN = re.compile(r"[^\W_]+")
+MIN_WORDS_MATCH_RATIO = 0.5  # a video without an episode number needs half its words in the file name
+LOW_CONFIDENCE = 0.7
+
+
+class FileNameTokens:
+    def __init__(self, file_path):
+        self.season = None
+        self.episode = None
+        self.words = set()
+        self.read_name(file_path)
+
+    def read_name(self, file_path):
+        file_name = os.path.basename(file_path)
+        stem = file_name[:file_name.rfind(".")] if "." in file_name else file_name
+        stem = NOT_EPISODE_NUMBERS_PATTERN.sub(" ", BRACKETS_PATTERN.sub(" ", stem))
+        for pattern in SEASON_EPISODE_PATTERNS:
+            season_episode_match = pattern.search(stem)
+            if season_episode_match is not None:
+                self.season = int(season_episode_match.group(1))
+                self.episode = int(season_episode_match.group(2))
+                stem = stem[:season_episode_match.start()] + " " + stem[season_episode_match.end():]
+                break
+        if self.episode is None:
+            stem = self.read_episode(stem)
+        if self.season is None:
+            # season per folder libraries only have the season in the folder name
+            season_match = SEASON_PATTERN.search(stem) or SEASON_PATTERN.search(os.path.basename(
+                os.path.dirname(file_path)))
+            if season_match is not None:
+                self.season = int(season_match.group(1))
+        self.words = set(WORD_PATTERN.findall(stem.lower()))
+
+    def read_episode(self, stem):
+        episode_match = EPISODE_PATTERN.search(stem)
+        if episode_match is None:
+            # the last number left is the episode, like in "Show - 05"
+            numbers = list(NUMBER_PATTERN.finditer(stem))
+            if len(numbers) == 0:
+                return stem
+            episode_match = numbers[-1]
+        self.episode = int(episode_match.group(1))
+        return stem[:episode_match.start()] + " " + stem[episode_match.end():]
+
+
+def get_words_match_ratio(video_tokens, file_tokens):
+    if len(video_tokens.words) == 0:
+        return 0.0
+    return len(video_tokens.words & file_tokens.words) / len(video_tokens.words)
+
+
+def get_match_score(video_tokens, file_tokens):
+    words_match_ratio = get_words_match_ratio(video_tokens, file_tokens)
+    if video_tokens.episode is None or file_tokens.episode is None:
+        if words_match_ratio < MIN_WORDS_MATCH_RATIO:
+            return 0.0
+        return 0.4 + 0.6 * words_match_ratio
+    if video_tokens.episode != file_tokens.episode:
+        return 0.0
+    if video_tokens.season is not None and file_tokens.season is not None:
+        if video_tokens.season != file_tokens.season:
+            return 0.0
+        season_score = 0.2
+    elif video_tokens.season is None and file_tokens.season is None:
+        season_score = 0.15
+    else:
+        season_score = 0.1
+    return 0.6 + season_score + 0.2 * words_match_ratio
+
+
+def index_files_tokens(files_tokens):
+    files_by_episode = {}  # episode -> [file index]
+    files_by_season_episode = {}  # (season or None, episode) -> [file index]
+    files_by_word = {}  # word -> [index of a file without an episode number]
+    for file_index, file_tokens in enumerate(files_tokens):
+        if file_tokens.episode is not None:
+            files_by_episode.setdefault(file_tokens.episode, []).append(file_index)
+            files_by_season_episode.setdefault((file_tokens.season, file_tokens.episode), []).append(file_index)
+            continue
+        for word in file_tokens.words:
+            files_by_word.setdefault(word, []).append(file_index)
+    return files_by_episode, files_by_season_episode, files_by_word
+
+
+def get_candidate_files(video_tokens, files_by_episode, files_by_season_episode, files_by_word):
+    if video_tokens.episode is not None:
+        if video_tokens.season is None:
+            candidate_files = files_by_episode.get(video_tokens.episode, [])
+        else:
+            # the files of another season can't match, only the ones of this season or without a season
+            candidate_files = files_by_season_episode.get((video_tokens.season, video_tokens.episode), []) + \
+                              files_by_season_episode.get((None, video_tokens.episode), [])
+        if len(candidate_files) > 0:
+            return candidate_files
+    # no file has this episode, a file without an episode number can still match by its words, the ones sharing
+    # the rarest word of the video are the only ones that can
+    words_files = [files_by_word[word] for word in video_tokens.words if word in files_by_word]
+    if len(words_files) == 0:
+        return []
+    return min(words_files, key=len)
+
+
+# returns for each video the index of its file (-1 when none matched) and the match confidence from 0 to 1, and the
+# indexes of the files no video got
+def match_files_with_videos(videos_paths, files_paths):
+    videos_tokens = [FileNameTokens(video_path) for video_path in videos_paths]
+    files_tokens = [FileNameTokens(file_path) for file_path in files_paths]
+    files_by_episode, files_by_season_episode, files_by_word = index_files_tokens(files_tokens)
+    candidate_matches = []  # (score, distance between the positions, video index, file index)
+    for video_index, video_tokens in enumerate(videos_tokens):
+        for file_index in get_candidate_files(video_tokens, files_by_episode, files_by_season_episode,
+                                              files_by_word):
+            score = get_match_score(video_tokens, files_tokens[file_index])
+            if score > 0:
+                candidate_matches.append((-score, abs(video_index - file_index), video_index, file_index))
+    # the best matches are taken first, and each video and file is only used once
+    candidate_matches.sort()
+    matched_files = [-1] * len(videos_paths)
+    confidences = [0.0] * len(videos_paths)
+    used_files = set()
+    for negative_score, distance, video_index, file_index in candidate_matches:
+        if matched_files[video_index] != -1 or file_index in used_files:
+            continue
+        matched_files[video_index] = file_index
+        confidences[video_index] = round(-negative_score, 2)
+        used_files.add(file_index)
+    unmatched_files = [file_index for file_index in range(len(files_paths)) if file_index not in used_files]
+    return matched_files, confidences, unmatched_files
+
+
+# the files lists in video order, an empty name where a video has no file, then the unmatched files after the last
+# video so they are not muxed, with a report of the matching and whether it needs checking
+def get_matched_files_lists(videos_paths, files_names, files_absolute_paths):
+    # the empty names left by an older matching are not files
+    files_indexes = [file_index for file_index in range(len(files_names)) if files_names[file_index] != ""]
+    files_names = [files_names[file_index] for file_index in files_indexes]
+    files_absolute_paths = [files_absolute_paths[file_index] for file_index in files_indexes]
+    matched_files, confidences, unmatched_files = match_files_with_videos(videos_paths, files_absolute_paths)
+    new_files_names = [files_names[file_index] if file_index != -1 else "" for file_index in matched_files]
+    new_files_absolute_paths = [files_absolute_paths[file_index] if file_index != -1 else ""
+                                for file_index in matched_files]
+    if len(unmatched_files) == 0:
+        while len(new_files_names) > 0 and new_files_names[-1] == "":
+            new_files_names.pop()
+            new_files_absolute_paths.pop()
+    else:
+        new_files_names.extend(files_names[file_index] for file_index in unmatched_files)
+        new_files_absolute_paths.extend(files_absolute_paths[file_index] for file_index in unmatched_files)
+    is_check_needed = len(unmatched_files) > 0 or -1 in matched_files or \
+        any(confidence < LOW_CONFIDENCE for confidence in confidences)
+    matching_report = get_matching_report(videos_paths, files_names, matched_files, confidences, unmatched_files)
+    return new_files_names, new_files_absolute_paths, matching_report, is_check_needed
+
+
+def get_matching_report(videos_paths, files_names, matched_files, confidences, unmatched_files):
+    matched_count = len(matched_files) - matched_files.count(-1)
+    report = "Matched " + str(matched_count) + " of " + str(len(videos_paths)) + " videos"
+    low_confidence_matches = [video_index for video_index in range(len(videos_paths))
+                              if matched_files[video_index] != -1 and confidences[video_index] < LOW_CONFIDENCE]
+    if len(low_confidence_matches) > 0:
+        report += "\n\nCheck these matches:"
+        for video_index in low_confidence_matches:
+            report += "\n" + os.path.basename(videos_paths[video_index]) + " -> " + \
+                      files_names[matched_files[video_index]] + \
+                      " (" + str(int(confidences[video_index] * 100)) + "%)"
+    videos_without_file = [video_index for video_index in range(len(videos_paths)) if matched_files[video_index] == -1]
+    if len(videos_without_file) > 0:
+        report += "\n\nVideos without a file:"
+        for video_index in videos_without_file:
+            report += "\n" + os.path.basename(videos_paths[video_index])
+    if len(unmatched_files) > 0:
+        report += "\n\nFiles that didn't match any video, moved after the last video so they won't be muxed:"
+        for file_index in unmatched_files:
+            report += "\n" + files_names[file_index]
+    return report
@@ -0,0 +1,159 @@
+# Here we list a folder once with os.scandir and keep each file size indexed by its extension, so the tabs can filter
+# the same folder by any extensions and show the files sizes without touching the disk again, on a network share
+# every os.path.isdir/getsize is a round trip
+import os
+import re
+
+NUMBERS_PATTERN = re.compile('([0-9]+)')
+MAX_CACHED_FOLDERS = 16
+
+
+def natural_sort_key(name):
+    # the split keeps the numbers at the odd indexes
+    return [int(text) if i % 2 == 1 else text.lower() for i, text in enumerate(NUMBERS_PATTERN.split(name))]
+
+
+def get_file_extension(file_name):
+    extension_start_index = file_name.rfind(".")
+    if extension_start_index == -1:
+        return None
+    return file_name[extension_start_index + 1:].lower()
+
+
+class FolderScan:
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        self.files_names = []  # naturally sorted, folders excluded
+        self.folders_names = []  # naturally sorted subfolders
+        self.files_sizes = {}  # file name -> size in bytes
+        self.files_modification_times = {}  # file name -> st_mtime_ns
+        self.files_by_extension = {}  # lower case extension -> [position in files_names]
+        self.scan()
+
+    def scan(self):
+        files_sizes = {}
+        files_modification_times = {}
+        folders_names = []
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        folders_names.append(entry.name)
+                        continue
+                    file_stat = entry.stat()
+                except OSError:
+                    continue
+                files_sizes[entry.name] = file_stat.st_size
+                files_modification_times[entry.name] = file_stat.st_mtime_ns
+        self.files_sizes = files_sizes
+        self.files_modification_times = files_modification_times
+        self.files_names = sorted(files_sizes.keys(), key=natural_sort_key)
+        self.folders_names = sorted(folders_names, key=natural_sort_key)
+        self.files_by_extension = {}
+        for position, file_name in enumerate(self.files_names):
+            extension = get_file_extension(file_name)
+            if extension is not None:
+                self.files_by_extension.setdefault(extension, []).append(position)
+
+    # extensions=None means every file, even the ones without an extension
+    def get_files_names(self, extensions=None, skip_empty_files=True):
+        if extensions is None:
+            positions = range(len(self.files_names))
+        else:
+            positions = []
+            for extension in set(extension.lower() for extension in extensions):
+                positions.extend(self.files_by_extension.get(extension, []))
+            positions.sort()
+        result = []
+        for position in positions:
+            file_name = self.files_names[position]
+            if skip_empty_files and self.files_sizes[file_name] == 0:
+                continue
+            result.append(file_name)
+        return result
+
+    # a name this scan doesn't know, added after it or asked for once the scan was replaced, is read from the disk,
+    # -1 when the file is gone
+    def get_file_size(self, file_name):
+        file_size = self.files_sizes.get(file_name)
+        if file_size is None:
+            try:
+                file_size = os.path.getsize(os.path.join(self.folder_path, file_name))
+            except OSError:
+                file_size = -1
+        return file_size
+
+    # files that were added or modified since the old scan
+    def get_changed_files_names(self, old_folder_scan):
+        result = []
+        for file_name in self.files_names:
+            if self.files_sizes[file_name] != old_folder_scan.files_sizes.get(file_name) or \
+                    self.files_modification_times[file_name] != old_folder_scan.files_modification_times.get(file_name):
+                result.append(file_name)
+        return result
+
+    def has_changed_since(self, old_folder_scan):
+        return len(self.files_names) != len(old_folder_scan.files_names) or \
+            len(self.get_changed_files_names(old_folder_scan)) > 0
+
+
+# scans the folder then its subfolders up to max_depth levels down, in the order they are shown, and yields each scan
+# as soon as it's done, so the caller can use the first folders while the rest is still being read
+def walk_folder(folder_path, max_depth):
+    folders_to_scan = [(folder_path, 0)]
+    while len(folders_to_scan) > 0:
+        current_folder_path, depth = folders_to_scan.pop()
+        try:
+            folder_scan = FolderScan(current_folder_path)
+        except OSError:
+            if depth == 0:
+                raise
+            continue  # a subfolder we can't read, skip it with all its content
+        yield folder_scan
+        if depth < max_depth:
+            for folder_name in reversed(folder_scan.folders_names):
+                folders_to_scan.append((os.path.join(current_folder_path, folder_name), depth + 1))
+
+
+folders_scans = {}  # normalized folder path -> FolderScan, oldest first
+
+
+def get_folder_key(folder_path):
+    return os.path.normcase(os.path.abspath(folder_path))
+
+
+def cache_folder_scan(folder_key, folder_scan):
+    folders_scans.pop(folder_key, None)
+    folders_scans[folder_key] = folder_scan
+    if len(folders_scans) > MAX_CACHED_FOLDERS:
+        folders_scans.pop(next(iter(folders_scans)))
+
+
+def get_folder_scan(folder_path):
+    folder_key = get_folder_key(folder_path)
+    folder_scan = folders_scans.get(folder_key)
+    if folder_scan is None:
+        folder_scan = FolderScan(folder_path)
+    cache_folder_scan(folder_key, folder_scan)
+    return folder_scan
+
+
+def rescan_folder(folder_path):
+    folder_scan = FolderScan(folder_path)
+    cache_folder_scan(get_folder_key(folder_path), folder_scan)
+    return folder_scan
+
+
+# the size from the last scan of the file folder, only the files of a folder that wasn't scanned touch the disk
+def get_cached_file_size(file_path):
+    folder_scan = folders_scans.get(get_folder_key(os.path.dirname(file_path)))
+    if folder_scan is not None and os.path.basename(file_path) in folder_scan.files_sizes:
+        return folder_scan.get_file_size(os.path.basename(file_path))
+    return os.path.getsize(file_path)
+
+
+# call it when the user picks or refreshes a folder, so the next listing reads the folder again
+def forget_folder_scan(folder_path):
+    if folder_path == "" or folder_path.isspace():
+        return
+    folders_scans.pop(get_folder_key(folder_path), None)
@@ -0,0 +1,155 @@
+# Here we watch the tabs source folders when Options.Watch_Source_Folders is on, once a folder stays quiet it's
+# scanned again and the tabs get the names of the added or modified files, so they only update those files and keep
+# the order and the settings of the rest
+# only the folders are watched, a watch per file would run out of the system watches on big folders, the modified
+# files are found by comparing the sizes and modification times of the new scan with the last one
+import traceback
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+from packages.Startup.Options import Options
+from packages.Tabs.FolderScan import get_folder_key, get_folder_scan, rescan_folder
+from packages.Tabs.GlobalSetting import GlobalSetting, get_file_name_absolute_path, write_to_log_file
+
+FOLDER_SETTLE_TIME_MS = 1000  # a file being copied changes the folder many times, wait until it's done
+
+
+def is_same_folder(first_folder_path, second_folder_path):
+    if first_folder_path == "" or second_folder_path == "":
+        return False
+    return get_folder_key(first_folder_path) == get_folder_key(second_folder_path)
+
+
+# returns the files to add (in the folder order), the files that are gone and the listed files that were modified
+def get_watched_folder_changes(files_names, listed_files_names, changed_files_names):
+    current_files_names = set(files_names)
+    listed_files_names_set = set(listed_files_names)
+    changed_files_names = set(changed_files_names)
+    new_files = [file_name for file_name in listed_files_names
+                 if file_name not in current_files_names and file_name in changed_files_names]
+    # the "" left by the auto match for a video without a file isn't a file, it only keeps the next files in place
+    removed_files = [file_name for file_name in files_names
+                     if file_name != "" and file_name not in listed_files_names_set]
+    modified_files = [file_name for file_name in files_names
+                      if file_name in listed_files_names_set and file_name in changed_files_names]
+    return new_files, removed_files, modified_files
+
+
+# each new file goes right before the first listed file that comes after it in the folder, so a list in the folder
+# order stays in it, the placeholders and the files moved by hand keep their places
+def add_new_files_names(files_names, new_files_names, listed_files_names):
+    folder_positions = {file_name: position for position, file_name in enumerate(listed_files_names)}
+    result = []
+    new_file_index = 0
+    for file_name in files_names:
+        file_position = folder_positions.get(file_name)
+        while file_position is not None and new_file_index < len(new_files_names) and \
+                folder_positions[new_files_names[new_file_index]] < file_position:
+            result.append(new_files_names[new_file_index])
+            new_file_index += 1
+        result.append(file_name)
+    result.extend(new_files_names[new_file_index:])
+    return result
+
+
+def get_watched_files_names_absolute_list(files_names, folder_path):
+    return ["" if file_name == "" else get_file_name_absolute_path(file_name=file_name, folder_path=folder_path)
+            for file_name in files_names]
+
+
+class FolderWatcher(QObject):
+    folder_changed_signal = Signal(str, list)  # folder path, names of the added or modified files
+
+    def __init__(self):
+        super().__init__()
+        self.file_system_watcher = QFileSystemWatcher(self)
+        self.file_system_watcher.directoryChanged.connect(self.folder_changed)
+        self.owners_folders = {}  # tab -> folder path it shows
+        self.watched_folders = {}  # folder key -> folder path given to the file system watcher
+        self.folders_scans = {}  # folder key -> scan the tabs were last updated from
+        self.settling_folders_scans = {}  # folder key -> last scan of a folder that is still changing
+        self.changed_folders = {}  # folder key -> folder path to scan again
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(FOLDER_SETTLE_TIME_MS)
+        self.settle_timer.timeout.connect(self.update_changed_folders)
+
+    def watch_folder(self, owner, folder_path):
+        if not Options.Watch_Source_Folders or folder_path == "" or folder_path.isspace():
+            self.owners_folders.pop(owner, None)
+            self.update_watched_folders()
+            return
+        self.owners_folders[owner] = folder_path
+        self.update_watched_folders()
+        folder_key = get_folder_key(folder_path)
+        if folder_key in self.watched_folders and folder_key not in self.settling_folders_scans:
+            # the tab listed the folder again, so later changes are found against what it shows now
+            try:
+                self.folders_scans[folder_key] = get_folder_scan(folder_path)
+            except OSError:
+                return
+
+    def update_watched_folders(self):
+        needed_folders = {get_folder_key(folder_path): folder_path for folder_path in self.owners_folders.values()}
+        for folder_key in list(self.watched_folders.keys()):
+            if folder_key not in needed_folders:
+                self.file_system_watcher.removePath(self.watched_folders.pop(folder_key))
+                self.folders_scans.pop(folder_key, None)
+                self.settling_folders_scans.pop(folder_key, None)
+                self.changed_folders.pop(folder_key, None)
+        for folder_key, folder_path in needed_folders.items():
+            if folder_key in self.watched_folders:
+                continue
+            try:
+                # the scan the tab listed from, changes are found against it
+                self.folders_scans[folder_key] = get_folder_scan(folder_path)
+            except OSError:
+                continue
+            if self.file_system_watcher.addPath(folder_path):
+                self.watched_folders[folder_key] = folder_path
+
+    def folder_changed(self, folder_path):
+        folder_key = get_folder_key(folder_path)
+        if folder_key not in self.watched_folders:
+            return
+        self.changed_folders[folder_key] = self.watched_folders[folder_key]
+        self.settle_timer.start()
+
+    def update_changed_folders(self):
+        if not GlobalSetting.JOB_QUEUE_EMPTY:
+            # the files lists can't change while there are jobs in the queue, check again later
+            self.settle_timer.start()
+            return
+        changed_folders, self.changed_folders = self.changed_folders, {}
+        for folder_key, folder_path in changed_folders.items():
+            if folder_key not in self.folders_scans:
+                continue
+            try:
+                folder_scan = rescan_folder(folder_path)
+            except OSError:
+                write_to_log_file(traceback.format_exc())
+                continue
+            is_settling = folder_key in self.settling_folders_scans
+            last_folder_scan = self.settling_folders_scans.pop(folder_key, self.folders_scans[folder_key])
+            if folder_scan.has_changed_since(last_folder_scan):
+                # files are still being copied or written, wait until the folder stays the same
+                self.settling_folders_scans[folder_key] = folder_scan
+                self.changed_folders[folder_key] = folder_path
+                continue
+            if not is_settling:
+                continue
+            old_folder_scan = self.folders_scans[folder_key]
+            self.folders_scans[folder_key] = folder_scan
+            self.folder_changed_signal.emit(folder_path, folder_scan.get_changed_files_names(old_folder_scan))
+        if len(self.changed_folders) > 0:
+            self.settle_timer.start()
+
+
+folder_watcher = None
+
+
+def get_folder_watcher():
+    global folder_watcher
+    if folder_watcher is None:
+        folder_watcher = FolderWatcher()
+    return folder_watcher
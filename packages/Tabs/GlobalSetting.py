@@ -1,19 +1,16 @@
 # Here we have everything that must be shared between all tabs
 import copy
-import hashlib
-import json
 import logging
 import os
-import re
 from collections import defaultdict
 from pathlib import Path
 from typing import List
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget
 
-from packages.Startup import GlobalFiles
 from packages.Startup.PreDefined import ISO_639_2_SYMBOLS
+from packages.Tabs.FolderScan import natural_sort_key
+from packages.Tabs.VideoTracksIndex import VideoTracksIndex
 from packages.Widgets.PathData import PathData
 from packages.Widgets.SingleOldTrackData import SingleOldTrackData
 
@@ -31,9 +28,7 @@ def get_attribute(data, attribute, default_value):
 
 
 def sort_names_like_windows(names_list):
-    convert = lambda text: int(text) if text.isdigit() else text.lower()
-    alphanum_key = lambda key: [convert(c) for c in re.split('([0-9]+)', key)]
-    return sorted(names_list, key=alphanum_key)
+    return sorted(names_list, key=natural_sort_key)
 
 
 def generate_track_ids(ids_list):
@@ -90,32 +85,10 @@ def write_to_log_file(exception):
 
 
 def refresh_tracks(track_type):
-    videos = GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST.copy()
     new_list = []
-    audios_track_ids = []
-    audios_track_languages = []
-    audios_track_names = []
-    for video_name in videos:
-        string_name_hash = hashlib.sha1((str(video_name)).encode('utf-8')).hexdigest()
-        media_info_file_path = os.path.join(GlobalFiles.MediaInfoFolderPath, string_name_hash + ".json")
-        with open(media_info_file_path, 'r', encoding="UTF-8") as media_info_file:
-            json_info = json.load(media_info_file)
-        tracks_json_info = json_info["tracks"]
-        for track in tracks_json_info:
-            if track["type"] == track_type:
-                audios_track_ids.append(str(track["id"]))
-                language = str(
-                    get_attribute(data=track["properties"], attribute="language", default_value="UND"))
-                language_symbol = language.lower()
-                audios_track_languages.append(ISO_639_2_SYMBOLS.get(language_symbol, "Undetermined"))
-                name = str(get_attribute(data=track["properties"], attribute="track_name",
-                                         default_value="UnNamedTrackBeBo"))
-                if name != "UnNamedTrackBeBo":
-                    audios_track_names.append(name)
-
-    audios_track_ids = list(dict.fromkeys(audios_track_ids))
-    audios_track_languages = list(dict.fromkeys(audios_track_languages))
-    audios_track_names = list(dict.fromkeys(audios_track_names))
+    audios_track_ids = GlobalSetting.VIDEO_TRACKS_INDEX.get_track_ids(track_type)
+    audios_track_languages = GlobalSetting.VIDEO_TRACKS_INDEX.get_track_languages(track_type)
+    audios_track_names = GlobalSetting.VIDEO_TRACKS_INDEX.get_track_names(track_type)
     for i in range(len(audios_track_ids)):
         audios_track_ids[i] = convert_string_integer_to_two_digit_string(audios_track_ids[i])
     audios_track_ids.sort()
@@ -133,105 +106,130 @@ def refresh_tracks(track_type):
     return new_list
 
 
-def refresh_old_tracks_info_as_bulk(tracks_info: List[List[SingleOldTrackData]]):
-    tracks_bulk_data = defaultdict(SingleOldTrackData)
-    track_dict = {}
-    for video_id, tracks_list in enumerate(tracks_info, start=1):
-        for track in tracks_list:
-            track_id = track.id
-            if track_id not in track_dict.keys():
-                track_dict[track_id] = defaultdict(SingleOldTrackData)
-            single_old_track_data: SingleOldTrackData = SingleOldTrackData()
-            single_old_track_data.id = track_id
-            single_old_track_data.track_name = track.track_name
-            single_old_track_data.language = track.language
-            single_old_track_data.is_default = track.is_default
-            single_old_track_data.is_forced = track.is_forced
-            single_old_track_data.is_enabled = track.is_enabled
-            track_dict[track_id][video_id] = single_old_track_data
-
-    for order_id, track_id in enumerate(track_dict.keys()):
-        temp_old_track_data = SingleOldTrackData()
-        all_same = True
-        for video_id in track_dict[track_id]:
-            if temp_old_track_data.id == "":
-                temp_old_track_data = track_dict[track_id][video_id]
-            else:
-                if temp_old_track_data.track_name != track_dict[track_id][video_id].track_name:
-                    temp_old_track_data.track_name = "[Old]"
-                if temp_old_track_data.language != track_dict[track_id][video_id].language:
-                    temp_old_track_data.language = "[Old]"
-                if temp_old_track_data.is_enabled != track_dict[track_id][video_id].is_enabled:
-                    temp_old_track_data.is_enabled = None
-                if temp_old_track_data.is_default != track_dict[track_id][video_id].is_default:
-                    temp_old_track_data.is_default = None
-                if temp_old_track_data.is_forced != track_dict[track_id][video_id].is_forced:
-                    temp_old_track_data.is_forced = None
-        if all_same:
-            tracks_bulk_data[track_id] = temp_old_track_data
+def get_merged_track_value(values, different_values_result):
+    if len(values) == 1:
+        return values[0]
+    return different_values_result
+
+
+def get_merged_old_track(track_type, track_id):
+    # same as comparing the track with this id in every video, a value that differs becomes "[Old]" / partial
+    tracks_index = GlobalSetting.VIDEO_TRACKS_INDEX
+    merged_track = SingleOldTrackData()
+    merged_track.id = track_id
+    merged_track.track_name = get_merged_track_value(
+        tracks_index.get_track_id_values(track_type, track_id, "track_name"), "[Old]")
+    merged_track.language = get_merged_track_value(
+        tracks_index.get_track_id_values(track_type, track_id, "language"), "[Old]")
+    merged_track.is_enabled = convert_boolean_to_checked_value(get_merged_track_value(
+        tracks_index.get_track_id_values(track_type, track_id, "is_enabled"), None))
+    merged_track.is_default = convert_boolean_to_checked_value(get_merged_track_value(
+        tracks_index.get_track_id_values(track_type, track_id, "is_default"), None))
+    merged_track.is_forced = convert_boolean_to_checked_value(get_merged_track_value(
+        tracks_index.get_track_id_values(track_type, track_id, "is_forced"), None))
+    merged_track.order = -1
+    return merged_track
+
+
+def update_old_track_keeping_user_changes(current_track, old_original_track, new_original_track):
+    for attribute in ["track_name", "language", "is_enabled", "is_default", "is_forced"]:
+        if getattr(current_track, attribute) == getattr(old_original_track, attribute):
+            setattr(current_track, attribute, getattr(new_original_track, attribute))
+
+
+def refresh_old_tracks_bulk_setting(track_type, original_setting, current_setting):
+    # only the track ids whose tracks were added or removed are merged again, the user changes on the
+    # current setting are kept for every track id that still exists
+    tracks_index = GlobalSetting.VIDEO_TRACKS_INDEX
+    is_user_reordered = False
+    for track_id in current_setting.keys():
+        if track_id in original_setting and current_setting[track_id].order != original_setting[track_id].order:
+            is_user_reordered = True
+            break
+    for track_id in tracks_index.pop_touched_track_ids(track_type):
+        if not tracks_index.has_track_id(track_type, track_id):
+            original_setting.pop(track_id, None)
+            current_setting.pop(track_id, None)
+            continue
+        new_original_track = get_merged_old_track(track_type, track_id)
+        if track_id in original_setting and track_id in current_setting:
+            update_old_track_keeping_user_changes(current_track=current_setting[track_id],
+                                                  old_original_track=original_setting[track_id],
+                                                  new_original_track=new_original_track)
+            new_original_track.order = original_setting[track_id].order
         else:
-            temp_old_track_data.track_name = "[Old]"
-            temp_old_track_data.language = "[Old]"
-            tracks_bulk_data[track_id] = temp_old_track_data
-        tracks_bulk_data[track_id].is_enabled = convert_boolean_to_checked_value(tracks_bulk_data[track_id].is_enabled)
-        tracks_bulk_data[track_id].is_default = convert_boolean_to_checked_value(tracks_bulk_data[track_id].is_default)
-        tracks_bulk_data[track_id].is_forced = convert_boolean_to_checked_value(tracks_bulk_data[track_id].is_forced)
-        tracks_bulk_data[track_id].order = order_id
-    return tracks_bulk_data
+            current_setting[track_id] = copy.deepcopy(new_original_track)
+        original_setting[track_id] = new_original_track
+    ordered_track_ids = tracks_index.get_track_ids_in_videos_order(track_type,
+                                                                   GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST)
+    for order_id, track_id in enumerate(ordered_track_ids):
+        original_setting[track_id].order = order_id
+    if is_user_reordered:
+        current_ordered_track_ids = sorted((track_id for track_id in current_setting.keys()
+                                            if current_setting[track_id].order != -1),
+                                           key=lambda track_id: current_setting[track_id].order)
+        for track_id in ordered_track_ids:
+            if current_setting[track_id].order == -1:
+                current_ordered_track_ids.append(track_id)
+        for order_id, track_id in enumerate(current_ordered_track_ids):
+            current_setting[track_id].order = order_id
+    else:
+        for track_id in ordered_track_ids:
+            current_setting[track_id].order = original_setting[track_id].order
+
+
+def get_old_tracks_bulk_setting_state(original_setting, current_setting):
+    is_there_different_track_setting = False
+    is_there_deleted_tracks = False
+    is_there_reorder_tracks = False
+    for track_id in current_setting.keys():
+        if current_setting[track_id] != original_setting[track_id]:
+            is_there_different_track_setting = True
+        if not current_setting[track_id].is_enabled:
+            is_there_deleted_tracks = True
+        if current_setting[track_id].order != original_setting[track_id].order:
+            is_there_reorder_tracks = True
+    return is_there_different_track_setting, is_there_reorder_tracks, is_there_deleted_tracks
 
 
 def refresh_old_tracks_info(track_type):
     videos = GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST.copy()
     new_list: List[List[SingleOldTrackData]] = []
     for video_name in videos:
-        video_tracks: List[SingleOldTrackData] = []
-        string_name_hash = hashlib.sha1((str(video_name)).encode('utf-8')).hexdigest()
-        media_info_file_path = os.path.join(GlobalFiles.MediaInfoFolderPath, string_name_hash + ".json")
-        with open(media_info_file_path, 'r', encoding="UTF-8") as media_info_file:
-            json_info = json.load(media_info_file)
-        tracks_json_info = json_info["tracks"]
-        for track in tracks_json_info:
-            new_track: SingleOldTrackData = SingleOldTrackData()
-            if track["type"] == track_type:
-                new_track.id = str(track["id"])
-                language = str(
-                    get_attribute(data=track["properties"], attribute="language", default_value="UND"))
-                language_symbol = language.lower()
-                new_track.language = ISO_639_2_SYMBOLS.get(language_symbol, "Undetermined")
-                name = str(get_attribute(data=track["properties"], attribute="track_name",
-                                         default_value="UnNamedTrackBeBo"))
-                if name != "UnNamedTrackBeBo":
-                    new_track.track_name = name
-                new_track.is_default = get_attribute(data=track["properties"], attribute="default_track",
-                                                     default_value=False)
-                new_track.is_forced = get_attribute(data=track["properties"], attribute="forced_track",
-                                                    default_value=False)
-                new_track.is_enabled = True
-                new_track.uid = str(
-                    get_attribute(data=track["properties"], attribute="uid", default_value="-1"))
-                video_tracks.append(new_track)
-        new_list.append(video_tracks)
+        new_list.append(GlobalSetting.VIDEO_TRACKS_INDEX.get_video_tracks(video_name, track_type))
     if track_type == "audio":
         GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_INFO = new_list
-        GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING_ORIGINAL = refresh_old_tracks_info_as_bulk(
-            tracks_info=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_INFO)
-        GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING = copy.deepcopy(
-            GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING_ORIGINAL)
+        refresh_old_tracks_bulk_setting(track_type=track_type,
+                                        original_setting=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING_ORIGINAL,
+                                        current_setting=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING)
+        GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_MODIFIED_ACTIVATED, \
+            GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_REORDER_ACTIVATED, \
+            GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_DELETED_ACTIVATED = get_old_tracks_bulk_setting_state(
+                original_setting=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING_ORIGINAL,
+                current_setting=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING)
     elif track_type == "subtitles":
         GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_INFO = new_list
-        GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING_ORIGINAL = refresh_old_tracks_info_as_bulk(
-            tracks_info=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_INFO)
-        GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING = copy.deepcopy(
-            GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING_ORIGINAL)
+        refresh_old_tracks_bulk_setting(track_type=track_type,
+                                        original_setting=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING_ORIGINAL,
+                                        current_setting=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING)
+        GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_MODIFIED_ACTIVATED, \
+            GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_REORDER_ACTIVATED, \
+            GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_DELETED_ACTIVATED = get_old_tracks_bulk_setting_state(
+                original_setting=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING_ORIGINAL,
+                current_setting=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING)
     elif track_type == "video":
         GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_INFO = new_list
-        GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING_ORIGINAL = refresh_old_tracks_info_as_bulk(
-            tracks_info=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_INFO)
-        GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING = copy.deepcopy(
-            GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING_ORIGINAL)
+        refresh_old_tracks_bulk_setting(track_type=track_type,
+                                        original_setting=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING_ORIGINAL,
+                                        current_setting=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING)
+        GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_MODIFIED_ACTIVATED, \
+            GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_REORDER_ACTIVATED, \
+            GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_DELETED_ACTIVATED = get_old_tracks_bulk_setting_state(
+                original_setting=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING_ORIGINAL,
+                current_setting=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING)
 
 
-class GlobalSetting(QWidget):
+class GlobalSetting:
     LAST_DIRECTORY_PATH = ""
     VIDEO_SOURCE_PATHS = []
     VIDEO_FILES_LIST = []
@@ -239,6 +237,7 @@ class GlobalSetting(QWidget):
     VIDEO_FILES_ABSOLUTE_PATH_LIST = []
     VIDEO_SOURCE_MKV_ONLY = False
     VIDEO_DEFAULT_DURATION_FPS = ""
+    VIDEO_TRACKS_INDEX = VideoTracksIndex()
     VIDEO_OLD_TRACKS_VIDEOS_INFO: List[List[SingleOldTrackData]] = []
     VIDEO_OLD_TRACKS_AUDIOS_INFO: List[List[SingleOldTrackData]] = []
     VIDEO_OLD_TRACKS_SUBTITLES_INFO: List[List[SingleOldTrackData]] = []
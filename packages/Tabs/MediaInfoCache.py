@@ -0,0 +1,242 @@
+# Here we keep the `mkvmerge -J` output of every probed file, shared between the video tab and the muxing jobs
+# each probe is parsed once into a MediaInfoData kept in memory (the most recently used ones), and optionally
+# stored in one sqlite database that survives restarts, entries are keyed by the file path and validated against
+# the file size and modification time, so only new or changed files get probed again
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+from packages.Startup import GlobalFiles
+from packages.Startup.Options import Options
+from packages.Widgets.MediaInfoData import MediaInfoData
+
+MEDIA_INFO_CACHE_MAX_ENTRIES = 20000
+MEDIA_INFO_MEMORY_CACHE_MAX_ENTRIES = 4000
+MEDIA_INFO_CACHE_MAX_AGE = 90 * 24 * 60 * 60  # seconds since the entry was last used
+MEDIA_INFO_CACHE_TOUCH_INTERVAL = 60 * 60
+
+media_info_cache_lock = threading.Lock()
+media_info_cache_connection = None
+media_info_cache_disabled = False
+media_info_memory_cache = OrderedDict()  # cache key -> MediaInfoData, least recently used first
+media_info_memory_cache_lock = threading.Lock()
+
+
+def add_double_quotation(string):
+    return "\"" + str(string) + "\""
+
+
+def get_attribute(data, attribute, default_value):
+    return data.get(attribute) or default_value
+
+
+def check_if_valid_video_input(json_info):
+    tracks_json_info = get_attribute(json_info, "tracks", False)
+    if not tracks_json_info:
+        return False
+    is_valid_video = False
+    for track in tracks_json_info:
+        if get_attribute(track, "type", "not video") == "video":
+            is_valid_video = True
+            break
+    return is_valid_video
+
+
+# why mkvmerge couldn't identify the file from its `mkvmerge -J` output, "" when it could
+def get_probe_error(json_info):
+    if not json_info:
+        return "mkvmerge couldn't identify the file"
+    errors = [str(error) for error in get_attribute(json_info, "errors", [])]
+    if not get_attribute(get_attribute(json_info, "container", {}), "recognized", False):
+        return "; ".join(["mkvmerge doesn't recognize the file"] + errors)
+    if len(errors) > 0 and len(get_attribute(json_info, "tracks", [])) == 0:
+        return "; ".join(errors)
+    return ""
+
+
+def create_media_info_data(file_name, json_info, file_size, file_modified_time):
+    media_info = MediaInfoData()
+    media_info.file_name = file_name
+    media_info.file_size = file_size
+    media_info.modified_time = file_modified_time
+    media_info.is_valid_video = check_if_valid_video_input(json_info)
+    media_info.tracks = get_attribute(json_info, "tracks", [])
+    media_info.attachments = get_attribute(json_info, "attachments", [])
+    media_info.chapters = get_attribute(json_info, "chapters", [])
+    media_info.json_info = json_info
+    media_info.probe_error = get_probe_error(json_info)
+    return media_info
+
+
+def get_media_info_cache_key(file_name):
+    return os.path.normcase(os.path.abspath(str(file_name)))
+
+
+def get_file_size_and_modified_time(file_name):
+    try:
+        file_stat = os.stat(file_name)
+        return file_stat.st_size, file_stat.st_mtime_ns
+    except OSError:
+        return -1, -1
+
+
+def evict_old_media_info_entries(connection):
+    connection.execute("DELETE FROM media_info WHERE last_used < ?", (time.time() - MEDIA_INFO_CACHE_MAX_AGE,))
+    connection.execute("DELETE FROM media_info WHERE path NOT IN "
+                       "(SELECT path FROM media_info ORDER BY last_used DESC LIMIT ?)",
+                       (MEDIA_INFO_CACHE_MAX_ENTRIES,))
+    connection.commit()
+
+
+def open_media_info_cache():
+    connection = sqlite3.connect(GlobalFiles.MediaInfoCacheFilePath, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("CREATE TABLE IF NOT EXISTS media_info ("
+                       "path TEXT PRIMARY KEY, "
+                       "file_size INTEGER NOT NULL, "
+                       "modified_time INTEGER NOT NULL, "
+                       "info TEXT NOT NULL, "
+                       "last_used REAL NOT NULL)")
+    evict_old_media_info_entries(connection)
+    return connection
+
+
+def get_media_info_cache_connection():
+    # must be called while holding media_info_cache_lock
+    global media_info_cache_connection, media_info_cache_disabled
+    if media_info_cache_connection is None and not media_info_cache_disabled:
+        try:
+            media_info_cache_connection = open_media_info_cache()
+        except sqlite3.Error:
+            logging.error(traceback.format_exc())
+            media_info_cache_disabled = True
+    return media_info_cache_connection
+
+
+def read_media_info_entry(file_name, file_size, file_modified_time, keep_in_cache=True):
+    key = get_media_info_cache_key(file_name)
+    with media_info_cache_lock:
+        connection = get_media_info_cache_connection()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute("SELECT file_size, modified_time, info, last_used FROM media_info "
+                                     "WHERE path = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] != file_size or row[1] != file_modified_time:
+                if not keep_in_cache:
+                    return None
+                connection.execute("DELETE FROM media_info WHERE path = ?", (key,))
+                connection.commit()
+                return None
+            now = time.time()
+            if keep_in_cache and now - row[3] >= MEDIA_INFO_CACHE_TOUCH_INTERVAL:
+                connection.execute("UPDATE media_info SET last_used = ? WHERE path = ?", (now, key))
+                connection.commit()
+            info = row[2]
+        except sqlite3.Error:
+            logging.error(traceback.format_exc())
+            return None
+    try:
+        return create_media_info_data(file_name, json.loads(info), file_size, file_modified_time)
+    except ValueError:
+        return None
+
+
+def write_media_info_entry(media_info):
+    key = get_media_info_cache_key(media_info.file_name)
+    info = json.dumps(media_info.json_info)
+    with media_info_cache_lock:
+        connection = get_media_info_cache_connection()
+        if connection is None:
+            return
+        try:
+            connection.execute("INSERT OR REPLACE INTO media_info (path, file_size, modified_time, info, last_used) "
+                               "VALUES (?, ?, ?, ?, ?)",
+                               (key, media_info.file_size, media_info.modified_time, info, time.time()))
+            connection.commit()
+        except sqlite3.Error:
+            logging.error(traceback.format_exc())
+
+
+def get_remembered_media_info(key):
+    with media_info_memory_cache_lock:
+        media_info = media_info_memory_cache.get(key)
+        if media_info is not None:
+            media_info_memory_cache.move_to_end(key)
+        return media_info
+
+
+def remember_media_info(key, media_info):
+    # probes of big libraries would keep every file in memory, so only the most recently used ones are kept
+    with media_info_memory_cache_lock:
+        media_info_memory_cache[key] = media_info
+        media_info_memory_cache.move_to_end(key)
+        while len(media_info_memory_cache) > MEDIA_INFO_MEMORY_CACHE_MAX_ENTRIES:
+            media_info_memory_cache.popitem(last=False)
+
+
+def forget_media_info(key):
+    with media_info_memory_cache_lock:
+        media_info_memory_cache.pop(key, None)
+
+
+# keep_in_cache=False only reads the cache, the stale entries are left for the next normal read
+def get_cached_media_info(file_name, keep_in_cache=True):
+    file_size, file_modified_time = get_file_size_and_modified_time(file_name)
+    if file_size == -1:
+        return None
+    key = get_media_info_cache_key(file_name)
+    media_info = get_remembered_media_info(key)
+    if media_info is not None and media_info.file_size == file_size and \
+            media_info.modified_time == file_modified_time:
+        return media_info
+    media_info = None
+    if Options.Keep_Media_Info_Cache:
+        media_info = read_media_info_entry(file_name, file_size, file_modified_time, keep_in_cache)
+    if not keep_in_cache:
+        return media_info
+    if media_info is None:
+        forget_media_info(key)
+    else:
+        remember_media_info(key, media_info)
+    return media_info
+
+
+# keep_in_cache=False only identifies the file, like when validating the queue, nothing is stored
+def probe_media_info(file_name, keep_in_cache=True):
+    GlobalFiles.wait_for_tools_detection()
+    file_size, file_modified_time = get_file_size_and_modified_time(file_name)
+    command = add_double_quotation(GlobalFiles.MKVMERGE_PATH) + " -J " + add_double_quotation(file_name)
+    probe_process = subprocess.run(command, shell=True, stdout=subprocess.PIPE, env=GlobalFiles.ENVIRONMENT)
+    try:
+        json_info = json.loads(probe_process.stdout.decode("UTF-8", errors="replace"))
+    except ValueError:
+        json_info = {}
+    if not isinstance(json_info, dict):
+        json_info = {}
+    media_info = create_media_info_data(file_name, json_info, file_size, file_modified_time)
+    if not json_info:
+        media_info.probe_error = "mkvmerge -J failed with exit code " + str(probe_process.returncode)
+    # a failed probe is never kept, so the file is probed again the next time it's needed
+    if keep_in_cache and media_info.probe_error == "" and file_size != -1 and \
+            (file_size, file_modified_time) == get_file_size_and_modified_time(file_name):
+        remember_media_info(get_media_info_cache_key(file_name), media_info)
+        if Options.Keep_Media_Info_Cache:
+            write_media_info_entry(media_info)
+    return media_info
+
+
+def get_media_info(file_name, keep_in_cache=True):
+    media_info = get_cached_media_info(file_name, keep_in_cache)
+    if media_info is None:
+        media_info = probe_media_info(file_name, keep_in_cache)
+    return media_info
@@ -1,11 +1,12 @@
 import os
 import shutil
 import time
+from dataclasses import replace
 from os import makedirs
 from pathlib import Path
 from shutil import copy2
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QThread
 from PySide6.QtGui import QPaintEvent, QResizeEvent
 from PySide6.QtWidgets import (
     QVBoxLayout,
@@ -13,6 +14,8 @@ from PySide6.QtWidgets import (
     QFileDialog, QCheckBox, QLineEdit, QSizePolicy, QWidget, )
 
 from packages.Startup.Options import Options
+from packages.Tabs.AttachmentTab.Widgets.ScanAttachmentPathsWorker import get_attachment_paths_scans, \
+    is_scanning_attachment_paths
 from packages.Tabs.GlobalSetting import GlobalSetting, get_file_name_absolute_path, write_to_log_file, \
     get_readable_filesize
 from packages.Tabs.MuxSetting.Widgets.AudioTracksCheckableComboBox import AudioTracksCheckableComboBox
@@ -22,15 +25,20 @@ from packages.Tabs.MuxSetting.Widgets.JobQueueLayout import JobQueueLayout
 from packages.Tabs.MuxSetting.Widgets.MakeThisAudioDefaultCheckBox import MakeThisAudioDefaultCheckBox
 from packages.Tabs.MuxSetting.Widgets.MakeThisSubtitleDefaultCheckBox import MakeThisSubtitleDefaultCheckBox
 from packages.Tabs.MuxSetting.Widgets.MakeThisTrackDefaultComboBox import MakeThisTrackDefaultComboBox
+from packages.Tabs.MuxSetting.Widgets.MuxPlan import create_mux_plan
 from packages.Tabs.MuxSetting.Widgets.NoSpaceWarningDialog import NoSpaceWarningDialog
 from packages.Tabs.MuxSetting.Widgets.OnlyKeepThoseAudiosCheckBox import OnlyKeepThoseAudiosCheckBox
 from packages.Tabs.MuxSetting.Widgets.OnlyKeepThoseSubtitlesCheckBox import OnlyKeepThoseSubtitlesCheckBox
 from packages.Tabs.MuxSetting.Widgets.OverwriteFilesDialog import OverwriteFilesDialog
 from packages.Tabs.MuxSetting.Widgets.SubtitleTracksCheckableComboBox import SubtitleTracksCheckableComboBox
+from packages.Tabs.MuxSetting.Widgets.ValidateQueueWorker import ValidateQueueWorker, get_validation_report
+from packages.Tabs.WalkFolderWorker import is_walking_subfolders
 from packages.Widgets.ErrorMuxingDialog import ErrorMuxingDialog
 from packages.Widgets.FileNotFoundDialog import FileNotFoundDialog
+from packages.Widgets.InfoDialog import InfoDialog
 from packages.Widgets.InvalidPathDialog import *
 from packages.Widgets.NoSettingToApplyDialog import NoSettingToApplyDialog
+from packages.Widgets.WarningDialog import WarningDialog
 
 
 # noinspection PyAttributeOutsideInit
@@ -149,9 +157,12 @@ class MuxSettingTab(QWidget):
 
     def __init__(self):
         super().__init__()
+        self.is_validating_queue = False  # the validate button stays disabled until the running check reports
+        self.is_waiting_for_attachment_scans = False  # add to queue was clicked while attachment paths were scanned
         self.create_widgets()
         self.setup_widgets()
         self.connect_signals()
+        self.lock_muxing_until_tools_detected()
 
     def connect_signals(self):
         self.tab_clicked_signal.connect(self.tab_clicked)
@@ -170,10 +181,12 @@ class MuxSettingTab(QWidget):
             self.disable_make_this_subtitle_default_comboBox)
 
         self.control_queue_button.add_to_queue_clicked_signal.connect(self.add_to_queue_button_clicked)
+        get_attachment_paths_scans().all_scans_finished_signal.connect(self.attachment_paths_scans_finished)
         self.control_queue_button.start_multiplexing_clicked_signal.connect(self.start_multiplexing_button_clicked)
         self.control_queue_button.pause_multiplexing_clicked_signal.connect(self.pause_multiplexing_button_clicked)
 
         self.clear_job_queue_button.clicked.connect(self.clear_job_queue_button_clicked)
+        self.validate_queue_button.clicked.connect(self.validate_queue_button_clicked)
 
         self.only_keep_those_audios_multi_choose_comboBox.closeList.connect(self.only_keep_those_audios_close_list)
 
@@ -210,6 +223,7 @@ class MuxSettingTab(QWidget):
         self.setup_add_crc_checksum_checkBox()
         self.setup_remove_old_crc_checkBox()
         self.setup_clear_job_queue_button()
+        self.setup_validate_queue_button()
         self.setup_tool_tip_hint()
         self.setup_layouts()
 
@@ -247,6 +261,7 @@ class MuxSettingTab(QWidget):
         self.remove_old_crc_checksum_checkBox = QCheckBox()
         self.control_queue_button = ControlQueueButton()
         self.clear_job_queue_button = QPushButton()
+        self.validate_queue_button = QPushButton()
         self.mux_tools_layout_first_row = QHBoxLayout()
         self.mux_tools_layout_second_row = QHBoxLayout()
         self.job_queue_tools_layout = QHBoxLayout()
@@ -273,6 +288,7 @@ class MuxSettingTab(QWidget):
         self.mux_tools_layout_first_row.addWidget(self.add_crc_checksum_checkBox)
         self.mux_tools_layout_first_row.addWidget(self.abort_on_errors_checkBox, 1)
         # self.mux_tools_layout_first_row.addLayout(self.h1, 2)
+        self.mux_tools_layout_first_row.addWidget(self.validate_queue_button, stretch=0)
         self.mux_tools_layout_first_row.addWidget(self.clear_job_queue_button, stretch=0)
 
     def setup_mux_tools_layout_second_row(self):
@@ -288,6 +304,13 @@ class MuxSettingTab(QWidget):
         self.clear_job_queue_button.setIcon(GlobalIcons.CleanIcon)
         self.clear_job_queue_button.setDisabled(True)
 
+    def setup_validate_queue_button(self):
+        self.validate_queue_button.setText("Validate")
+        self.validate_queue_button.setIcon(GlobalIcons.TrueCheckIcon)
+        self.validate_queue_button.setToolTip("Check every job of the queue without muxing anything: input files, "
+                                              "tracks and output paths")
+        self.validate_queue_button.setDisabled(True)
+
     def setup_add_crc_checksum_checkBox(self):
         self.add_crc_checksum_checkBox.setText("Add CRC checksum")
         self.add_crc_checksum_checkBox.setToolTip("Add CRC checksum to the end of output file's name")
@@ -530,18 +553,52 @@ class MuxSettingTab(QWidget):
         self.make_this_subtitle_default_checkBox.set_tool_tip_hint_no_check()
         self.make_this_audio_default_checkBox.set_tool_tip_hint_no_check()
 
+    def lock_muxing_until_tools_detected(self):
+        if not GlobalFiles.ToolsDetected:
+            self.control_queue_button.setDisabled(True)
+            self.control_queue_button.setToolTip("<b>[Disabled]</b> Looking for mkvmerge and mkvpropedit")
+
+    def tools_detection_finished(self, error_message):
+        if error_message != "":
+            self.control_queue_button.setToolTip("<b>[Disabled]</b> mkvmerge or mkvpropedit is missing")
+            return
+        self.control_queue_button.setDisabled(False)
+        self.control_queue_button.setToolTip("")
+
     def add_to_queue_button_clicked(self):
+        if not GlobalFiles.ToolsDetected:
+            return
+        if is_walking_subfolders():
+            warning_dialog = WarningDialog(window_title="Files Still Loading",
+                                           info_message="Some subfolders are still being read, add the jobs to the "
+                                                        "queue when all their files are listed",
+                                           parent=self)
+            warning_dialog.execute()
+            return
+        if GlobalSetting.ATTACHMENT_EXPERT_MODE and is_scanning_attachment_paths():
+            # the jobs need the files of every attachment path, so the queue is set up once their scans are done
+            self.is_waiting_for_attachment_scans = True
+            self.control_queue_button.setDisabled(True)
+            return
         self.job_queue_layout.setup_queue()
         self.enable_muxing_setting()
         if not GlobalSetting.JOB_QUEUE_EMPTY:
             self.disable_editable_widgets()
             self.control_queue_button.set_state_start_multiplexing()
             self.clear_job_queue_button.setDisabled(False)
+            self.enable_validate_queue_button()
             change_global_LogFilePath()
         else:
             self.enable_editable_widgets()
             self.setup_enable_options_based_on_global_state()
 
+    def attachment_paths_scans_finished(self):
+        if not self.is_waiting_for_attachment_scans:
+            return
+        self.is_waiting_for_attachment_scans = False
+        self.control_queue_button.setDisabled(False)
+        self.add_to_queue_button_clicked()
+
     def tab_clicked(self):
         self.job_queue_layout.show_necessary_table_columns()
         self.setup_enable_options_based_on_global_state()
@@ -595,6 +652,7 @@ class MuxSettingTab(QWidget):
         self.job_queue_layout.clear_queue()
         self.control_queue_button.set_state_add_to_queue()
         self.clear_job_queue_button.setDisabled(True)
+        self.validate_queue_button.setDisabled(True)
         self.control_queue_button.setDisabled(False)
         GlobalSetting.JOB_QUEUE_FINISHED = False
         self.enable_editable_widgets()
@@ -602,6 +660,50 @@ class MuxSettingTab(QWidget):
         self.setup_enable_options_based_on_global_state()
         self.update_task_bar_clear_signal.emit()
 
+    def enable_validate_queue_button(self):
+        self.validate_queue_button.setEnabled(not self.is_validating_queue)
+
+    # noinspection PyAttributeOutsideInit
+    def validate_queue_button_clicked(self):
+        if self.is_validating_queue:
+            return
+        # the destination is only checked and saved when the muxing starts, so the plan takes the one in the line edit,
+        # an empty one means the source files will be overwritten, when mkvpropedit can do the changes the queue is
+        # checked for it since the muxing offers it first
+        destination_path = self.destination_path_lineEdit.text()
+        mux_plan = replace(create_mux_plan(),
+                           overwrite_source_files=destination_path == "" or destination_path.isspace(),
+                           destination_folder_path=destination_path,
+                           random_output_suffix=str(int(time.time())))
+        self.is_validating_queue = True
+        self.validate_queue_button.setDisabled(True)
+        self.validate_queue_thread = QThread()
+        # the queue can be cleared or set up again while it's checked, so the worker gets its own list of the jobs
+        self.validate_queue_worker = ValidateQueueWorker(list(self.job_queue_layout.table.data), mux_plan,
+                                                         use_mkvpropedit=check_if_mkvpropedit_can_be_used())
+        self.validate_queue_worker.moveToThread(self.validate_queue_thread)
+        self.validate_queue_thread.started.connect(self.validate_queue_worker.run)
+        self.validate_queue_worker.finished_validation_signal.connect(self.validate_queue_thread.quit)
+        self.validate_queue_worker.finished_validation_signal.connect(self.finished_validating_queue)
+        self.validate_queue_worker.finished_validation_signal.connect(self.validate_queue_worker.deleteLater)
+        self.validate_queue_thread.finished.connect(self.validate_queue_thread.deleteLater)
+        self.validate_queue_thread.start()
+
+    def finished_validating_queue(self):
+        results = self.validate_queue_worker.results
+        self.is_validating_queue = False
+        # the queue may have been started or cleared while it was checked
+        self.validate_queue_button.setEnabled(self.clear_job_queue_button.isEnabled() and
+                                              not GlobalSetting.JOB_QUEUE_FINISHED)
+        validation_report = get_validation_report(results, self.validate_queue_worker.validation_mode)
+        if any(len(result.errors) > 0 or len(result.warnings) > 0 for result in results):
+            validation_dialog = WarningDialog(window_title="Queue Validation", info_message=validation_report,
+                                              parent=self)
+        else:
+            validation_dialog = InfoDialog(window_title="Queue Validation", info_message=validation_report,
+                                           parent=self)
+        validation_dialog.execute()
+
     def disable_editable_widgets(self):
         self.only_keep_those_subtitles_checkBox.setEnabled(False)
         self.only_keep_those_subtitles_multi_choose_comboBox.setEnabled(False)
@@ -721,6 +823,7 @@ class MuxSettingTab(QWidget):
         self.job_queue_layout.start_muxing()
         self.start_muxing_signal.emit()
         self.clear_job_queue_button.setDisabled(True)
+        self.validate_queue_button.setDisabled(True)
 
     def check_if_want_to_keep_log_file(self):
         if GlobalSetting.MUX_SETTING_KEEP_LOG_FILE:
@@ -748,6 +851,7 @@ class MuxSettingTab(QWidget):
     def paused_done(self):
         self.control_queue_button.set_state_resume_multiplexing()
         self.clear_job_queue_button.setDisabled(False)
+        self.enable_validate_queue_button()
         self.control_queue_button.setDisabled(False)
         self.update_task_bar_paused_signal.emit()
 
@@ -756,6 +860,7 @@ class MuxSettingTab(QWidget):
         self.enable_muxing_setting()
         self.control_queue_button.set_state_start_multiplexing()
         self.clear_job_queue_button.setDisabled(False)
+        self.enable_validate_queue_button()
         change_global_LogFilePath()
 
     def finished_all_jobs(self):
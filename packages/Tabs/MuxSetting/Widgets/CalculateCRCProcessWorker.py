@@ -1,11 +1,17 @@
+import os
+import threading
 import traceback
 import zlib
 from os.path import getsize
 
-from PySide6.QtCore import Signal, QObject, QThread
+from PySide6.QtCore import Signal, QObject
 
 from packages.Tabs.GlobalSetting import write_to_log_file, GlobalSetting
 
+EBML_HEADER_ID = 0x1A45DFA3
+SEGMENT_ID = 0x18538067
+CLUSTER_ID = 0x1F43B675
+
 
 def get_file_name_with_mkv_extension(file_name):
     file_extension_start_index = file_name.rfind(".")
@@ -20,42 +26,238 @@ def get_file_name_extension_to_mkv_with_random_suffix(file_name):
     return new_file_name_with_mkv_extension
 
 
+def gf2_matrix_times(matrix, vector):
+    result = 0
+    i = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[i]
+        vector >>= 1
+        i += 1
+    return result
+
+
+def gf2_matrix_square(matrix):
+    return [gf2_matrix_times(matrix, matrix[n]) for n in range(32)]
+
+
+def crc32_combine(crc1, crc2, length2):
+    # same as zlib's crc32_combine(): crc of (data1 + data2) from crc(data1), crc(data2) and len(data2)
+    if length2 <= 0:
+        return crc1
+    odd = [0xEDB88320] + [1 << (n - 1) for n in range(1, 32)]
+    even = gf2_matrix_square(odd)
+    odd = gf2_matrix_square(even)
+    while True:
+        even = gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if length2 == 0:
+            break
+        odd = gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if length2 == 0:
+            break
+    return crc1 ^ crc2
+
+
+def get_ebml_variable_int_length(first_byte):
+    for length in range(1, 9):
+        if first_byte & (0x80 >> (length - 1)):
+            return length
+    return 0
+
+
+def read_ebml_element_header(file):
+    id_first_byte = file.read(1)
+    if len(id_first_byte) == 0:
+        return None
+    id_length = get_ebml_variable_int_length(id_first_byte[0])
+    if id_length == 0 or id_length > 4:
+        raise ValueError("Invalid EBML element id")
+    id_rest = file.read(id_length - 1)
+    size_first_byte = file.read(1)
+    if len(id_rest) != id_length - 1 or len(size_first_byte) == 0:
+        return None
+    size_length = get_ebml_variable_int_length(size_first_byte[0])
+    if size_length == 0:
+        raise ValueError("Invalid EBML element size")
+    size_rest = file.read(size_length - 1)
+    if len(size_rest) != size_length - 1:
+        return None
+    element_id = int.from_bytes(id_first_byte + id_rest, "big")
+    size_mask = (1 << (7 * size_length)) - 1
+    element_size = int.from_bytes(size_first_byte + size_rest, "big") & size_mask
+    if element_size == size_mask:
+        element_size = -1  # unknown size
+    return element_id, element_size
+
+
+def get_first_cluster_offset(file):
+    # mkvmerge only rewrites the elements placed before the first cluster (seek head, info, tracks...)
+    # when it finishes, everything from the first cluster onward is written once and only appended
+    try:
+        file.seek(0)
+        element = read_ebml_element_header(file)
+        if element is None:
+            return None
+        if element[0] != EBML_HEADER_ID or element[1] == -1:
+            raise ValueError("Not a matroska file")
+        file.seek(element[1], os.SEEK_CUR)
+        element = read_ebml_element_header(file)
+        if element is None:
+            return None
+        if element[0] != SEGMENT_ID:
+            raise ValueError("Not a matroska file")
+        while True:
+            element_start = file.tell()
+            element = read_ebml_element_header(file)
+            if element is None:
+                return None
+            if element[0] == CLUSTER_ID:
+                return element_start
+            if element[1] == -1:
+                raise ValueError("Unknown element size before first cluster")
+            file.seek(element[1], os.SEEK_CUR)
+    except ValueError:
+        return None
+
+
+def get_file_stat(file_name):
+    try:
+        file_stat = os.stat(file_name)
+    except OSError:
+        return None
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+
 class CalculateCRCProcessWorker(QObject):
-    crc_progress_signal = Signal(int)
-    crc_result_signal = Signal(str)
-    all_finished = Signal()
+    start_crc_signal = Signal(int, str)
+    start_inline_crc_signal = Signal(int, str)
+    crc_progress_signal = Signal(int, int)
+    crc_result_signal = Signal(int, str)
+    crc_failed_signal = Signal(int)
 
-    def __init__(self, file_name=""):
+    def __init__(self):
         super().__init__()
-        self.file_name = file_name
+        self.file_name = ""
+        self.job_index = -1
         self.progress = 0
         self.chunk_size = 65536
-        self.wait = True
-        self.stop = False
+        self.muxing_finished_events = {}  # job index -> threading.Event, set once its muxing process ends
+        self.cancelled_inline_crc_jobs = set()
+        self.inline_crc_output_files_names = {}  # job index -> output file name
+        self.muxing_finished_files_stats = {}  # job index -> (size, mtime) of the output when its muxing ended
+        self.start_crc_signal.connect(self.run)
+        self.start_inline_crc_signal.connect(self.run_inline)
 
-    def run(self):
+    def get_output_file_name(self, file_name=None):
+        if file_name is None:
+            file_name = self.file_name
+        if GlobalSetting.OVERWRITE_SOURCE_FILES:
+            return get_file_name_extension_to_mkv_with_random_suffix(file_name)
+        else:
+            return get_file_name_with_mkv_extension(file_name)
+
+    def run(self, job_index, file_name):
+        self.job_index = job_index
+        self.file_name = file_name
+        self.progress = 0
         try:
-            while not self.stop:
-                if not self.wait:
-                    if GlobalSetting.OVERWRITE_SOURCE_FILES:
-                        file_name = get_file_name_extension_to_mkv_with_random_suffix(self.file_name)
-                    else:
-                        file_name = get_file_name_with_mkv_extension(self.file_name)
-                    file_size = getsize(file_name)
-                    with open(file_name, "rb") as f:
-                        checksum = 0
-                        current_read = 0
-                        current_percent = 0
-                        while chunk := f.read(self.chunk_size):
-                            current_read += self.chunk_size
-                            current_percent = int(min(100 * current_read / file_size, 100))
-                            self.crc_progress_signal.emit(current_percent)
-                            checksum = zlib.crc32(chunk, checksum)
-                        crc_string = format(checksum & 0xFFFFFFFF, '08x').upper()
-                        self.crc_result_signal.emit(crc_string)
-                    self.wait = True
-                else:
-                    QThread.msleep(50)
-            self.all_finished.emit()
+            crc_string = self.calculate_file_crc(self.get_output_file_name())
+            self.crc_result_signal.emit(self.job_index, crc_string)
+        except Exception as e:
+            write_to_log_file(traceback.format_exc())
+            self.crc_failed_signal.emit(self.job_index)
+
+    def add_inline_crc_job(self, job_index, file_name):
+        self.muxing_finished_events[job_index] = threading.Event()
+        self.inline_crc_output_files_names[job_index] = self.get_output_file_name(file_name)
+
+    def finish_inline_crc_job(self, job_index, cancel):
+        if cancel:
+            self.cancelled_inline_crc_jobs.add(job_index)
+        else:
+            self.muxing_finished_files_stats[job_index] = get_file_stat(
+                self.inline_crc_output_files_names[job_index])
+        self.muxing_finished_events[job_index].set()
+
+    def is_inline_crc_cancelled(self):
+        return self.job_index in self.cancelled_inline_crc_jobs
+
+    def run_inline(self, job_index, file_name):
+        self.job_index = job_index
+        self.file_name = file_name
+        self.progress = 0
+        try:
+            file_name = self.get_output_file_name()
+            crc_string = self.follow_growing_file_crc(file_name, self.muxing_finished_events[job_index])
+            if crc_string != "" and get_file_stat(file_name) != self.muxing_finished_files_stats.get(job_index):
+                # the output was touched after its muxing ended, the folded checksum may not match it anymore
+                crc_string = ""
+            if not self.is_inline_crc_cancelled():
+                if crc_string == "":
+                    crc_string = self.calculate_file_crc(file_name)
+                self.crc_result_signal.emit(self.job_index, crc_string)
         except Exception as e:
             write_to_log_file(traceback.format_exc())
+            if not self.is_inline_crc_cancelled():
+                self.crc_failed_signal.emit(self.job_index)
+        self.muxing_finished_events.pop(job_index, None)
+        self.inline_crc_output_files_names.pop(job_index, None)
+        self.muxing_finished_files_stats.pop(job_index, None)
+        self.cancelled_inline_crc_jobs.discard(job_index)
+
+    def calculate_file_crc(self, file_name):
+        file_size = getsize(file_name)
+        with open(file_name, "rb") as f:
+            checksum = 0
+            current_read = 0
+            current_percent = 0
+            while chunk := f.read(self.chunk_size):
+                current_read += self.chunk_size
+                current_percent = int(min(100 * current_read / file_size, 100))
+                if current_percent != self.progress:
+                    self.progress = current_percent
+                    self.crc_progress_signal.emit(self.job_index, current_percent)
+                checksum = zlib.crc32(chunk, checksum)
+            return format(checksum & 0xFFFFFFFF, '08x').upper()
+
+    def follow_growing_file_crc(self, file_name, muxing_finished):
+        while not os.path.isfile(file_name):
+            if muxing_finished.wait(0.05):
+                return ""
+        with open(file_name, "rb") as f:
+            first_cluster_offset = None
+            while first_cluster_offset is None:
+                muxing_done = muxing_finished.is_set()
+                first_cluster_offset = get_first_cluster_offset(f)
+                if first_cluster_offset is None:
+                    if muxing_done:
+                        return ""
+                    muxing_finished.wait(0.1)
+            f.seek(first_cluster_offset)
+            tail_checksum = 0
+            tail_size = 0
+            while True:
+                muxing_done = muxing_finished.is_set()
+                chunk = f.read(self.chunk_size)
+                if chunk:
+                    tail_checksum = zlib.crc32(chunk, tail_checksum)
+                    tail_size += len(chunk)
+                elif muxing_done:
+                    break
+                else:
+                    muxing_finished.wait(0.05)
+            if self.is_inline_crc_cancelled():
+                return ""
+            if get_first_cluster_offset(f) != first_cluster_offset or \
+                    getsize(file_name) != first_cluster_offset + tail_size:
+                return ""
+            f.seek(0)
+            head_checksum = zlib.crc32(f.read(first_cluster_offset))
+        checksum = crc32_combine(head_checksum, tail_checksum, tail_size)
+        return format(checksum & 0xFFFFFFFF, '08x').upper()
@@ -0,0 +1,29 @@
+# Here we write the arguments of a muxing job to the option file mkvmerge and mkvpropedit read with "@file", it's a json
+# array of strings, so json.dumps does the quoting and escaping of every argument, whatever characters a path has
+# A path that can't be passed to the tools at all is reported before the job is muxed instead of failing in the middle
+import json
+
+
+def get_malformed_path_error(path):
+    if path == "" or path.isspace():
+        return "Empty file path"
+    if "\0" in path:
+        return "File path has a null character: " + path.replace("\0", "")
+    try:
+        path.encode("UTF-8")
+    except UnicodeEncodeError:
+        return "File path has characters that can't be written in UTF-8: " + \
+               path.encode("UTF-8", errors="replace").decode("UTF-8")
+    return ""
+
+
+def check_paths(paths):
+    for path in paths:
+        error = get_malformed_path_error(path)
+        if error != "":
+            raise ValueError(error)
+
+
+def write_options_file(file_path, arguments):
+    with open(file_path, 'w+', encoding="UTF-8") as options_file:
+        options_file.write(json.dumps(arguments, ensure_ascii=False, indent=2))
@@ -0,0 +1,116 @@
+from PySide6 import QtGui
+from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem, QStyleOptionProgressBar, QApplication
+
+from packages.Startup.Options import Options
+from packages.Tabs.MuxSetting.Widgets.JobQueueModel import JOB_QUEUE_COLUMNS
+
+LEFT_TO_RIGHT_MARK = chr(0x200E)
+SPINNER_SIZE = 26
+
+
+def combine_colors(first_color, second_color, factor):
+    new_color = QtGui.QColor()
+    new_color.setRed((first_color.red() + second_color.red()) // factor)
+    new_color.setGreen((first_color.green() + second_color.green()) // factor)
+    new_color.setBlue((first_color.blue() + second_color.blue()) // factor)
+    return new_color
+
+
+# Paints every job queue cell, the name is elided to the column width here and the status, icons and progress
+# are drawn directly instead of having a widget in each cell
+class JobQueueDelegate(QStyledItemDelegate):
+    color_default = QtGui.QColor("#aaedff")  # aaedff: blue Kashef
+
+    def __init__(self, spinner_movie, parent=None):
+        super().__init__(parent)
+        self.spinner_movie = spinner_movie
+
+    def paint(self, painter, option, index):
+        column_name = JOB_QUEUE_COLUMNS[index.column()]
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        self.set_selected_colors(option, index)
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        if column_name == "Name":
+            text_width = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, option, widget).width()
+            option.text = LEFT_TO_RIGHT_MARK + option.fontMetrics.elidedText(
+                index.data(), Qt.TextElideMode.ElideRight, text_width)
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, widget)
+            return
+        if column_name in ["Size Before", "Size After"]:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, widget)
+            return
+        # draw the cell background only, then its content on top
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        status_text = index.data() if column_name == "Status" else None
+        progress = index.data() if column_name == "Progress" else 0
+        option.text = ""
+        option.icon = QtGui.QIcon()
+        option.features &= ~QStyleOptionViewItem.ViewItemFeature.HasDecoration
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, widget)
+        if column_name == "Progress":
+            self.paint_progress(painter, option, progress, style, widget)
+        elif status_text is not None:
+            self.paint_running_status(painter, option, status_text)
+        elif icon is not None:
+            self.paint_icon(painter, option, icon)
+
+    def set_selected_colors(self, option, index):
+        if not option.state & QStyle.StateFlag.State_Selected:
+            return
+        option.palette.setColor(QPalette.ColorRole.HighlightedText, option.palette.color(QPalette.ColorRole.Text))
+        if option.widget is not None and option.widget.alternatingRowColors() and index.row() % 2 == 1:
+            background_color = option.palette.color(QPalette.ColorRole.AlternateBase)
+        else:
+            background_color = option.palette.color(QPalette.ColorRole.Base)
+        if Options.Dark_Mode:
+            color = combine_colors(self.color_default, background_color, 3)
+        else:
+            color = combine_colors(self.color_default, background_color, 2)
+        option.palette.setColor(QPalette.ColorRole.Highlight, color)
+
+    @staticmethod
+    def paint_icon(painter, option, icon):
+        icon_rect = QRect(0, 0, icon.width(), icon.height())
+        icon_rect.moveCenter(option.rect.center())
+        painter.save()
+        painter.setClipRect(option.rect)
+        painter.drawPixmap(icon_rect, icon)
+        painter.restore()
+
+    def paint_running_status(self, painter, option, status_text):
+        # same layout as the old status widget: spinner then the text, centered a bit to the left
+        text = "  " + str(status_text)
+        text_width = option.fontMetrics.horizontalAdvance(text)
+        content_width = SPINNER_SIZE + text_width
+        left = option.rect.left() + max(0, (option.rect.width() - content_width) * 2 // 5)
+        spinner_rect = QRect(left, option.rect.center().y() - SPINNER_SIZE // 2, SPINNER_SIZE, SPINNER_SIZE)
+        text_rect = QRect(left + SPINNER_SIZE, option.rect.top(), text_width, option.rect.height())
+        painter.save()
+        painter.setClipRect(option.rect)
+        painter.drawPixmap(spinner_rect, self.spinner_movie.currentPixmap())
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+        painter.restore()
+
+    @staticmethod
+    def paint_progress(painter, option, progress, style, widget):
+        progress_option = QStyleOptionProgressBar()
+        progress_option.rect = option.rect
+        progress_option.palette = option.palette
+        progress_option.state = option.state | QStyle.StateFlag.State_Horizontal
+        progress_option.minimum = 0
+        progress_option.maximum = 100
+        progress_option.progress = int(progress)
+        progress_option.textVisible = False
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, progress_option, painter, widget)
+
+    def sizeHint(self, option, index):
+        size_hint = super().sizeHint(option, index)
+        column_name = JOB_QUEUE_COLUMNS[index.column()]
+        if column_name == "Status" and index.data() is not None:
+            return QSize(SPINNER_SIZE + option.fontMetrics.horizontalAdvance("  CRC: 100"), size_hint.height())
+        return size_hint
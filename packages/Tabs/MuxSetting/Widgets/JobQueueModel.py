@@ -0,0 +1,241 @@
+# Here the job queue table reads its rows straight from the jobs list, nothing is created per row so only the visible
+# rows cost anything when painting
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QPixmap
+
+from packages.Startup import GlobalFiles
+from packages.Startup.Options import Options
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+
+JOB_QUEUE_COLUMNS = ["Name", "Status", "Audio", "Subtitle", "Chapter", "Size Before", "Progress", "Size After"]
+JOB_QUEUE_COLUMNS_ALIGNMENT = {
+    "Name": Qt.AlignmentFlag.AlignLeft,
+    "Status": Qt.AlignmentFlag.AlignCenter,
+    "Audio": Qt.AlignmentFlag.AlignCenter,
+    "Subtitle": Qt.AlignmentFlag.AlignCenter,
+    "Chapter": Qt.AlignmentFlag.AlignCenter,
+    "Size Before": Qt.AlignmentFlag.AlignLeft,
+    "Progress": Qt.AlignmentFlag.AlignLeft,
+    "Size After": Qt.AlignmentFlag.AlignLeft,
+}
+
+
+def generate_tool_tip_for_chapter_file(chapter_full_path="C:/Test", chapter_name="Test", show_full_path=True):
+    if show_full_path:
+        return (
+                "Chapter Full Path: " + str(chapter_full_path) +
+                "\nChapter Name: " + str(chapter_name) +
+                "\nDouble click for more details")
+    else:
+        return ("Chapter Name: " + str(chapter_name) +
+                "\nDouble click for more details")
+
+
+def generate_tool_tip_for_audio_file(audio_full_path="C:/Test", audio_name="Test",
+                                     audio_delay=0.0, audio_language=Options.CurrentPreset.Default_Audio_Language,
+                                     audio_track_name="Test",
+                                     audio_set_default=False, audio_set_forced=False,
+                                     show_full_path=False):
+    if show_full_path:
+        return (
+                "Audio Full Path: " + str(audio_full_path) +
+                "\nAudio Name: " + str(audio_name) +
+                "\nAudio Delay: " + str(audio_delay) + "s" +
+                "\nAudio Language: " + str(audio_language) +
+                "\nAudio Track Name: " + str(audio_track_name) +
+                "\nSet Default: " + str(audio_set_default) +
+                "\nSet Forced: " + str(audio_set_forced) +
+                "\nDouble click for more details")
+    else:
+        return (
+                "Audio Name: " + str(audio_name) +
+                "\nAudio Delay: " + str(audio_delay) + "s" +
+                "\nAudio Language: " + str(audio_language) +
+                "\nAudio Track Name: " + str(audio_track_name) +
+                "\nSet Default: " + str(audio_set_default) +
+                "\nSet Forced: " + str(audio_set_forced) +
+                "\nDouble click for more details")
+
+
+def generate_tool_tip_for_subtitle_file(subtitle_full_path="C:/Test", subtitle_name="Test",
+                                        subtitle_delay=0.0,
+                                        subtitle_language=Options.CurrentPreset.Default_Subtitle_Language,
+                                        subtitle_track_name="Test",
+                                        subtitle_set_default=False, subtitle_set_forced=False,
+                                        show_full_path=False):
+    if show_full_path:
+        return (
+                "Subtitle Full Path: " + str(subtitle_full_path) +
+                "\nSubtitle Name: " + str(subtitle_name) +
+                "\nSubtitle Delay: " + str(subtitle_delay) + "s" +
+                "\nSubtitle Language: " + str(subtitle_language) +
+                "\nSubtitle Track Name: " + str(subtitle_track_name) +
+                "\nSet Default: " + str(subtitle_set_default) +
+                "\nSet Forced: " + str(subtitle_set_forced) +
+                "\nDouble click for more details")
+    else:
+        return (
+                "Subtitle Name: " + str(subtitle_name) +
+                "\nSubtitle Delay: " + str(subtitle_delay) + "s" +
+                "\nSubtitle Language: " + str(subtitle_language) +
+                "\nSubtitle Track Name: " + str(subtitle_track_name) +
+                "\nSet Default: " + str(subtitle_set_default) +
+                "\nSet Forced: " + str(subtitle_set_forced) +
+                "\nDouble click for more details")
+
+
+def get_subtitle_tool_tip(job: SingleJobData):
+    if len(job.subtitle_name) == 0:
+        return "No Subtitle File"
+    if len(job.subtitle_name) > 1:
+        return "Multiple Subtitles\nDouble click for more details"
+    return generate_tool_tip_for_subtitle_file(subtitle_full_path=job.subtitle_name_absolute[0],
+                                               subtitle_name=job.subtitle_name[0],
+                                               subtitle_delay=job.subtitle_delay[0],
+                                               subtitle_language=job.subtitle_language[0],
+                                               subtitle_track_name=job.subtitle_track_name[0],
+                                               subtitle_set_default=job.subtitle_set_default[0],
+                                               subtitle_set_forced=job.subtitle_set_forced[0],
+                                               show_full_path=False)
+
+
+def get_audio_tool_tip(job: SingleJobData):
+    if len(job.audio_name) == 0:
+        return "No Audio File"
+    if len(job.audio_name) > 1:
+        return "Multiple Audios\nDouble click for more details"
+    return generate_tool_tip_for_audio_file(audio_full_path=job.audio_name_absolute[0],
+                                            audio_name=job.audio_name[0],
+                                            audio_delay=job.audio_delay[0],
+                                            audio_language=job.audio_language[0],
+                                            audio_track_name=job.audio_track_name[0],
+                                            audio_set_default=job.audio_set_default[0],
+                                            audio_set_forced=job.audio_set_forced[0],
+                                            show_full_path=False)
+
+
+def get_chapter_tool_tip(job: SingleJobData):
+    if not job.chapter_found:
+        return "No Chapter File"
+    return generate_tool_tip_for_chapter_file(chapter_full_path=job.chapter_name_absolute,
+                                              chapter_name=job.chapter_name,
+                                              show_full_path=False)
+
+
+class JobQueueModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = []  # type: list[SingleJobData]
+        self.running_jobs_status = {}  # job index -> status text shown next to the spinner
+        self.column_ids = {column_name: column_id for column_id, column_name in enumerate(JOB_QUEUE_COLUMNS)}
+        self.info_icon = QPixmap(GlobalFiles.InfoIconPath)
+        self.info_with_options_icon = QPixmap(GlobalFiles.InfoSettingIconPath)
+        self.warning_icon = QPixmap(GlobalFiles.WarningCheckIconPath)
+        self.ok_icon = QPixmap(GlobalFiles.TrueCheckIconPath)
+        self.error_icon = QPixmap(GlobalFiles.ErrorIconPath)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(JOB_QUEUE_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return JOB_QUEUE_COLUMNS[section]
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return JOB_QUEUE_COLUMNS_ALIGNMENT[JOB_QUEUE_COLUMNS[section]]
+        else:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return str(section + 1)
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self.jobs[index.row()]
+        column_name = JOB_QUEUE_COLUMNS[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.get_display_data(index.row(), job, column_name)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.get_icon(index.row(), job, column_name)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.get_tool_tip(index.row(), job, column_name)
+        return None
+
+    def get_display_data(self, job_index, job: SingleJobData, column_name):
+        if column_name == "Name":
+            return job.video_name_with_spaces
+        if column_name == "Status":
+            return self.running_jobs_status.get(job_index)
+        if column_name == "Size Before":
+            return job.size_before_muxing
+        if column_name == "Progress":
+            return job.progress
+        if column_name == "Size After":
+            return job.size_after_muxing
+        return None
+
+    def get_icon(self, job_index, job: SingleJobData, column_name):
+        if column_name == "Status":
+            if job_index in self.running_jobs_status or not job.done:
+                return None
+            if job.error_occurred:
+                return self.error_icon
+            return self.ok_icon
+        if column_name == "Audio":
+            return self.info_with_options_icon if job.audio_found else self.warning_icon
+        if column_name == "Subtitle":
+            return self.info_with_options_icon if job.subtitle_found else self.warning_icon
+        if column_name == "Chapter":
+            return self.info_icon if job.chapter_found else self.warning_icon
+        return None
+
+    def get_tool_tip(self, job_index, job: SingleJobData, column_name):
+        if column_name == "Name":
+            return job.video_name
+        if column_name == "Status":
+            if job_index in self.running_jobs_status or not job.done:
+                return None
+            if job.error_occurred:
+                return "Error Happened\nDouble click for more details"
+            return "Done"
+        if column_name == "Audio":
+            return get_audio_tool_tip(job)
+        if column_name == "Subtitle":
+            return get_subtitle_tool_tip(job)
+        if column_name == "Chapter":
+            return get_chapter_tool_tip(job)
+        return None
+
+    def set_jobs(self, jobs):
+        self.beginResetModel()
+        self.jobs = jobs
+        self.running_jobs_status = {}
+        self.endResetModel()
+
+    def update_job(self, job_index, column_name=None):
+        if column_name is None:
+            self.dataChanged.emit(self.index(job_index, 0), self.index(job_index, len(JOB_QUEUE_COLUMNS) - 1))
+        else:
+            column_index = self.index(job_index, self.column_ids[column_name])
+            self.dataChanged.emit(column_index, column_index)
+
+    def set_job_running_status(self, job_index, status_text):
+        self.running_jobs_status[job_index] = status_text
+        self.update_job(job_index, "Status")
+
+    def stop_job_running_status(self, job_index):
+        self.running_jobs_status.pop(job_index, None)
+        self.update_job(job_index, "Status")
+
+    def update_running_jobs_status(self):
+        for job_index in self.running_jobs_status.keys():
+            self.update_job(job_index, "Status")
@@ -0,0 +1,7 @@
+class JobValidationResult:
+    def __init__(self):
+        self.index = 0
+        self.video_name = ""
+        self.output_video_absolute_path = ""
+        self.errors = []  # the job would fail or must not be muxed like this
+        self.warnings = []  # the job would be muxed, but maybe not the way it was meant to be
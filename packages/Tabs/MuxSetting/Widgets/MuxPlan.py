@@ -0,0 +1,212 @@
+# Here we compile the mux settings that are the same for every job of the queue once, when the muxing starts, so the
+# mkvmerge and mkvpropedit job builders only have to bind the track ids and the paths of each video
+# the plan is frozen once it's built and only holds strings, numbers and tuples, so it can be shared between threads
+# or sent to other processes as is, a plan with other settings is made with dataclasses.replace
+import operator
+from dataclasses import dataclass
+
+from packages.Startup.PreDefined import ISO_639_2_LANGUAGES
+from packages.Tabs.GlobalSetting import GlobalSetting
+
+
+def delete_trailing_zero_string(string):
+    return str(int(str(string)))
+
+
+def increase_id_by_one(string):
+    return str(int(string) + 1)
+
+
+# "Track Id: [02]" -> ("id", "2"), "Language: [English]" -> ("lang", "eng"), "Track Name: [Signs]" -> ("name", "Signs")
+def get_chosen_track(track):
+    left_bracket_index = track.find("[")
+    right_bracket_index = track.rfind("]")
+    value = track[left_bracket_index + 1:right_bracket_index]
+    if track.find("Track Id: [") == 0:
+        return "id", delete_trailing_zero_string(value)
+    elif track.find("Language: [") == 0:
+        return "lang", ISO_639_2_LANGUAGES[value]
+    elif track.find("Track Name: [") == 0:
+        return "name", value
+    return "", ""
+
+
+def get_enabled_tracks_ids(bulk_setting):
+    return tuple(bulk_track.id for bulk_track in bulk_setting.values() if bulk_track.is_enabled)
+
+
+def get_ordered_tracks_ids(bulk_setting):
+    return tuple(bulk_track.id for bulk_track in sorted(bulk_setting.values(), key=operator.attrgetter('order'))
+                 if bulk_track.is_enabled)
+
+
+# (track id, mkvmerge options) of each enabled track that gets modified
+def get_mkvmerge_old_tracks_options(bulk_setting):
+    tracks_options = []
+    for track_id, bulk_track in bulk_setting.items():
+        if not bulk_track.is_enabled:
+            continue
+        options = []
+        if bulk_track.language != "[Old]":
+            options.extend(("--language", f"{track_id}:" + ISO_639_2_LANGUAGES[bulk_track.language]))
+        if bulk_track.track_name != "[Old]":
+            options.extend(("--track-name", f"{track_id}:" + bulk_track.track_name))
+        if bulk_track.is_default == 2:
+            options.extend(("--default-track-flag", f"{track_id}:yes"))
+        elif bulk_track.is_default == 0:
+            options.extend(("--default-track-flag", f"{track_id}:no"))
+        if bulk_track.is_forced == 2:
+            options.extend(("--forced-display-flag", f"{track_id}:yes"))
+        elif bulk_track.is_forced == 0:
+            options.extend(("--forced-display-flag", f"{track_id}:no"))
+        tracks_options.append((bulk_track.id, tuple(options)))
+    return tuple(tracks_options)
+
+
+# (track id, mkvpropedit options) of each track that gets modified, mkvpropedit counts the tracks from 1
+def get_mkvpropedit_old_tracks_options(bulk_setting):
+    tracks_options = []
+    for bulk_track in bulk_setting.values():
+        edit_track = ("--edit", "track:" + increase_id_by_one(bulk_track.id), "--set")
+        options = []
+        if bulk_track.language != "[Old]":
+            options.extend(edit_track + (f"language={ISO_639_2_LANGUAGES[bulk_track.language]}",))
+        if bulk_track.track_name != "[Old]":
+            options.extend(edit_track + (f"name={bulk_track.track_name}",))
+        if bulk_track.is_default == 2:
+            options.extend(edit_track + ("flag-default=1",))
+        elif bulk_track.is_default == 0:
+            options.extend(edit_track + ("flag-default=0",))
+        if bulk_track.is_forced == 2:
+            options.extend(edit_track + ("flag-forced=1",))
+        elif bulk_track.is_forced == 0:
+            options.extend(edit_track + ("flag-forced=0",))
+        tracks_options.append((bulk_track.id, tuple(options)))
+    return tuple(tracks_options)
+
+
+@dataclass(frozen=True)
+class MuxPlan:
+    subtitle_enabled: bool
+    audio_enabled: bool
+    chapter_enabled: bool
+    chapter_discard_old: bool
+    overwrite_source_files: bool
+    destination_folder_path: str
+    random_output_suffix: str
+    video_default_duration_fps: str
+
+    old_videos_modified_activated: bool
+    old_videos_reorder_activated: bool
+    old_videos_deleted_activated: bool
+    old_subtitles_modified_activated: bool
+    old_subtitles_reorder_activated: bool
+    old_subtitles_deleted_activated: bool
+    old_audios_modified_activated: bool
+    old_audios_reorder_activated: bool
+    old_audios_deleted_activated: bool
+    old_videos_enabled_ids: tuple
+    old_subtitles_enabled_ids: tuple
+    old_audios_enabled_ids: tuple
+    old_videos_ordered_ids: tuple
+    old_subtitles_ordered_ids: tuple
+    old_audios_ordered_ids: tuple
+    old_videos_mkvmerge_options: tuple
+    old_subtitles_mkvmerge_options: tuple
+    old_audios_mkvmerge_options: tuple
+    old_videos_mkvpropedit_options: tuple
+    old_subtitles_mkvpropedit_options: tuple
+    old_audios_mkvpropedit_options: tuple
+
+    only_keep_those_subtitles_enabled: bool
+    only_keep_those_subtitles_ids: tuple
+    only_keep_those_subtitles_names: tuple
+    only_keep_those_subtitles_languages: tuple
+    only_keep_those_audios_enabled: bool
+    only_keep_those_audios_ids: tuple
+    only_keep_those_audios_names: tuple
+    only_keep_those_audios_languages: tuple
+
+    make_this_subtitle_default_semi_enabled: bool
+    make_this_subtitle_default_full_enabled: bool
+    make_this_subtitle_default_track: str
+    make_this_subtitle_default_chosen_track: tuple
+    make_this_audio_default_semi_enabled: bool
+    make_this_audio_default_full_enabled: bool
+    make_this_audio_default_track: str
+    make_this_audio_default_chosen_track: tuple
+
+
+# the chosen track is only parsed when it names one, "" makes no track default and only spaces keep them
+def get_make_default_chosen_track(track):
+    if track.strip() != "":
+        return get_chosen_track(track)
+    return "", ""
+
+
+def create_mux_plan():
+    video_default_duration_fps = ""
+    if GlobalSetting.VIDEO_DEFAULT_DURATION_FPS not in ["", "Default"]:
+        video_default_duration_fps = GlobalSetting.VIDEO_DEFAULT_DURATION_FPS
+    return MuxPlan(
+        subtitle_enabled=GlobalSetting.SUBTITLE_ENABLED,
+        audio_enabled=GlobalSetting.AUDIO_ENABLED,
+        chapter_enabled=GlobalSetting.CHAPTER_ENABLED,
+        chapter_discard_old=GlobalSetting.CHAPTER_DISCARD_OLD,
+        overwrite_source_files=GlobalSetting.OVERWRITE_SOURCE_FILES,
+        destination_folder_path=GlobalSetting.DESTINATION_FOLDER_PATH,
+        random_output_suffix=GlobalSetting.RANDOM_OUTPUT_SUFFIX,
+        video_default_duration_fps=video_default_duration_fps,
+
+        old_videos_modified_activated=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_MODIFIED_ACTIVATED,
+        old_videos_reorder_activated=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_REORDER_ACTIVATED,
+        old_videos_deleted_activated=GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_DELETED_ACTIVATED,
+        old_subtitles_modified_activated=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_MODIFIED_ACTIVATED,
+        old_subtitles_reorder_activated=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_REORDER_ACTIVATED,
+        old_subtitles_deleted_activated=GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_DELETED_ACTIVATED,
+        old_audios_modified_activated=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_MODIFIED_ACTIVATED,
+        old_audios_reorder_activated=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_REORDER_ACTIVATED,
+        old_audios_deleted_activated=GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_DELETED_ACTIVATED,
+        old_videos_enabled_ids=get_enabled_tracks_ids(GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING),
+        old_subtitles_enabled_ids=get_enabled_tracks_ids(GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING),
+        old_audios_enabled_ids=get_enabled_tracks_ids(GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING),
+        old_videos_ordered_ids=get_ordered_tracks_ids(GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING),
+        old_subtitles_ordered_ids=get_ordered_tracks_ids(GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING),
+        old_audios_ordered_ids=get_ordered_tracks_ids(GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING),
+        old_videos_mkvmerge_options=get_mkvmerge_old_tracks_options(
+            GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING),
+        old_subtitles_mkvmerge_options=get_mkvmerge_old_tracks_options(
+            GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING),
+        old_audios_mkvmerge_options=get_mkvmerge_old_tracks_options(
+            GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING),
+        old_videos_mkvpropedit_options=get_mkvpropedit_old_tracks_options(
+            GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_BULK_SETTING),
+        old_subtitles_mkvpropedit_options=get_mkvpropedit_old_tracks_options(
+            GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_BULK_SETTING),
+        old_audios_mkvpropedit_options=get_mkvpropedit_old_tracks_options(
+            GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_BULK_SETTING),
+
+        only_keep_those_subtitles_enabled=GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_ENABLED,
+        only_keep_those_subtitles_ids=tuple(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_TRACKS_IDS),
+        only_keep_those_subtitles_names=tuple(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_TRACKS_NAMES),
+        only_keep_those_subtitles_languages=tuple(
+            ISO_639_2_LANGUAGES[language] for language in
+            GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_SUBTITLES_TRACKS_LANGUAGES),
+        only_keep_those_audios_enabled=GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_ENABLED,
+        only_keep_those_audios_ids=tuple(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_TRACKS_IDS),
+        only_keep_those_audios_names=tuple(GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_TRACKS_NAMES),
+        only_keep_those_audios_languages=tuple(
+            ISO_639_2_LANGUAGES[language] for language in
+            GlobalSetting.MUX_SETTING_ONLY_KEEP_THOSE_AUDIOS_TRACKS_LANGUAGES),
+
+        make_this_subtitle_default_semi_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_SEMI_ENABLED,
+        make_this_subtitle_default_full_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_FULL_ENABLED,
+        make_this_subtitle_default_track=GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_TRACK,
+        make_this_subtitle_default_chosen_track=get_make_default_chosen_track(
+            GlobalSetting.MUX_SETTING_MAKE_THIS_SUBTITLE_DEFAULT_TRACK),
+        make_this_audio_default_semi_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_SEMI_ENABLED,
+        make_this_audio_default_full_enabled=GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_FULL_ENABLED,
+        make_this_audio_default_track=GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_TRACK,
+        make_this_audio_default_chosen_track=get_make_default_chosen_track(
+            GlobalSetting.MUX_SETTING_MAKE_THIS_AUDIO_DEFAULT_TRACK),
+    )
@@ -0,0 +1,235 @@
+# Here we build the muxing jobs from the global setting and handle their output files once they finish
+# it doesn't use any widget, so the job queue table and the headless runner share the same jobs
+import os
+import time
+from pathlib import Path
+
+from packages.Tabs.AttachmentTab.Widgets.ScanAttachmentPathsWorker import remove_failed_attachment_paths
+from packages.Tabs.GlobalSetting import GlobalSetting
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+
+
+def get_file_name_with_mkv_extension(file_name):
+    file_extension_start_index = file_name.rfind(".")
+    new_file_name_with_mkv_extension = file_name[:file_extension_start_index] + ".mkv"
+    return new_file_name_with_mkv_extension
+
+
+# noinspection PyUnresolvedReferences
+def change_file_extension_to_mkv_with_random_suffix(file_name):
+    file_extension_start_index = file_name.rfind(".")
+    new_file_name_with_mkv_extension = file_name[
+                                       :file_extension_start_index] + "#" + GlobalSetting.RANDOM_OUTPUT_SUFFIX + ".mkv "
+    return new_file_name_with_mkv_extension
+
+
+def set_is_job_crc_required(new_job):
+    new_job.is_crc_calculating_required = GlobalSetting.MUX_SETTING_ADD_CRC
+    new_job.is_crc_removing_required = GlobalSetting.MUX_SETTING_REMOVE_OLD_CRC
+
+
+def set_attachments_setting_for_job(new_job, new_row_id):
+    new_job.discard_old_attachments = GlobalSetting.ATTACHMENT_DISCARD_OLD
+    new_job.allow_duplicates_attachments = GlobalSetting.ATTACHMENT_ALLOW_DUPLICATE
+    new_job.attachments_absolute_path = []
+    if GlobalSetting.ATTACHMENT_EXPERT_MODE:
+        if len(GlobalSetting.ATTACHMENT_PATH_DATA_LIST) > new_row_id:
+            new_job.attachments_absolute_path = GlobalSetting.ATTACHMENT_PATH_DATA_LIST[new_row_id].files_list.copy()
+    else:
+        for i in range(len(GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST)):
+            if GlobalSetting.ATTACHMENT_FILES_CHECKING_LIST[i]:
+                file_to_attach = GlobalSetting.ATTACHMENT_FILES_ABSOLUTE_PATH_LIST[i]
+                new_job.attachments_absolute_path.append(file_to_attach)
+
+
+Valid_CRC_String = "0123456789ABCDEF"
+
+
+def get_file_name_without_crc(file_name):
+    file_name = str(file_name)
+    file_name_without_crc = file_name
+    bracket_left_index = file_name.rfind("[")
+    bracket_right_index = file_name.rfind("]")
+    if (bracket_right_index - bracket_left_index - 1) == 8:
+        valid_counter = 0
+        for i in range(bracket_left_index + 1, bracket_right_index):
+            if file_name[i] in Valid_CRC_String:
+                valid_counter += 1
+        if valid_counter == 8:
+            file_name_without_crc = file_name[:bracket_left_index] + file_name[
+                                                                     bracket_right_index + 1:]
+    extension_index = file_name_without_crc.rfind(".")
+    file_name_without_extension = file_name_without_crc[:extension_index]
+    last_valid_char = 0
+    for i in range(len(file_name_without_extension) - 1, -1, -1):
+        if file_name_without_extension[i] != " ":
+            last_valid_char = i
+            break
+    file_name_without_crc = file_name_without_crc[
+                            :last_valid_char + 1] + file_name_without_crc[extension_index:]
+    return file_name_without_crc
+
+
+def get_file_name_with_crc(file_name, crc_string):
+    file_name = str(file_name)
+    file_name_without_crc = file_name
+    bracket_left_index = file_name.rfind("[")
+    bracket_right_index = file_name.rfind("]")
+    if (bracket_right_index - bracket_left_index - 1) == 8:
+        valid_counter = 0
+        for i in range(bracket_left_index + 1, bracket_right_index):
+            if file_name[i] in Valid_CRC_String:
+                valid_counter += 1
+        if valid_counter == 8:
+            file_name_without_crc = file_name[:bracket_left_index] + file_name[
+                                                                     bracket_right_index + 1:]
+    extension_index = file_name_without_crc.rfind(".")
+    file_name_without_extension = file_name_without_crc[:extension_index]
+    last_valid_char = 0
+    for i in range(len(file_name_without_extension) - 1, -1, -1):
+        if file_name_without_extension[i] != " ":
+            last_valid_char = i
+            break
+    if file_name_without_crc[last_valid_char] in ['[', ']', ')', '(', '}', '{']:
+        file_name_with_crc = file_name_without_crc[
+                             :last_valid_char + 1] + "[" + crc_string + "]" + file_name_without_crc[
+                                                                              extension_index:]
+    else:
+        file_name_with_crc = file_name_without_crc[
+                             :last_valid_char + 1] + " [" + crc_string + "]" + file_name_without_crc[
+                                                                               extension_index:]
+    return file_name_with_crc
+
+
+def calculate_size_after_muxing(finished_job: SingleJobData):
+    try:
+        output_video_size_bytes = os.path.getsize(finished_job.output_video_absolute_path)
+    except:
+        output_video_size_bytes = 0
+    return output_video_size_bytes
+
+
+def rename_file(file_name_old_crc_absolute_path, file_name_with_crc_absolute_path):
+    for i in range(500):
+        try:
+            os.rename(file_name_old_crc_absolute_path, file_name_with_crc_absolute_path)
+            return
+        except Exception as e:
+            time.sleep(0.05)
+
+
+def set_job_name(new_job, new_row_id):
+    new_job.video_name = GlobalSetting.VIDEO_FILES_LIST[new_row_id]
+    new_job.video_name_absolute = GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST[new_row_id]
+    new_job.video_name_with_spaces = " " + new_job.video_name + "   "
+    new_job.video_name_displayed = chr(0x200E) + new_job.video_name_with_spaces
+
+
+def set_job_subtitles(new_job, new_row_id):
+    subtitles_count = 0
+    for i in GlobalSetting.SUBTITLE_FILES_LIST.keys():
+        if len(GlobalSetting.SUBTITLE_FILES_LIST[i]) > new_row_id and \
+                GlobalSetting.SUBTITLE_FILES_LIST[i][new_row_id] != "":
+            new_job.subtitle_name.append(GlobalSetting.SUBTITLE_FILES_LIST[i][new_row_id])
+            new_job.subtitle_name_absolute.append(GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[i][new_row_id])
+            new_job.subtitle_delay.append(GlobalSetting.SUBTITLE_DELAY[i])
+            new_job.subtitle_language.append(GlobalSetting.SUBTITLE_LANGUAGE[i])
+            new_job.subtitle_track_name.append(GlobalSetting.SUBTITLE_TRACK_NAME[i])
+            new_job.subtitle_set_default.append(GlobalSetting.SUBTITLE_SET_DEFAULT[i])
+            new_job.subtitle_set_forced.append(GlobalSetting.SUBTITLE_SET_FORCED[i])
+            new_job.subtitle_set_at_top.append(GlobalSetting.SUBTITLE_SET_ORDER[i])
+            subtitles_count += 1
+    new_job.subtitle_found = subtitles_count > 0
+    return subtitles_count
+
+
+def set_job_audios(new_job, new_row_id):
+    audios_count = 0
+    for i in GlobalSetting.AUDIO_FILES_LIST.keys():
+        if len(GlobalSetting.AUDIO_FILES_LIST[i]) > new_row_id and \
+                GlobalSetting.AUDIO_FILES_LIST[i][new_row_id] != "":
+            new_job.audio_name.append(GlobalSetting.AUDIO_FILES_LIST[i][new_row_id])
+            new_job.audio_name_absolute.append(GlobalSetting.AUDIO_FILES_ABSOLUTE_PATH_LIST[i][new_row_id])
+            new_job.audio_delay.append(GlobalSetting.AUDIO_DELAY[i])
+            new_job.audio_language.append(GlobalSetting.AUDIO_LANGUAGE[i])
+            new_job.audio_track_name.append(GlobalSetting.AUDIO_TRACK_NAME[i])
+            new_job.audio_set_default.append(GlobalSetting.AUDIO_SET_DEFAULT[i])
+            new_job.audio_set_forced.append(GlobalSetting.AUDIO_SET_FORCED[i])
+            new_job.audio_set_at_top.append(GlobalSetting.AUDIO_SET_ORDER[i])
+            audios_count += 1
+    new_job.audio_found = audios_count > 0
+    return audios_count
+
+
+def set_job_chapter(new_job, new_row_id):
+    # an empty name is a video the automatic matching found no file for
+    if len(GlobalSetting.CHAPTER_FILES_LIST) > new_row_id and GlobalSetting.CHAPTER_FILES_LIST[new_row_id] != "":
+        new_job.chapter_found = True
+        new_job.chapter_name = GlobalSetting.CHAPTER_FILES_LIST[new_row_id]
+        new_job.chapter_name_absolute = GlobalSetting.CHAPTER_FILES_ABSOLUTE_PATH_LIST[new_row_id]
+    else:
+        new_job.chapter_found = False
+
+
+def set_job_size_before_muxing(new_job, new_row_id):
+    new_job.size_before_muxing = " " + GlobalSetting.VIDEO_FILES_SIZE_LIST[new_row_id]
+
+
+def create_muxing_job(new_row_id):
+    new_job = SingleJobData()
+    set_job_name(new_job, new_row_id)
+    set_job_audios(new_job, new_row_id)
+    set_job_subtitles(new_job, new_row_id)
+    set_job_chapter(new_job, new_row_id)
+    set_job_size_before_muxing(new_job, new_row_id)
+    new_job.progress = 0
+    set_is_job_crc_required(new_job)
+    set_attachments_setting_for_job(new_job, new_row_id)
+    return new_job
+
+
+def create_muxing_jobs():
+    if GlobalSetting.ATTACHMENT_EXPERT_MODE:
+        remove_failed_attachment_paths()
+    return [create_muxing_job(new_row_id) for new_row_id in range(len(GlobalSetting.VIDEO_FILES_LIST))]
+
+
+def get_output_folder_path(job: SingleJobData):
+    if job.used_mkvpropedit or GlobalSetting.OVERWRITE_SOURCE_FILES:
+        return os.path.dirname(job.video_name_absolute)
+    else:
+        return Path(GlobalSetting.DESTINATION_FOLDER_PATH)
+
+
+def delete_source_file_if_overwritten_enabled(job: SingleJobData):
+    if GlobalSetting.OVERWRITE_SOURCE_FILES and not job.used_mkvpropedit:
+        os.remove(job.video_name_absolute)
+        folder_path = os.path.dirname(job.video_name_absolute)
+        output_video_name = Path(change_file_extension_to_mkv_with_random_suffix(job.video_name))
+        output_video_name_absolute = os.path.join(folder_path, output_video_name)
+        original_output_video_name = Path(get_file_name_with_mkv_extension(job.video_name))
+        original_file_name_absolute_path = os.path.join(get_output_folder_path(job), original_output_video_name)
+        rename_file(output_video_name_absolute, original_file_name_absolute_path)
+
+
+def rename_output_file_if_needed(job: SingleJobData):
+    output_video_name = Path(get_file_name_with_mkv_extension(job.video_name))
+    output_file_name_folder_path_absolute = get_output_folder_path(job)
+    if job.is_crc_calculating_required:
+        file_name_with_crc = Path(get_file_name_with_crc(output_video_name, job.new_crc))
+        file_name_with_crc_absolute_path = os.path.join(output_file_name_folder_path_absolute, file_name_with_crc)
+        file_name_old_crc_absolute_path = os.path.join(output_file_name_folder_path_absolute, output_video_name)
+        rename_file(file_name_old_crc_absolute_path, file_name_with_crc_absolute_path)
+        job.output_video_name = file_name_with_crc
+        job.output_video_absolute_path = file_name_with_crc_absolute_path
+    elif job.is_crc_removing_required:
+        file_name_old_absolute_path = os.path.join(output_file_name_folder_path_absolute, output_video_name)
+        file_name_without_crc = Path(get_file_name_without_crc(output_video_name))
+        file_name_without_crc_absolute_path = os.path.join(output_file_name_folder_path_absolute,
+                                                           file_name_without_crc)
+        rename_file(file_name_old_absolute_path, file_name_without_crc_absolute_path)
+        job.output_video_name = file_name_without_crc
+        job.output_video_absolute_path = file_name_without_crc_absolute_path
+    else:
+        job.output_video_name = output_video_name
+        job.output_video_absolute_path = os.path.join(output_file_name_folder_path_absolute, output_video_name)
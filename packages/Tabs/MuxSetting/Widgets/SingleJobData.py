@@ -42,10 +42,14 @@ class SingleJobData:
         self.progress_crc = 0
         self.progress = 0
         self.size_before_muxing = "0 MB"
-        self.size_after_muxing = "0 MB"
+        self.size_after_muxing = ""
 
         self.done = False
         self.error_occurred = False
         self.used_mkvpropedit = False
         self.muxing_message = ""
         self.new_crc = ""
+
+        self.mkvmerge_json_job_file_path = ""
+        self.mkvpropedit_json_job_file_path = ""
+        self.muxing_log_file_path = ""
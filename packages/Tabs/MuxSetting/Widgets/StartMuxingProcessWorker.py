@@ -1,32 +1,126 @@
 import subprocess
+import time
 import traceback
 
-from PySide6.QtCore import Signal, QObject, QThread
+from PySide6.QtCore import Signal, QObject
 
 from packages.Startup import GlobalFiles
 from packages.Tabs.GlobalSetting import write_to_log_file
+from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
+
+
+def get_int_from_string(string):
+    string_digits = ''.join(x for x in string if x.isdigit())
+    return int(string_digits)
 
 
 class StartMuxingProcessWorker(QObject):
-    finished_job_signal = Signal(int)
-    all_finished = Signal()
+    start_job_signal = Signal(int, str, str, bool)
+    finished_job_signal = Signal(int, int)
+    send_muxing_progress_data_signal = Signal(MuxingParams)
 
-    def __init__(self, command=""):
+    def __init__(self):
         super().__init__()
-        self.command = command
-        self.wait = True
-        self.stop = False
+        self.command = ""
+        self.job_index = -1
+        self.log_file_path = GlobalFiles.MuxingLogFilePath
+        self.use_mkvpropedit = False
+        self.log_lines = []
+        self.last_log_flush_time = 0
+        self.log_flush_max_lines = 50
+        self.log_flush_interval = 1
+        self.start_job_signal.connect(self.run)
 
-    def run(self):
+    def run(self, job_index, command, log_file_path, use_mkvpropedit):
+        self.job_index = job_index
+        self.command = command
+        self.log_file_path = log_file_path
+        self.use_mkvpropedit = use_mkvpropedit
+        return_code = 2
         try:
-            while not self.stop:
-                if not self.wait:
-                    with open(GlobalFiles.MuxingLogFilePath, "a+", encoding="UTF-8") as log_file:
-                        mux_process = subprocess.run(self.command, shell=True, stdout=log_file, env=GlobalFiles.ENVIRONMENT)
-                    self.finished_job_signal.emit(mux_process.returncode)
-                    self.wait = True
-                else:
-                    QThread.msleep(50)
-            self.all_finished.emit()
+            return_code = self.start_muxing_process()
         except Exception as e:
             write_to_log_file(traceback.format_exc())
+        self.finished_job_signal.emit(self.job_index, return_code)
+
+    def start_muxing_process(self):
+        muxing_params = MuxingParams()
+        muxing_params.index = self.job_index
+        muxing_params.progress = 0
+        self.log_lines = []
+        self.last_log_flush_time = time.time()
+        parsing_done = False
+        output_lines_count = 0
+        with open(self.log_file_path, "a+", encoding="UTF-8") as log_file:
+            mux_process = subprocess.Popen(self.command, shell=True, stdout=subprocess.PIPE, encoding="UTF-8",
+                                           errors="replace", env=GlobalFiles.ENVIRONMENT)
+            for line in mux_process.stdout:
+                output_lines_count += 1
+                self.add_line_to_log_file(log_file, line)
+                if not parsing_done:
+                    if self.use_mkvpropedit:
+                        parsing_done = self.parse_mkvpropedit_line(line, muxing_params)
+                    else:
+                        parsing_done = self.parse_mkvmerge_line(line, muxing_params)
+            mux_process.wait()
+            self.flush_log_lines(log_file)
+        if mux_process.returncode != 0 and output_lines_count == 0:
+            self.check_if_tool_started(muxing_params)
+        return mux_process.returncode
+
+    def check_if_tool_started(self, muxing_params):
+        # a tool that printed nothing and failed may not have started at all
+        if self.use_mkvpropedit:
+            tool_path, tool_name = GlobalFiles.MKVPROPEDIT_PATH, "mkvpropedit"
+        else:
+            tool_path, tool_name = GlobalFiles.MKVMERGE_PATH, "mkvmerge"
+        if not GlobalFiles.recheck_tool_version(tool_path, tool_name):
+            muxing_params.error = True
+            muxing_params.message = tool_name + " couldn't be started, it will be detected again on the next launch"
+            self.send_muxing_progress_data_signal.emit(muxing_params)
+
+    def parse_mkvmerge_line(self, line, muxing_params):
+        if line.find('Progress:') != -1:
+            new_progress = get_int_from_string(line)
+            if new_progress != muxing_params.progress:
+                muxing_params.progress = new_progress
+                self.send_muxing_progress_data_signal.emit(muxing_params)
+        elif line.find('Error in the Matroska file structure') != -1:
+            muxing_params.error = True
+            muxing_params.message = line
+            self.send_muxing_progress_data_signal.emit(muxing_params)
+        elif line.find('Multiplexing took') != -1:
+            muxing_params.progress = 100
+            self.send_muxing_progress_data_signal.emit(muxing_params)
+            return True
+        elif line.find("Error: ") != -1:
+            muxing_params.error = True
+            muxing_params.message = line
+            self.send_muxing_progress_data_signal.emit(muxing_params)
+            return True
+        return False
+
+    def parse_mkvpropedit_line(self, line, muxing_params):
+        if line.find('Done.') != -1 or line.find('No changes were made') != -1:
+            muxing_params.progress = 100
+            self.send_muxing_progress_data_signal.emit(muxing_params)
+            return True
+        elif line.find('Error:') != -1:
+            muxing_params.error = True
+            muxing_params.message = line
+            self.send_muxing_progress_data_signal.emit(muxing_params)
+            return True
+        return False
+
+    def add_line_to_log_file(self, log_file, line):
+        self.log_lines.append(line)
+        if len(self.log_lines) >= self.log_flush_max_lines or \
+                time.time() - self.last_log_flush_time >= self.log_flush_interval:
+            self.flush_log_lines(log_file)
+
+    def flush_log_lines(self, log_file):
+        if len(self.log_lines) > 0:
+            log_file.write("".join(self.log_lines))
+            log_file.flush()
+            self.log_lines = []
+        self.last_log_flush_time = time.time()
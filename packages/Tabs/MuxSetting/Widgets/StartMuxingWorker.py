@@ -1,19 +1,20 @@
 import os
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QThread, Signal, Qt
 
 from packages.Startup import GlobalFiles
+from packages.Startup.Options import Options
 from packages.Tabs.GlobalSetting import GlobalSetting, write_to_log_file
 from packages.Tabs.MuxSetting.Widgets.CRCData import CRCData
 from packages.Tabs.MuxSetting.Widgets.CalculateCRCProcessWorker import CalculateCRCProcessWorker
 from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvmergeJob import GetJsonForMkvmergeJob
 from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvpropeditJob import GetJsonForMkvpropeditJob
+from packages.Tabs.MuxSetting.Widgets.MuxPlan import create_mux_plan
 from packages.Tabs.MuxSetting.Widgets.MuxingParams import MuxingParams
-from packages.Tabs.MuxSetting.Widgets.ReadFromMkvmergeLogWorker import ReadFromMkvmergeLogWorker
-from packages.Tabs.MuxSetting.Widgets.ReadFromMkvpropeditLogWorker import ReadFromMkvpropeditLogWorker
 from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
 from packages.Tabs.MuxSetting.Widgets.StartMuxingProcessWorker import StartMuxingProcessWorker
 
@@ -55,23 +56,46 @@ def add_double_quotation(string):
     return "\"" + str(string) + "\""
 
 
+def get_job_file_path(job_index, file_name, file_extension):
+    return os.path.join(GlobalFiles.MuxingJobsFolderPath, file_name + "_" + str(job_index) + file_extension)
+
+
+def is_job_to_mux(job: SingleJobData):
+    return not job.done or (job.error_occurred and job.muxing_message.find("There is not enough space") != -1)
+
+
 class StartMuxingWorker(QObject):
     finished_all_jobs_signal = Signal()
     finished_paused_signal = Signal()
     cancel_signal = Signal()
     mkvpropedit_good_signal = Signal()
     progress_signal = Signal(MuxingParams)
-    crc_progress_signal = Signal(int)
+    crc_progress_signal = Signal(int, int)
     job_succeeded_signal = Signal(int)
     job_failed_signal = Signal(int)
     job_started_signal = Signal(int)
     pause_from_error_occurred_signal = Signal()
+    job_files_failed_signal = Signal(int, int)
 
     def __init__(self, data):
         super().__init__()
         self.data = data  # type:list[SingleJobData]
+        self.mux_plan = create_mux_plan()  # the settings are frozen while muxing, so they are compiled once for all the jobs
         self.current_job = -1
-        self.finished_read_log_and_muxing = 0
+        self.max_concurrent_jobs = max(1, int(Options.Max_Concurrent_Jobs))
+        self.free_slots = list(range(self.max_concurrent_jobs))
+        self.running_jobs = {}  # job index -> slot index
+        self.max_crc_jobs = self.max_concurrent_jobs
+        self.free_crc_slots = list(range(self.max_crc_jobs))
+        self.crc_jobs = {}  # job index -> crc slot index
+        self.pending_crc_jobs = []
+        self.jobs_start_time = {}
+        self.inline_crc_jobs = set()
+        self.use_inline_crc = bool(Options.Inline_CRC)
+        self.pregenerate_job_files = bool(Options.Pregenerate_Job_Files)
+        self.max_concurrent_job_files = max(1, int(Options.Max_Concurrent_Probes))
+        self.job_files_pool = None  # type:ThreadPoolExecutor
+        self.jobs_files_futures = {}  # job index -> future giving "" when its option files are ready, or why they failed
         self.waiting_for_mkvpropedit_confirm = False
         self.always_use_mkvpropedit = False
         self.always_use_mkvmerge = False
@@ -79,218 +103,326 @@ class StartMuxingWorker(QObject):
         self.use_mkvmerge = False
         self.pause = False
         self.cancel = False
-        self.setup_start_muxing_process_thread()
-        self.setup_read_mkvmerge_log_thread()
-        self.setup_read_mkvpropedit_log_thread()
-        self.setup_calculate_crc_thread()
-        self.start_muxing_process_thread.start()
-        self.read_log_mkvmerge_thread.start()
-        self.read_log_mkvpropedit_thread.start()
-        self.start_crc_calculating_process_thread.start()
+        self.all_threads_stopped = False
+        self.start_muxing_process_workers = []  # type:list[StartMuxingProcessWorker]
+        self.start_muxing_process_threads = []  # type:list[QThread]
+        self.start_crc_calculating_process_workers = []  # type:list[CalculateCRCProcessWorker]
+        self.start_crc_calculating_process_threads = []  # type:list[QThread]
+        for slot_index in range(self.max_concurrent_jobs):
+            self.setup_start_muxing_process_thread()
+            self.start_muxing_process_threads[slot_index].start()
+        for crc_slot_index in range(self.max_crc_jobs):
+            self.setup_calculate_crc_thread()
+            self.start_crc_calculating_process_threads[crc_slot_index].start()
+        # queued, so a job failing before muxing finishes once the jobs loop that started it is done
+        self.job_files_failed_signal.connect(self.finished_muxing_process, Qt.ConnectionType.QueuedConnection)
 
     def run(self):
         try:
-            if self.current_job == len(self.data):
-                self.stop_all_threads()
-                self.finished_all_jobs_signal.emit()
+            if self.pregenerate_job_files:
+                self.generate_jobs_files()
             self.next_job()
         except Exception as e:
             write_to_log_file(traceback.format_exc())
 
+    def generate_jobs_files(self):
+        # the option files only depend on the job and the settings that are frozen while muxing, so they're generated
+        # in the background in the queue order while the first jobs already mux, a job whose files aren't started yet
+        # when its turn comes makes them itself
+        self.job_files_pool = ThreadPoolExecutor(max_workers=self.max_concurrent_job_files)
+        for job_index in range(len(self.data)):
+            if is_job_to_mux(self.data[job_index]):
+                self.jobs_files_futures[job_index] = self.job_files_pool.submit(self.generate_job_files, job_index)
+
+    def get_job_files_error(self, job_index):
+        job_files_future = self.jobs_files_futures.pop(job_index, None)
+        if job_files_future is None or job_files_future.cancel():
+            return self.generate_job_files(job_index)
+        return job_files_future.result()
+
+    def generate_job_files(self, job_index):
+        job = self.data[job_index]
+        job.mkvmerge_json_job_file_path = get_job_file_path(job_index, "MkvmergeJob", ".json")
+        job.mkvpropedit_json_job_file_path = get_job_file_path(job_index, "mkvpropeditJob", ".json")
+        try:
+            mkvmerge_job = GetJsonForMkvmergeJob(job, mux_plan=self.mux_plan)
+            if GlobalSetting.VIDEO_SOURCE_MKV_ONLY:
+                GetJsonForMkvpropeditJob(job, mux_plan=self.mux_plan, media_info=mkvmerge_job.media_info)
+        except ValueError as e:
+            return str(e)
+        except Exception as e:
+            write_to_log_file(traceback.format_exc())
+            return "Failed to generate the job options: " + str(e)
+        return ""
+
+    def delete_unused_jobs_files(self):
+        # files generated for jobs that never started because the muxing was paused or canceled
+        if self.job_files_pool is not None:
+            self.job_files_pool.shutdown(wait=True, cancel_futures=True)
+        for job_index, job_files_future in self.jobs_files_futures.items():
+            if job_files_future.cancelled():
+                continue
+            job = self.data[job_index]
+            for file_path in [job.mkvmerge_json_job_file_path, job.mkvpropedit_json_job_file_path]:
+                try:
+                    if os.path.isfile(file_path):
+                        os.remove(file_path)
+                except Exception as e:
+                    write_to_log_file(traceback.format_exc())
+        self.jobs_files_futures.clear()
+
     def stop_all_threads(self):
-        self.read_log_mkvmerge_worker.stop = True
-        self.read_log_mkvpropedit_worker.stop = True
-        self.start_muxing_process_worker.stop = True
-        self.start_crc_calculating_process_worker.stop = True
+        self.all_threads_stopped = True
+        self.delete_unused_jobs_files()
+        for start_muxing_process_thread in self.start_muxing_process_threads:
+            start_muxing_process_thread.quit()
+        for start_crc_calculating_process_thread in self.start_crc_calculating_process_threads:
+            start_crc_calculating_process_thread.quit()
+
+    def is_any_job_running(self):
+        return len(self.running_jobs) > 0 or len(self.crc_jobs) > 0 or len(self.pending_crc_jobs) > 0
 
     def next_job(self):
-        if self.cancel:
-            self.stop_all_threads()
-            self.cancel_signal.emit()
+        if self.all_threads_stopped:
             return
-        self.current_job += 1
-        if self.current_job == len(self.data):
-            self.stop_all_threads()
-            self.finished_all_jobs_signal.emit()
+        if self.cancel:
+            if not self.is_any_job_running():
+                self.stop_all_threads()
+                self.cancel_signal.emit()
             return
         if self.pause:
-            self.stop_all_threads()
-            self.finished_paused_signal.emit()
+            if not self.is_any_job_running():
+                self.stop_all_threads()
+                self.finished_paused_signal.emit()
             return
+        while len(self.free_slots) > 0 and self.current_job + 1 < len(self.data):
+            self.current_job += 1
+            job = self.data[self.current_job]
+            if is_job_to_mux(job):
+                self.start_job(job_index=self.current_job, slot_index=self.free_slots.pop(0))
+        if not self.is_any_job_running() and self.current_job + 1 >= len(self.data):
+            self.stop_all_threads()
+            self.finished_all_jobs_signal.emit()
 
-        job = self.data[self.current_job]
-        if not job.done or (job.error_occurred and job.muxing_message.find("There is not enough space") != -1):
-            GetJsonForMkvmergeJob(job)
-            if GlobalSetting.VIDEO_SOURCE_MKV_ONLY:
-                GetJsonForMkvpropeditJob(job)
+    def start_job(self, job_index, slot_index):
+        job = self.data[job_index]
+        job.muxing_log_file_path = get_job_file_path(job_index, "muxing_log_file", ".txt")
+        with open(job.muxing_log_file_path, "w+", encoding="UTF-8"):
+            pass
+        job.error_occurred = False
+        job.muxing_message = ""
+        self.running_jobs[job_index] = slot_index
+        self.jobs_start_time[job_index] = get_time()
+        GlobalSetting.MUXING_ON = True
+        error_message = self.get_job_files_error(job_index)
+        if error_message != "":
+            self.fail_job_before_muxing(job_index, error_message)
+            return
+        if not GlobalSetting.VIDEO_SOURCE_MKV_ONLY:
+            self.always_use_mkvmerge = True
+        if self.always_use_mkvpropedit:
+            self.job_started_signal.emit(job_index)
+            self.start_mkvpropedit_muxing(job_index)
+        elif self.always_use_mkvmerge:
+            self.job_started_signal.emit(job_index)
+            self.start_mkvmerge_muxing(job_index)
+        else:
+            if GlobalSetting.USE_MKVPROPEDIT:
+                self.always_use_mkvpropedit = True
+                self.job_started_signal.emit(job_index)
+                self.start_mkvpropedit_muxing(job_index)
             else:
                 self.always_use_mkvmerge = True
-            if self.always_use_mkvpropedit:
-                self.job_started_signal.emit(self.current_job)
-                self.start_mkvpropedit_muxing()
-            elif self.always_use_mkvmerge:
-                self.job_started_signal.emit(self.current_job)
-                self.start_mkvmerge_muxing()
-            else:
-                if GlobalSetting.USE_MKVPROPEDIT:
-                    self.always_use_mkvpropedit = True
-                    self.job_started_signal.emit(self.current_job)
-                    self.start_mkvpropedit_muxing()
-                else:
-                    self.always_use_mkvmerge = True
-                    self.job_started_signal.emit(self.current_job)
-                    self.start_mkvmerge_muxing()
-        else:
-            self.next_job()
-
-    # noinspection PyAttributeOutsideInit
-    def start_mkvpropedit_muxing(self):
-        self.data[self.current_job].used_mkvpropedit = True
+                self.job_started_signal.emit(job_index)
+                self.start_mkvmerge_muxing(job_index)
+
+    def fail_job_before_muxing(self, job_index, error_message):
+        job = self.data[job_index]
+        with open(job.muxing_log_file_path, "a+", encoding="UTF-8") as job_log_file:
+            job_log_file.write("Error: " + error_message + "\n")
+        self.job_started_signal.emit(job_index)
+        muxing_params = MuxingParams()
+        muxing_params.index = job_index
+        muxing_params.error = True
+        muxing_params.message = "Error: " + error_message
+        self.receive_muxing_progress_data(muxing_params)
+        self.job_files_failed_signal.emit(job_index, 2)
+
+    def start_mkvpropedit_muxing(self, job_index):
+        job = self.data[job_index]
+        job.used_mkvpropedit = True
+        slot_index = self.running_jobs[job_index]
         mux_command = add_double_quotation(GlobalFiles.MKVPROPEDIT_PATH) + " @" + add_double_quotation(
-            GlobalFiles.mkvpropeditJsonJobFilePath)
-        self.add_header_info_to_log_file()
-        self.start_muxing_process_worker.command = mux_command
-        GlobalSetting.MUXING_ON = True
-        self.read_log_mkvpropedit_worker.job_index = self.current_job
-        self.start_muxing_process_worker.wait = False
-        self.read_log_mkvpropedit_worker.wait = False
+            job.mkvpropedit_json_job_file_path)
+        self.start_muxing_process_workers[slot_index].start_job_signal.emit(job_index, mux_command,
+                                                                            job.muxing_log_file_path, True)
 
-    def start_mkvmerge_muxing(self):
+    def start_mkvmerge_muxing(self, job_index):
+        job = self.data[job_index]
+        slot_index = self.running_jobs[job_index]
         mux_command = add_double_quotation(GlobalFiles.MKVMERGE_PATH) + " @" + add_double_quotation(
-            GlobalFiles.mkvmergeJsonJobFilePath)
-        self.add_header_info_to_log_file()
-        self.start_muxing_process_worker.command = mux_command
-        GlobalSetting.MUXING_ON = True
-        self.read_log_mkvmerge_worker.job_index = self.current_job
-        self.start_muxing_process_worker.wait = False
-        self.read_log_mkvmerge_worker.wait = False
-
-    def check_if_crc_calculating_needed(self):
-        if self.data[self.current_job].is_crc_calculating_required:
-            if self.data[self.current_job].used_mkvpropedit or GlobalSetting.OVERWRITE_SOURCE_FILES:
-                folder_path = os.path.dirname(self.data[self.current_job].video_name_absolute)
-            else:
-                folder_path = Path(GlobalSetting.DESTINATION_FOLDER_PATH)
-            output_file_name = os.path.join(folder_path, self.data[self.current_job].video_name)
-            self.start_crc_calculating_process_worker.file_name = output_file_name
-            self.start_crc_calculating_process_worker.progress = 0
-            self.start_crc_calculating_process_worker.wait = False
-            GlobalSetting.MUXING_ON = True
+            job.mkvmerge_json_job_file_path)
+        if job.is_crc_calculating_required and self.use_inline_crc:
+            self.start_inline_crc_calculating(job_index)
+        self.start_muxing_process_workers[slot_index].start_job_signal.emit(job_index, mux_command,
+                                                                            job.muxing_log_file_path, False)
+
+    def get_crc_file_name(self, job_index):
+        job = self.data[job_index]
+        if job.used_mkvpropedit or GlobalSetting.OVERWRITE_SOURCE_FILES:
+            folder_path = os.path.dirname(job.video_name_absolute)
         else:
-            GlobalSetting.MUXING_ON = False
-            self.next_job()
+            folder_path = Path(GlobalSetting.DESTINATION_FOLDER_PATH)
+        return str(os.path.join(folder_path, job.video_name))
+
+    def start_inline_crc_calculating(self, job_index):
+        # inline hashing needs a crc worker for the whole mux, otherwise the job is hashed after muxing
+        if len(self.free_crc_slots) == 0:
+            return
+        crc_slot_index = self.free_crc_slots.pop(0)
+        self.crc_jobs[job_index] = crc_slot_index
+        self.inline_crc_jobs.add(job_index)
+        start_crc_calculating_process_worker = self.start_crc_calculating_process_workers[crc_slot_index]
+        crc_file_name = self.get_crc_file_name(job_index)
+        start_crc_calculating_process_worker.add_inline_crc_job(job_index, crc_file_name)
+        start_crc_calculating_process_worker.start_inline_crc_signal.emit(job_index, crc_file_name)
+
+    def finish_inline_crc_calculating(self, job_index):
+        self.inline_crc_jobs.discard(job_index)
+        start_crc_calculating_process_worker = self.start_crc_calculating_process_workers[self.crc_jobs[job_index]]
+        start_crc_calculating_process_worker.finish_inline_crc_job(job_index, cancel=self.data[job_index].error_occurred)
+        if self.data[job_index].error_occurred:
+            self.release_crc_slot(job_index)
+
+    def check_if_crc_calculating_needed(self, job_index):
+        job = self.data[job_index]
+        if job.is_crc_calculating_required:
+            if job_index in self.inline_crc_jobs:
+                # the checksum was folded in while muxing, receive_crc_result follows shortly
+                self.finish_inline_crc_calculating(job_index)
+            else:
+                self.pending_crc_jobs.append(job_index)
+                self.start_pending_crc_jobs()
+
+    def start_pending_crc_jobs(self):
+        while len(self.free_crc_slots) > 0 and len(self.pending_crc_jobs) > 0:
+            job_index = self.pending_crc_jobs.pop(0)
+            crc_slot_index = self.free_crc_slots.pop(0)
+            self.crc_jobs[job_index] = crc_slot_index
+            self.start_crc_calculating_process_workers[crc_slot_index].start_crc_signal.emit(
+                job_index, self.get_crc_file_name(job_index))
+
+    def release_job_slot(self, job_index):
+        slot_index = self.running_jobs.pop(job_index)
+        self.free_slots.append(slot_index)
+        GlobalSetting.MUXING_ON = self.is_any_job_running()
+
+    def release_crc_slot(self, job_index):
+        crc_slot_index = self.crc_jobs.pop(job_index)
+        self.free_crc_slots.append(crc_slot_index)
+        self.start_pending_crc_jobs()
+        GlobalSetting.MUXING_ON = self.is_any_job_running()
 
-    # noinspection PyAttributeOutsideInit
     def setup_start_muxing_process_thread(self):
-        self.start_muxing_process_worker = StartMuxingProcessWorker()
-        self.start_muxing_process_thread = QThread()
-        self.start_muxing_process_worker.moveToThread(self.start_muxing_process_thread)
-        self.start_muxing_process_thread.started.connect(self.start_muxing_process_worker.run)
-        self.start_muxing_process_worker.all_finished.connect(self.start_muxing_process_thread.quit)
-        self.start_muxing_process_worker.all_finished.connect(self.start_muxing_process_worker.deleteLater)
-        self.start_muxing_process_worker.finished_job_signal.connect(self.finished_muxing_process)
-
-    # noinspection PyAttributeOutsideInit
+        start_muxing_process_worker = StartMuxingProcessWorker()
+        start_muxing_process_thread = QThread()
+        start_muxing_process_worker.moveToThread(start_muxing_process_thread)
+        start_muxing_process_thread.finished.connect(start_muxing_process_worker.deleteLater)
+        start_muxing_process_thread.finished.connect(start_muxing_process_thread.deleteLater)
+        start_muxing_process_worker.finished_job_signal.connect(self.finished_muxing_process)
+        start_muxing_process_worker.send_muxing_progress_data_signal.connect(self.receive_muxing_progress_data)
+        self.start_muxing_process_workers.append(start_muxing_process_worker)
+        self.start_muxing_process_threads.append(start_muxing_process_thread)
+
     def setup_calculate_crc_thread(self):
-        self.start_crc_calculating_process_worker = CalculateCRCProcessWorker()
-        self.start_crc_calculating_process_thread = QThread()
-        self.start_crc_calculating_process_worker.moveToThread(self.start_crc_calculating_process_thread)
-        self.start_crc_calculating_process_thread.started.connect(self.start_crc_calculating_process_worker.run)
-        self.start_crc_calculating_process_worker.all_finished.connect(self.start_crc_calculating_process_thread.quit)
-        self.start_crc_calculating_process_worker.all_finished.connect(
-            self.start_crc_calculating_process_worker.deleteLater)
-        self.start_crc_calculating_process_thread.finished.connect(
-            self.start_crc_calculating_process_thread.deleteLater)
-        self.start_crc_calculating_process_worker.crc_progress_signal.connect(self.receive_crc_progress)
-        self.start_crc_calculating_process_worker.crc_result_signal.connect(self.receive_crc_result)
-
-    # noinspection PyAttributeOutsideInit
-    def setup_read_mkvmerge_log_thread(self):
-        self.read_log_mkvmerge_worker = ReadFromMkvmergeLogWorker(self.current_job)
-        self.read_log_mkvmerge_thread = QThread()
-        self.read_log_mkvmerge_worker.moveToThread(self.read_log_mkvmerge_thread)
-        self.read_log_mkvmerge_thread.started.connect(self.read_log_mkvmerge_worker.run)
-        self.read_log_mkvmerge_worker.all_finished.connect(self.read_log_mkvmerge_thread.quit)
-        self.read_log_mkvmerge_worker.all_finished.connect(self.read_log_mkvmerge_worker.deleteLater)
-        self.read_log_mkvmerge_worker.finished_job_signal.connect(self.finished_read_log)
-        self.read_log_mkvmerge_thread.finished.connect(self.read_log_mkvmerge_thread.deleteLater)
-        self.read_log_mkvmerge_worker.send_muxing_progress_data_signal.connect(self.receive_muxing_progress_data)
-
-    # noinspection PyAttributeOutsideInit
-    def setup_read_mkvpropedit_log_thread(self):
-        self.read_log_mkvpropedit_worker = ReadFromMkvpropeditLogWorker(self.current_job)
-        self.read_log_mkvpropedit_thread = QThread()
-        self.read_log_mkvpropedit_worker.moveToThread(self.read_log_mkvpropedit_thread)
-        self.read_log_mkvpropedit_thread.started.connect(self.read_log_mkvpropedit_worker.run)
-        self.read_log_mkvpropedit_worker.all_finished.connect(self.read_log_mkvpropedit_thread.quit)
-        self.read_log_mkvpropedit_worker.all_finished.connect(self.read_log_mkvpropedit_worker.deleteLater)
-        self.read_log_mkvpropedit_worker.finished_job_signal.connect(self.finished_read_log)
-        self.read_log_mkvpropedit_thread.finished.connect(self.read_log_mkvpropedit_thread.deleteLater)
-        self.read_log_mkvpropedit_worker.send_muxing_progress_data_signal.connect(self.receive_muxing_progress_data)
+        start_crc_calculating_process_worker = CalculateCRCProcessWorker()
+        start_crc_calculating_process_thread = QThread()
+        start_crc_calculating_process_worker.moveToThread(start_crc_calculating_process_thread)
+        start_crc_calculating_process_thread.finished.connect(start_crc_calculating_process_worker.deleteLater)
+        start_crc_calculating_process_thread.finished.connect(start_crc_calculating_process_thread.deleteLater)
+        start_crc_calculating_process_worker.crc_progress_signal.connect(self.receive_crc_progress)
+        start_crc_calculating_process_worker.crc_result_signal.connect(self.receive_crc_result)
+        start_crc_calculating_process_worker.crc_failed_signal.connect(self.receive_crc_failed)
+        self.start_crc_calculating_process_workers.append(start_crc_calculating_process_worker)
+        self.start_crc_calculating_process_threads.append(start_crc_calculating_process_thread)
 
     def receive_muxing_progress_data(self, params: MuxingParams):
         if params.error:
+            self.data[params.index].error_occurred = True
+            self.data[params.index].muxing_message = params.message
             if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
                 self.pause = True
                 self.pause_from_error_occurred_signal.emit()
         self.progress_signal.emit(params)
 
-    def receive_crc_progress(self, progress: int):
-        self.crc_progress_signal.emit(progress)
+    def receive_crc_progress(self, job_index, progress):
+        self.crc_progress_signal.emit(job_index, progress)
 
-    def receive_crc_result(self, crc_string: str):
+    def receive_crc_result(self, job_index, crc_string):
         crc_data = CRCData()
         crc_data.crc_string = crc_string
-        crc_data.job_index = self.current_job
-        self.data[self.current_job].new_crc = crc_string
-        self.job_succeeded_signal.emit(self.current_job)
-        GlobalSetting.MUXING_ON = False
+        crc_data.job_index = job_index
+        self.data[job_index].new_crc = crc_string
+        self.job_succeeded_signal.emit(job_index)
+        self.release_crc_slot(job_index)
         self.next_job()
 
-    def finished_read_log(self):
-        self.finished_read_log_and_muxing += 1
-        if self.finished_read_log_and_muxing == 2:  # both threads end
-            self.add_footer_info_to_log_file()
-            GlobalSetting.MUXING_ON = False
-            self.finished_read_log_and_muxing = 0
-            if self.data[self.current_job].error_occurred:
-                self.next_job()
-            else:
-                self.check_if_crc_calculating_needed()
+    def receive_crc_failed(self, job_index):
+        self.data[job_index].error_occurred = True
+        self.data[job_index].muxing_message = "Failed to calculate CRC of the output file"
+        self.job_failed_signal.emit(job_index)
+        if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
+            self.pause = True
+        self.release_crc_slot(job_index)
+        self.next_job()
 
-    def finished_muxing_process(self, exit_code):
+    def finished_muxing_process(self, job_index, exit_code):
+        job = self.data[job_index]
         if exit_code == 2:
-            self.data[self.current_job].error_occurred = True
-            self.job_failed_signal.emit(self.current_job)
+            job.error_occurred = True
+            self.job_failed_signal.emit(job_index)
             if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
                 self.pause = True
         else:
-            if self.data[self.current_job].error_occurred:
-                self.job_failed_signal.emit(self.current_job)
+            if job.error_occurred:
+                self.job_failed_signal.emit(job_index)
                 if GlobalSetting.MUX_SETTING_ABORT_ON_ERRORS:
                     self.pause = True
-            elif not self.data[self.current_job].is_crc_calculating_required:
-                self.job_succeeded_signal.emit(self.current_job)
-        self.finished_read_log_and_muxing += 1
-        if self.finished_read_log_and_muxing == 2:  # both threads end
-            self.add_footer_info_to_log_file()
-            GlobalSetting.MUXING_ON = False
-            self.finished_read_log_and_muxing = 0
-            if self.data[self.current_job].error_occurred:
-                self.next_job()
-            else:
-                self.check_if_crc_calculating_needed()
-
-    def add_header_info_to_log_file(self):
+            elif not job.is_crc_calculating_required:
+                self.job_succeeded_signal.emit(job_index)
+        self.finished_job_muxing(job_index)
+
+    def finished_job_muxing(self, job_index):
+        self.add_job_log_to_log_file(job_index)
+        self.delete_job_files(job_index)
+        if self.data[job_index].error_occurred:
+            if job_index in self.inline_crc_jobs:
+                self.finish_inline_crc_calculating(job_index)
+        else:
+            self.check_if_crc_calculating_needed(job_index)
+        self.release_job_slot(job_index)
+        self.next_job()
 
+    def add_job_log_to_log_file(self, job_index):
+        job = self.data[job_index]
         with open(GlobalFiles.MuxingLogFilePath, "a+", encoding="UTF-8") as log_file:
-            t = get_time()
             log_file.write(
-                "\n[" + t + "] Start Muxing: ********* " + str(
-                    self.data[self.current_job].video_name) + " *********\n\n")
-
-    def add_footer_info_to_log_file(self):
-        with open(GlobalFiles.MuxingLogFilePath, "a+", encoding="UTF-8") as log_file:
-            t = get_time()
+                "\n[" + self.jobs_start_time.pop(job_index, get_time()) + "] Start Muxing: ********* " + str(
+                    job.video_name) + " *********\n\n")
+            try:
+                with open(job.muxing_log_file_path, "r", encoding="UTF-8") as job_log_file:
+                    log_file.write(job_log_file.read())
+            except Exception as e:
+                write_to_log_file(traceback.format_exc())
             log_file.write(
-                "\n[" + t + "] Finish Muxing: ********* " + self.data[self.current_job].video_name + " *********\n")
+                "\n[" + get_time() + "] Finish Muxing: ********* " + job.video_name + " *********\n")
+
+    def delete_job_files(self, job_index):
+        job = self.data[job_index]
+        for file_path in [job.mkvmerge_json_job_file_path, job.mkvpropedit_json_job_file_path,
+                          job.muxing_log_file_path]:
+            try:
+                if os.path.isfile(file_path):
+                    os.remove(file_path)
+            except Exception as e:
+                write_to_log_file(traceback.format_exc())
@@ -0,0 +1,271 @@
+# Here we check the whole job queue before muxing it, without muxing or writing anything: the options of every job are
+# built in memory like the muxing would build them, the new subtitles and audios are identified with mkvmerge, and the
+# chapters, attachments, old tracks references and output paths are checked
+# the jobs are checked in parallel and only read the media info cache, nothing probed here is kept in it or in the
+# videos tracks index, so a big queue takes seconds
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal
+
+from packages.Startup.Options import Options
+from packages.Tabs.GlobalSetting import write_to_log_file, GlobalSetting
+from packages.Tabs.MediaInfoCache import get_media_info
+from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvmergeJob import GetJsonForMkvmergeJob
+from packages.Tabs.MuxSetting.Widgets.GetJsonForMkvpropeditJob import GetJsonForMkvpropeditJob
+from packages.Tabs.MuxSetting.Widgets.JobValidationResult import JobValidationResult
+from packages.Tabs.MuxSetting.Widgets.MuxPlan import MuxPlan
+from packages.Tabs.MuxSetting.Widgets.MuxingJobs import get_file_name_with_mkv_extension
+from packages.Tabs.MuxSetting.Widgets.SingleJobData import SingleJobData
+from packages.Tabs.MuxSetting.Widgets.StartMuxingWorker import is_job_to_mux
+
+MAX_REPORTED_JOBS = 10  # the report only lists the first jobs with problems
+
+
+def get_path_key(file_path):
+    return os.path.normcase(os.path.abspath(str(file_path)))
+
+
+def check_input_file(file_path, file_type):
+    if not os.path.isfile(file_path):
+        return file_type + " not found: " + file_path
+    if not os.access(file_path, os.R_OK):
+        return file_type + " can't be read: " + file_path
+    return ""
+
+
+def check_track_file(file_path, file_type, track_type):
+    error = check_input_file(file_path, file_type)
+    if error != "":
+        return error
+    media_info = get_media_info(file_path, keep_in_cache=False)
+    if media_info.probe_error != "":
+        return "mkvmerge can't read the " + file_type.lower() + ": " + file_path + " (" + media_info.probe_error + ")"
+    if not media_info.json_info.get("container", {}).get("supported", True):
+        return "mkvmerge doesn't support the " + file_type.lower() + ": " + file_path
+    if not any(track.get("type") == track_type for track in media_info.tracks):
+        return "mkvmerge found no track in the " + file_type.lower() + ": " + file_path
+    return ""
+
+
+# the muxing creates the output folder when it doesn't exist yet, so its nearest existing parent must be writable
+def check_output_folder(folder_path):
+    existing_folder_path = os.path.abspath(str(folder_path))
+    while not os.path.exists(existing_folder_path) and os.path.dirname(existing_folder_path) != existing_folder_path:
+        existing_folder_path = os.path.dirname(existing_folder_path)
+    if not os.path.isdir(existing_folder_path):
+        return "Output folder isn't a valid folder: " + str(folder_path)
+    if not os.access(existing_folder_path, os.W_OK):
+        return "No write permission on the output folder: " + str(folder_path)
+    return ""
+
+
+def get_missing_tracks_ids(tracks_ids, video_tracks_ids):
+    return [track_id for track_id in dict.fromkeys(tracks_ids) if track_id not in video_tracks_ids]
+
+
+def is_chosen_track(track, chosen_track):
+    track_type, track_value = chosen_track
+    return (track_type == "id" and track.id == track_value) or \
+        (track_type == "lang" and track.language == track_value) or \
+        (track_type == "name" and track.track_name == track_value)
+
+
+def check_old_tracks_references(result, mux_plan: MuxPlan, options_job):
+    for tracks_type, is_activated, enabled_ids, video_tracks_ids in (
+            ("Video", mux_plan.old_videos_modified_activated or mux_plan.old_videos_reorder_activated or
+             mux_plan.old_videos_deleted_activated, mux_plan.old_videos_enabled_ids, options_job.videos_tracks_ids),
+            ("Subtitle", mux_plan.old_subtitles_modified_activated or mux_plan.old_subtitles_reorder_activated or
+             mux_plan.old_subtitles_deleted_activated, mux_plan.old_subtitles_enabled_ids,
+             options_job.subtitles_tracks_ids),
+            ("Audio", mux_plan.old_audios_modified_activated or mux_plan.old_audios_reorder_activated or
+             mux_plan.old_audios_deleted_activated, mux_plan.old_audios_enabled_ids, options_job.audios_tracks_ids)):
+        if not is_activated:
+            continue
+        missing_tracks_ids = get_missing_tracks_ids(enabled_ids, video_tracks_ids)
+        if len(missing_tracks_ids) > 0:
+            result.warnings.append(tracks_type + " tracks " + ", ".join(missing_tracks_ids) +
+                                   " set in Modify Old Tracks aren't in this video, they are skipped")
+
+
+def check_make_default_references(result, mux_plan: MuxPlan, options_job):
+    for tracks_type, is_enabled, chosen_track, track_text, video_tracks in (
+            ("subtitle", mux_plan.make_this_subtitle_default_semi_enabled,
+             mux_plan.make_this_subtitle_default_chosen_track, mux_plan.make_this_subtitle_default_track,
+             options_job.subtitles_track_json_info),
+            ("audio", mux_plan.make_this_audio_default_semi_enabled, mux_plan.make_this_audio_default_chosen_track,
+             mux_plan.make_this_audio_default_track, options_job.audios_track_json_info)):
+        if not is_enabled or chosen_track[0] == "":
+            continue
+        if not any(is_chosen_track(track, chosen_track) for track in video_tracks):
+            result.warnings.append("No " + tracks_type + " track of this video matches " + track_text +
+                                   ", the default " + tracks_type + " track is left unchanged")
+
+
+def check_only_keep_those_references(result, mux_plan: MuxPlan, mkvmerge_job: GetJsonForMkvmergeJob):
+    for tracks_type, is_enabled, ids, names, languages, video_tracks in (
+            ("subtitle", mux_plan.only_keep_those_subtitles_enabled, mux_plan.only_keep_those_subtitles_ids,
+             mux_plan.only_keep_those_subtitles_names, mux_plan.only_keep_those_subtitles_languages,
+             mkvmerge_job.subtitles_track_json_info),
+            ("audio", mux_plan.only_keep_those_audios_enabled, mux_plan.only_keep_those_audios_ids,
+             mux_plan.only_keep_those_audios_names, mux_plan.only_keep_those_audios_languages,
+             mkvmerge_job.audios_track_json_info)):
+        if not is_enabled or len(ids) + len(names) + len(languages) == 0:
+            continue
+        missing_tracks_ids = get_missing_tracks_ids(ids, {track.id for track in video_tracks})
+        if len(missing_tracks_ids) > 0:
+            result.warnings.append("The " + tracks_type + " tracks " + ", ".join(missing_tracks_ids) +
+                                   " to keep aren't in this video")
+        if len(video_tracks) > 0 and not any(track.id in ids or track.track_name in names or
+                                             track.language in languages for track in video_tracks):
+            result.warnings.append("None of the " + tracks_type + " tracks to keep are in this video, all its " +
+                                   tracks_type + " tracks will be removed")
+    if mkvmerge_job.specify_video_track_source_video_command == ["--no-video"] and \
+            len(mkvmerge_job.videos_track_json_info) > 0:
+        result.warnings.append("All the video tracks of this video will be removed")
+
+
+def check_output_path(result, job: SingleJobData, mux_plan: MuxPlan):
+    video_folder_path = os.path.dirname(job.video_name_absolute)
+    if mux_plan.overwrite_source_files:
+        output_folder_path = video_folder_path
+    else:
+        output_folder_path = mux_plan.destination_folder_path
+        if get_path_key(output_folder_path) == get_path_key(video_folder_path):
+            result.errors.append("The destination folder is the folder of the source video")
+            return
+    error = check_output_folder(output_folder_path)
+    if error != "":
+        result.errors.append(error)
+        return
+    result.output_video_absolute_path = os.path.join(output_folder_path,
+                                                     get_file_name_with_mkv_extension(job.video_name))
+    if not mux_plan.overwrite_source_files and os.path.exists(result.output_video_absolute_path):
+        result.warnings.append("Output file already exists and will be replaced: " +
+                               result.output_video_absolute_path)
+
+
+def check_duplicate_outputs(results):
+    results_by_output = {}  # output path key -> results of the jobs writing it
+    for result in results:
+        if result.output_video_absolute_path != "":
+            results_by_output.setdefault(get_path_key(result.output_video_absolute_path), []).append(result)
+    for same_output_results in results_by_output.values():
+        if len(same_output_results) < 2:
+            continue
+        for result in same_output_results:
+            other_videos_names = [other_result.video_name for other_result in same_output_results
+                                  if other_result is not result]
+            result.errors.append("Same output file as: " + ", ".join(other_videos_names))
+
+
+def validate_job(job_index, job: SingleJobData, mux_plan: MuxPlan, use_mkvpropedit, checked_files):
+    result = JobValidationResult()
+    result.index = job_index
+    result.video_name = job.video_name
+    error = check_input_file(job.video_name_absolute, "Video")
+    if error != "":
+        result.errors.append(error)
+        return result
+    try:
+        media_info = GlobalSetting.VIDEO_TRACKS_INDEX.get_media_info(job.video_name_absolute, keep_in_cache=False)
+        if use_mkvpropedit:
+            options_job = GetJsonForMkvpropeditJob(job, mux_plan=mux_plan, media_info=media_info, generate_file=False)
+        else:
+            options_job = GetJsonForMkvmergeJob(job, mux_plan=mux_plan, media_info=media_info, generate_file=False)
+    except ValueError as e:
+        result.errors.append(str(e))
+        return result
+    except Exception as e:
+        write_to_log_file(traceback.format_exc())
+        result.errors.append("Failed to generate the job options: " + str(e))
+        return result
+    if not options_job.media_info.is_valid_video:
+        result.errors.append("mkvmerge can't find a video track in: " + job.video_name_absolute)
+    files_to_check = []  # (file path, file type, track type or "" when mkvmerge doesn't identify it)
+    if mux_plan.subtitle_enabled:
+        files_to_check.extend((file_path, "Subtitle", "subtitles") for file_path in job.subtitle_name_absolute)
+    if mux_plan.audio_enabled:
+        files_to_check.extend((file_path, "Audio", "audio") for file_path in job.audio_name_absolute)
+    if mux_plan.chapter_enabled and job.chapter_found:
+        files_to_check.append((job.chapter_name_absolute, "Chapter", ""))
+    files_to_check.extend((file_path, "Attachment", "") for file_path in job.attachments_absolute_path)
+    for file_path, file_type, track_type in files_to_check:
+        # the same fonts are usually attached to every job, each file is only checked once for the whole queue
+        file_key = get_path_key(file_path)
+        if file_key not in checked_files:
+            if track_type != "":
+                checked_files[file_key] = check_track_file(file_path, file_type, track_type)
+            else:
+                checked_files[file_key] = check_input_file(file_path, file_type)
+        if checked_files[file_key] != "":
+            result.errors.append(checked_files[file_key])
+    check_old_tracks_references(result, mux_plan, options_job)
+    check_make_default_references(result, mux_plan, options_job)
+    if use_mkvpropedit:
+        if not os.access(job.video_name_absolute, os.W_OK):
+            result.errors.append("No write permission on the video, mkvpropedit modifies it in place")
+    else:
+        check_only_keep_those_references(result, mux_plan, options_job)
+        check_output_path(result, job, mux_plan)
+    return result
+
+
+# the mode the queue was checked for, the muxing may still ask to use mkvpropedit or not when it starts
+def get_validation_mode(mux_plan: MuxPlan, use_mkvpropedit):
+    if use_mkvpropedit:
+        return "mkvpropedit editing the source files in place"
+    if mux_plan.overwrite_source_files:
+        return "mkvmerge overwriting the source files"
+    return "mkvmerge muxing to " + mux_plan.destination_folder_path
+
+
+def get_validation_report(results, validation_mode):
+    jobs_with_errors = [result for result in results if len(result.errors) > 0]
+    jobs_with_warnings = [result for result in results if len(result.errors) == 0 and len(result.warnings) > 0]
+    number_of_ready_jobs = len(results) - len(jobs_with_errors) - len(jobs_with_warnings)
+    report = "Checked " + str(len(results)) + " jobs: " + str(number_of_ready_jobs) + " ready, " + \
+             str(len(jobs_with_errors)) + " with errors, " + str(len(jobs_with_warnings)) + " with warnings\n" + \
+             "Validated as: " + validation_mode
+    jobs_to_report = jobs_with_errors + jobs_with_warnings
+    for result in jobs_to_report[:MAX_REPORTED_JOBS]:
+        report += "\n\n" + result.video_name
+        for error in result.errors:
+            report += "\nError: " + error
+        for warning in result.warnings:
+            report += "\nWarning: " + warning
+    if len(jobs_to_report) > MAX_REPORTED_JOBS:
+        report += "\n\nAnd " + str(len(jobs_to_report) - MAX_REPORTED_JOBS) + " more jobs with problems"
+    return report
+
+
+class ValidateQueueWorker(QObject):
+    job_validated_signal = Signal(JobValidationResult)
+    finished_validation_signal = Signal()
+
+    def __init__(self, data, mux_plan: MuxPlan, use_mkvpropedit=False):
+        super().__init__()
+        self.data = data  # type: list[SingleJobData]
+        self.mux_plan = mux_plan
+        self.use_mkvpropedit = use_mkvpropedit
+        self.validation_mode = get_validation_mode(mux_plan, use_mkvpropedit)
+        self.max_concurrent_checks = max(1, int(Options.Max_Concurrent_Probes))
+        self.checked_files = {}  # file path key -> "" or why the file can't be muxed
+        self.results = []  # type: list[JobValidationResult]
+
+    def run(self):
+        try:
+            jobs_indexes = [job_index for job_index in range(len(self.data)) if is_job_to_mux(self.data[job_index])]
+            # the probes are separate mkvmerge processes, so the threads here mostly wait on them
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_checks) as checks_pool:
+                self.results = list(checks_pool.map(self.validate_job, jobs_indexes))
+            check_duplicate_outputs(self.results)
+            for result in self.results:
+                self.job_validated_signal.emit(result)
+        except Exception as e:
+            write_to_log_file(traceback.format_exc())
+        self.finished_validation_signal.emit()
+
+    def validate_job(self, job_index):
+        return validate_job(job_index, self.data[job_index], self.mux_plan, self.use_mkvpropedit, self.checked_files)
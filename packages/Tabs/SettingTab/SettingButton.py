@@ -5,7 +5,6 @@ from PySide6.QtCore import QSize
 from PySide6.QtWidgets import QPushButton
 
 from packages.Startup.GlobalIcons import SettingIcon
-from packages.Tabs.SettingTab.SettingDialog import SettingDialog
 
 
 class SettingButton(QPushButton):
@@ -17,5 +16,8 @@ class SettingButton(QPushButton):
         self.clicked.connect(self.open_setting_dialog)
 
     def open_setting_dialog(self):
+        # the setting dialog and all of its pages are only imported when the user opens it for the first time
+        from packages.Tabs.SettingTab.SettingDialog import SettingDialog
+
         setting_dialog = SettingDialog(parent=self)
         setting_dialog.execute()
@@ -1,9 +1,11 @@
 # import faulthandler
+import os
+
 from PySide6 import QtGui
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QHBoxLayout, \
-    QGridLayout, QLabel, QPushButton, QCheckBox
+    QGridLayout, QLabel, QPushButton, QCheckBox, QSpinBox
 from packages.Startup.Options import Options, save_options, get_names_list_of_presets
 from packages.Startup.GlobalFiles import InfoIconPath
 from packages.Startup.GlobalIcons import SettingIcon
@@ -49,6 +51,32 @@ class SettingDialog(MyDialog):
         self.preset_tab_set_default_button = PresetTabSetDefaultButton()
         self.preset_tab_ask_on_start_check_box = QCheckBox("Ask for preset on startup")
         self.preset_tab_setting_layout = QHBoxLayout()
+        self.max_concurrent_jobs_label = QLabel("Max concurrent jobs: ")
+        self.max_concurrent_jobs_spin_box = QSpinBox()
+        self.max_concurrent_jobs_spin_box.setRange(1, max(os.cpu_count() or 1, Options.Max_Concurrent_Jobs))
+        self.max_concurrent_jobs_spin_box.setToolTip("Number of videos muxed at the same time")
+        self.max_concurrent_probes_label = QLabel("Max concurrent scans: ")
+        self.max_concurrent_probes_spin_box = QSpinBox()
+        self.max_concurrent_probes_spin_box.setRange(1, max(64, Options.Max_Concurrent_Probes))
+        self.max_concurrent_probes_spin_box.setToolTip("Number of videos scanned for media info at the same time")
+        self.subfolders_depth_label = QLabel("Subfolders depth: ")
+        self.subfolders_depth_spin_box = QSpinBox()
+        self.subfolders_depth_spin_box.setRange(0, max(16, Options.Subfolders_Depth))
+        self.subfolders_depth_spin_box.setToolTip("How many levels of subfolders are searched for videos, subtitles "
+                                                  "and audios, 0 only uses the chosen folder")
+        self.keep_media_info_cache_check_box = QCheckBox("Remember scanned videos")
+        self.keep_media_info_cache_check_box.setToolTip("Keep the media info of scanned videos between sessions, "
+                                                        "so unchanged videos are not scanned again")
+        self.watch_source_folders_check_box = QCheckBox("Watch source folders")
+        self.watch_source_folders_check_box.setToolTip("Update the files lists when files are added, changed or "
+                                                       "removed in the source folders")
+        self.inline_crc_check_box = QCheckBox("Calculate CRC while muxing")
+        self.inline_crc_check_box.setToolTip("Calculate the output CRC as mkvmerge writes the file instead of "
+                                             "reading the whole file again after muxing")
+        self.pregenerate_job_files_check_box = QCheckBox("Prepare all jobs before muxing")
+        self.pregenerate_job_files_check_box.setToolTip("Generate the options of every job at once when muxing "
+                                                        "starts, so jobs with bad paths fail before any muxing")
+        self.muxing_setting_layout = QHBoxLayout()
         self.current_tab_index = 0
         self.current_preset_tab = None
         self.setup_presets()
@@ -60,6 +88,20 @@ class SettingDialog(MyDialog):
         self.preset_tab_setting_layout.addStretch(200)
         self.preset_tab_setting_layout.addWidget(self.preset_tab_ask_on_start_check_box)
         self.preset_tab_setting_layout.setContentsMargins(0, 0, 0, 0)
+        self.muxing_setting_layout.addWidget(self.max_concurrent_jobs_label)
+        self.muxing_setting_layout.addWidget(self.max_concurrent_jobs_spin_box)
+        self.muxing_setting_layout.addSpacing(20)
+        self.muxing_setting_layout.addWidget(self.max_concurrent_probes_label)
+        self.muxing_setting_layout.addWidget(self.max_concurrent_probes_spin_box)
+        self.muxing_setting_layout.addSpacing(20)
+        self.muxing_setting_layout.addWidget(self.subfolders_depth_label)
+        self.muxing_setting_layout.addWidget(self.subfolders_depth_spin_box)
+        self.muxing_setting_layout.addStretch(200)
+        self.muxing_setting_layout.addWidget(self.keep_media_info_cache_check_box)
+        self.muxing_setting_layout.addWidget(self.watch_source_folders_check_box)
+        self.muxing_setting_layout.addWidget(self.inline_crc_check_box)
+        self.muxing_setting_layout.addWidget(self.pregenerate_job_files_check_box)
+        self.muxing_setting_layout.setContentsMargins(0, 0, 0, 0)
         self.buttons_layout = QHBoxLayout()
         self.buttons_layout.addStretch(stretch=3)
         self.buttons_layout.addWidget(self.yes_button, stretch=2)
@@ -75,12 +117,14 @@ class SettingDialog(MyDialog):
         self.main_layout = QGridLayout()
         self.main_layout.addLayout(self.preset_tab_setting_layout, 0, 0, 1, 1)
         self.main_layout.addWidget(self.current_preset_tab, 1, 0, 1, 1)
-        self.main_layout.addLayout(self.setting_info_layout, 2, 0, 1, 1)
-        self.main_layout.addLayout(self.buttons_layout, 3, 0, 1, 1)
+        self.main_layout.addLayout(self.muxing_setting_layout, 2, 0, 1, 1)
+        self.main_layout.addLayout(self.setting_info_layout, 3, 0, 1, 1)
+        self.main_layout.addLayout(self.buttons_layout, 4, 0, 1, 1)
 
         self.main_layout.setRowStretch(1, 0)
         self.main_layout.setRowStretch(2, 0)
         self.main_layout.setRowStretch(3, 0)
+        self.main_layout.setRowStretch(4, 0)
         self.main_layout.setContentsMargins(10, 10, 10, 10)
         self.setLayout(self.main_layout)
 
@@ -97,6 +141,13 @@ class SettingDialog(MyDialog):
         self.current_tab_index = Options.FavoritePresetId
         self.current_preset_tab = self.preset_tabs[self.current_tab_index]
         self.preset_tab_ask_on_start_check_box.setChecked(Options.Choose_Preset_On_Startup)
+        self.max_concurrent_jobs_spin_box.setValue(Options.Max_Concurrent_Jobs)
+        self.max_concurrent_probes_spin_box.setValue(Options.Max_Concurrent_Probes)
+        self.subfolders_depth_spin_box.setValue(Options.Subfolders_Depth)
+        self.keep_media_info_cache_check_box.setChecked(Options.Keep_Media_Info_Cache)
+        self.watch_source_folders_check_box.setChecked(Options.Watch_Source_Folders)
+        self.inline_crc_check_box.setChecked(Options.Inline_CRC)
+        self.pregenerate_job_files_check_box.setChecked(Options.Pregenerate_Job_Files)
         self.update_rename_button_current_tab_name()
 
     def setup_ui(self):
@@ -129,6 +180,13 @@ class SettingDialog(MyDialog):
         Options.DefaultPresets = default_options.copy()
         Options.Choose_Preset_On_Startup = self.preset_tab_ask_on_start_check_box.isChecked()
         Options.FavoritePresetId = self.preset_tab_comboBox.activated_preset_id
+        Options.Max_Concurrent_Jobs = self.max_concurrent_jobs_spin_box.value()
+        Options.Max_Concurrent_Probes = self.max_concurrent_probes_spin_box.value()
+        Options.Subfolders_Depth = self.subfolders_depth_spin_box.value()
+        Options.Keep_Media_Info_Cache = self.keep_media_info_cache_check_box.isChecked()
+        Options.Watch_Source_Folders = self.watch_source_folders_check_box.isChecked()
+        Options.Inline_CRC = self.inline_crc_check_box.isChecked()
+        Options.Pregenerate_Job_Files = self.pregenerate_job_files_check_box.isChecked()
         save_options()
 
     def change_current_preset_tab(self, tab_index):
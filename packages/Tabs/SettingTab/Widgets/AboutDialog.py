@@ -4,7 +4,8 @@ from PySide6.QtGui import QPixmap, QFont
 from PySide6.QtWidgets import QLabel, \
      QPushButton, QHBoxLayout, QVBoxLayout
 
-from packages.Startup.GlobalFiles import AppIconPath, MKVMERGE_VERSION, MKVPROPEDIT_VERSION
+from packages.Startup import GlobalFiles
+from packages.Startup.GlobalFiles import AppIconPath
 from packages.Startup.GlobalIcons import AboutIcon
 from packages.Startup.PreDefined import GitHubRepoUrlTag, GPLV2UrlTag, GitHubIssuesUrlTag
 from packages.Startup.Version import Version
@@ -23,8 +24,8 @@ class AboutDialog(MyDialog):
         self.app_icon_label.setPixmap(QPixmap(AppIconPath).scaledToHeight(175))
         self.app_name_label = QLabel("MKV Muxing Batch GUI")
         self.app_current_version = QLabel("Version: " + str(Version))
-        self.app_mkvmerge_current_version = QLabel(str(MKVMERGE_VERSION))
-        self.app_mkvpropedit_current_version = QLabel(str(MKVPROPEDIT_VERSION))
+        self.app_mkvmerge_current_version = QLabel(str(GlobalFiles.MKVMERGE_VERSION))
+        self.app_mkvpropedit_current_version = QLabel(str(GlobalFiles.MKVPROPEDIT_VERSION))
         self.app_link_github_label = QLabel("Check for updates on: " + GitHubRepoUrlTag)
         self.app_link_github_label.setOpenExternalLinks(True)
         self.app_licence_label = QLabel("MKV Muxing Batch GUI is released under the " + GPLV2UrlTag + "+ licence")
@@ -1,10 +1,14 @@
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QThread
 from PySide6.QtWidgets import (
     QGroupBox,
+    QWidget,
 )
 
 from packages.Startup.Options import Options
 from packages.Startup.SetupThems import get_dark_palette, get_light_palette
+from packages.Tabs.FolderScan import get_folder_scan, forget_folder_scan
+from packages.Tabs.FolderWatcher import add_new_files_names, get_folder_watcher, get_watched_folder_changes, \
+    get_watched_files_names_absolute_list, is_same_folder
 from packages.Tabs.GlobalSetting import *
 from packages.Tabs.SubtitleTab.Widgets.MatchSubtitleLayout import MatchSubtitleLayout
 from packages.Tabs.SubtitleTab.Widgets.SubtitleClearButton import SubtitleClearButton
@@ -17,6 +21,7 @@ from packages.Tabs.SubtitleTab.Widgets.SubtitleSetForcedCheckBox import Subtitle
 from packages.Tabs.SubtitleTab.Widgets.SubtitleSourceButton import SubtitleSourceButton
 from packages.Tabs.SubtitleTab.Widgets.SubtitleSourceLineEdit import SubtitleSourceLineEdit
 from packages.Tabs.SubtitleTab.Widgets.SubtitleTrackNameLineEdit import SubtitleTrackNameLineEdit
+from packages.Tabs.WalkFolderWorker import WalkFolderWorker
 from packages.Widgets.RefreshFilesButton import RefreshFilesButton
 from packages.Widgets.InvalidPathDialog import *
 from packages.Widgets.WarningDialog import WarningDialog
@@ -71,6 +76,7 @@ class SubtitleSelectionSetting(QGroupBox):
 
     # noinspection PyUnresolvedReferences
     def connect_signals(self):
+        get_folder_watcher().folder_changed_signal.connect(self.update_files_from_folder_watch)
         # self.subtitle_main_groupBox.toggled.connect(self.activate_tab)
         self.subtitle_source_button.clicked_signal.connect(self.update_folder_path)
         self.subtitle_source_lineEdit.edit_finished_signal.connect(self.update_folder_path)
@@ -103,6 +109,10 @@ class SubtitleSelectionSetting(QGroupBox):
         self.files_names_absolute_list_with_dropped_files = []
         self.current_subtitle_extensions = Options.CurrentPreset.Default_Subtitle_Extensions
         self.is_drag_and_drop = False
+        self.include_subfolders = False
+        self.walk_folder_thread = None
+        self.walk_folder_worker = None
+        self.stopped_walks = []  # (thread, worker) of the stopped walks, kept until they finish the folder they read
 
     def setup_layouts(self):
         self.setup_subtitle_check_default_forced_layout()
@@ -142,6 +152,7 @@ class SubtitleSelectionSetting(QGroupBox):
         self.setLayout(self.main_layout)
 
     def update_folder_path(self, new_path: str):
+        forget_folder_scan(new_path)
         if new_path != "":
             self.subtitle_source_lineEdit.set_text_safe_change(new_path)
             self.update_files_lists(new_path)
@@ -187,6 +198,10 @@ class SubtitleSelectionSetting(QGroupBox):
         try:
             self.is_drag_and_drop = False
             self.folder_path = folder_path
+            self.include_subfolders = Options.Subfolders_Depth > 0
+            if self.include_subfolders:
+                self.walk_subfolders(self.folder_path)
+                return
             self.files_names_list = self.get_files_list(self.folder_path)
             self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list, self.folder_path)
             self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
@@ -200,31 +215,80 @@ class SubtitleSelectionSetting(QGroupBox):
             self.update_files_lists(self.folder_path)
             self.show_subtitle_files_list()
 
+    def update_files_from_folder_watch(self, folder_path, changed_files_names):
+        if self.is_drag_and_drop or not is_same_folder(folder_path, self.folder_path):
+            return
+        listed_files_names = self.get_files_list(self.folder_path)
+        new_files, removed_files, modified_files = get_watched_folder_changes(
+            self.files_names_list, listed_files_names, changed_files_names)
+        if len(new_files) == 0 and len(removed_files) == 0:
+            return
+        self.files_names_list = add_new_files_names(
+            [file_name for file_name in self.files_names_list if file_name not in removed_files], new_files,
+            listed_files_names)
+        self.files_names_absolute_list = get_watched_files_names_absolute_list(self.files_names_list, self.folder_path)
+        self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
+        self.show_subtitle_files_list()
+
+    # the walk runs in the background and each folder files are shown as soon as it's read
+    # noinspection PyAttributeOutsideInit
+    def walk_subfolders(self, folder_path):
+        get_folder_scan(folder_path)  # a wrong path fails here like it does without subfolders
+        self.stop_walking_subfolders()
+        self.files_names_list = []
+        self.files_names_absolute_list = []
+        self.files_names_absolute_list_with_dropped_files = []
+        self.walk_folder_thread = QThread()
+        self.walk_folder_worker = WalkFolderWorker(folder_path, Options.Subfolders_Depth)
+        self.walk_folder_worker.moveToThread(self.walk_folder_thread)
+        self.walk_folder_thread.started.connect(self.walk_folder_worker.run)
+        self.walk_folder_worker.folder_found_signal.connect(self.add_subfolder_files)
+        self.walk_folder_worker.finished_all_jobs_signal.connect(self.walk_folder_thread.quit)
+        self.walk_folder_thread.start()
+
+    # the old walk stops after the folder it's reading, a slow folder must not freeze the tab so it isn't waited for,
+    # its files are no longer received and its thread and worker are freed once it's finished
+    def stop_walking_subfolders(self):
+        self.stopped_walks = [(thread, worker) for thread, worker in self.stopped_walks if not thread.isFinished()]
+        if self.walk_folder_thread is None:
+            return
+        if not self.walk_folder_thread.isFinished():
+            self.walk_folder_worker.stop = True
+            self.walk_folder_thread.requestInterruption()
+            self.walk_folder_worker.folder_found_signal.disconnect(self.add_subfolder_files)
+            self.walk_folder_thread.quit()
+            self.stopped_walks.append((self.walk_folder_thread, self.walk_folder_worker))
+        self.walk_folder_thread = None
+        self.walk_folder_worker = None
+
+    # the files lists are frozen while the queue is set up, a walk finishing late must not change them
+    def add_subfolder_files(self, walked_folder_path, folder_scan):
+        if not GlobalSetting.JOB_QUEUE_EMPTY:
+            return
+        if self.is_drag_and_drop or not is_same_folder(walked_folder_path, self.folder_path):
+            return
+        files_names = folder_scan.get_files_names(self.subtitle_extensions_comboBox.currentData())
+        if len(files_names) == 0:
+            return
+        listed_files = set(self.files_names_absolute_list)
+        for file_name in files_names:
+            file_name_absolute = os.path.join(folder_scan.folder_path, file_name)
+            if file_name_absolute not in listed_files:
+                self.files_names_list.append(file_name)
+                self.files_names_absolute_list.append(file_name_absolute)
+        self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
+        self.show_subtitle_files_list()
+
     def get_files_list(self, folder_path):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, folder_path)
-        current_extensions = self.subtitle_extensions_comboBox.currentData()
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            if os.path.getsize(temp_files_names_absolute[i]) == 0:
-                continue
-            for j in range(len(current_extensions)):
-                temp_file_extension_start_index = temp_files_names[i].rfind(".")
-                if temp_file_extension_start_index == -1:
-                    continue
-                temp_file_extension = temp_files_names[i][temp_file_extension_start_index + 1:]
-                if temp_file_extension.lower() == current_extensions[j].lower():
-                    result.append(temp_files_names[i])
-                    break
-        return result
+        return get_folder_scan(folder_path).get_files_names(self.subtitle_extensions_comboBox.currentData())
 
     def show_subtitle_files_list(self):
         self.update_other_classes_variables()
         self.subtitle_match_layout.show_subtitle_files()
 
     def update_other_classes_variables(self):
+        # only the chosen folder is watched, so the subfolders files would be seen as removed
+        get_folder_watcher().watch_folder(self, "" if self.include_subfolders else self.folder_path)
         # self.change_global_last_path_directory()
         self.change_global_subtitle_list()
         self.subtitle_source_button.set_is_there_old_file(len(self.files_names_list) > 0)
@@ -238,6 +302,7 @@ class SubtitleSelectionSetting(QGroupBox):
         self.is_there_old_files_signal.emit(len(self.files_names_list) > 0)
 
     def clear_files(self):
+        self.stop_walking_subfolders()
         self.folder_path = ""
         self.files_names_list = []
         self.files_names_absolute_list = []
@@ -379,6 +444,7 @@ class SubtitleSelectionSetting(QGroupBox):
                         new_files_absolute_path_list.append(path)
                         break
             else:
+                forget_folder_scan(path)
                 new_files_absolute_path_list.extend(
                     sort_names_like_windows(get_files_names_absolute_list(self.get_files_list(path), path)))
 
@@ -1,5 +1,5 @@
 from PySide6.QtCore import Signal
-from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QWidget
 
 from packages.Tabs.GlobalSetting import GlobalSetting
 from packages.Tabs.SubtitleTab.SubtitleSelection import SubtitleSelectionSetting
@@ -7,7 +7,7 @@ from packages.Tabs.SubtitleTab.Widgets.SubtitleTabComboBox import SubtitleTabCom
 from packages.Tabs.SubtitleTab.Widgets.SubtitleTabDeleteButton import SubtitleTabDeleteButton
 
 
-class SubtitleTabManager(GlobalSetting):
+class SubtitleTabManager(QWidget, GlobalSetting):
     activation_signal = Signal(bool)
     tab_clicked_signal = Signal()
 
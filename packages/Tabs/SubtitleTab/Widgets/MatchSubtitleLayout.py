@@ -29,6 +29,7 @@ class MatchSubtitleLayout(QHBoxLayout):
         )
         self.match_tools_layout.refresh_subtitle_table_signal.connect(self.show_subtitle_files_after_swapping_deleting)
         self.match_tools_layout.selected_subtitle_row_signal.connect(self.change_selected_subtitle_row)
+        self.match_tools_layout.subtitle_files_matched_signal.connect(self.show_subtitle_files)
 
     def setup_layout(self):
         self.addWidget(self.video_table, 50)
@@ -2,6 +2,7 @@ from PySide6.QtCore import Signal
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QVBoxLayout
 
+from packages.Tabs.FileMatching import get_matched_files_lists
 from packages.Tabs.GlobalSetting import GlobalSetting
 from packages.Tabs.SubtitleTab.Widgets.DeleteSubtitleButton import DeleteSubtitleButton
 from packages.Tabs.SubtitleTab.Widgets.MoveSubtitleBottomButton import MoveSubtitleBottomButton
@@ -9,11 +10,15 @@ from packages.Tabs.SubtitleTab.Widgets.MoveSubtitleDownButton import MoveSubtitl
 from packages.Tabs.SubtitleTab.Widgets.MoveSubtitleToButton import MoveSubtitleToButton
 from packages.Tabs.SubtitleTab.Widgets.MoveSubtitleTopButton import MoveSubtitleTopButton
 from packages.Tabs.SubtitleTab.Widgets.MoveSubtitleUpButton import MoveSubtitleUpButton
+from packages.Widgets.AutoMatchButton import AutoMatchButton
+from packages.Widgets.InfoDialog import InfoDialog
+from packages.Widgets.WarningDialog import WarningDialog
 
 
 class MatchSubtitleToolsLayout(QVBoxLayout):
     refresh_subtitle_table_signal = Signal()
     selected_subtitle_row_signal = Signal(int)
+    subtitle_files_matched_signal = Signal()
 
     def __init__(self, tab_index, parent=None):
         super().__init__()
@@ -26,6 +31,7 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.move_subtitle_bottom_button = MoveSubtitleBottomButton()
         self.move_subtitle_to_button = MoveSubtitleToButton()
         self.delete_subtitle_button = DeleteSubtitleButton()
+        self.auto_match_subtitle_button = AutoMatchButton("subtitle")
         self.setup_shortcuts()
         self.setup_layout()
         self.connect_signals()
@@ -54,6 +60,7 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.delete_subtitle_button.delete_happened_signal.connect(
             self.update_global_subtitle_files_list_order_deleting)
         self.delete_subtitle_button.selected_row_after_delete.connect(self.change_selected_subtitle_row)
+        self.auto_match_subtitle_button.clicked_signal.connect(self.auto_match_subtitle_files)
 
     def setup_layout(self):
         self.addStretch()
@@ -68,6 +75,8 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.addWidget(self.move_subtitle_down_button)
         self.addSpacing(10)
         self.addWidget(self.delete_subtitle_button)
+        self.addSpacing(10)
+        self.addWidget(self.auto_match_subtitle_button)
         self.addStretch()
 
     def set_selected_row(self, selected_row, max_index):
@@ -105,6 +114,9 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.delete_subtitle_shortcut = QShortcut(QKeySequence("Delete"), self.subtitle_tab)
         self.delete_subtitle_shortcut.activated.connect(self.delete_subtitle_button.clicked_button)
 
+        self.auto_match_subtitle_shortcut = QShortcut(QKeySequence("Ctrl+E"), self.subtitle_tab)
+        self.auto_match_subtitle_shortcut.activated.connect(self.auto_match_subtitle_button.clicked_button)
+
     def refresh_subtitle_table(self):
         self.refresh_subtitle_table_signal.emit()
 
@@ -119,6 +131,7 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.move_subtitle_bottom_button.setEnabled(False)
         self.move_subtitle_to_button.setEnabled(False)
         self.delete_subtitle_button.setEnabled(False)
+        self.auto_match_subtitle_button.setEnabled(False)
 
         self.move_subtitle_up_shortcut.setEnabled(False)
         self.move_subtitle_top_shortcut.setEnabled(False)
@@ -126,6 +139,7 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.move_subtitle_bottom_shortcut.setEnabled(False)
         self.move_subtitle_to_shortcut.setEnabled(False)
         self.delete_subtitle_shortcut.setEnabled(False)
+        self.auto_match_subtitle_shortcut.setEnabled(False)
 
     def enable_editable_widgets(self):
         self.move_subtitle_up_button.setEnabled(True)
@@ -134,6 +148,7 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.move_subtitle_bottom_button.setEnabled(True)
         self.move_subtitle_to_button.setEnabled(True)
         self.delete_subtitle_button.setEnabled(True)
+        self.auto_match_subtitle_button.setEnabled(True)
 
         self.move_subtitle_up_shortcut.setEnabled(True)
         self.move_subtitle_top_shortcut.setEnabled(True)
@@ -141,6 +156,7 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         self.move_subtitle_bottom_shortcut.setEnabled(True)
         self.move_subtitle_to_shortcut.setEnabled(True)
         self.delete_subtitle_shortcut.setEnabled(True)
+        self.auto_match_subtitle_shortcut.setEnabled(True)
 
     def update_global_subtitle_files_list_order_to_top(self, index_to_move):
         while index_to_move > 0:
@@ -211,3 +227,20 @@ class MatchSubtitleToolsLayout(QVBoxLayout):
         del GlobalSetting.SUBTITLE_FILES_LIST[self.tab_index][index_to_delete]
         del GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[self.tab_index][index_to_delete]
         self.refresh_subtitle_table()
+
+    def auto_match_subtitle_files(self):
+        if len(GlobalSetting.SUBTITLE_FILES_LIST[self.tab_index]) == 0 or len(GlobalSetting.VIDEO_FILES_LIST) == 0:
+            return
+        new_files_names, new_files_absolute_paths, matching_report, is_check_needed = get_matched_files_lists(
+            GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST, GlobalSetting.SUBTITLE_FILES_LIST[self.tab_index],
+            GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[self.tab_index])
+        GlobalSetting.SUBTITLE_FILES_LIST[self.tab_index] = new_files_names
+        GlobalSetting.SUBTITLE_FILES_ABSOLUTE_PATH_LIST[self.tab_index] = new_files_absolute_paths
+        self.subtitle_files_matched_signal.emit()
+        if is_check_needed:
+            matching_dialog = WarningDialog(window_title="Subtitle Matching", info_message=matching_report,
+                                            parent=self.subtitle_tab)
+        else:
+            matching_dialog = InfoDialog(window_title="Subtitle Matching", info_message=matching_report,
+                                         parent=self.subtitle_tab)
+        matching_dialog.execute()
@@ -1,5 +1,3 @@
-import os
-
 from PySide6 import QtCore, QtGui
 from PySide6.QtCore import Qt, QEvent
 from PySide6.QtGui import QFontMetrics
@@ -8,7 +6,8 @@ from PySide6.QtWidgets import QStyledItemDelegate, QComboBox
 from packages.Startup.Options import Options
 from packages.Startup.InitializeScreenResolution import screen_size
 from packages.Startup.PreDefined import AllSubtitlesExtensions
-from packages.Tabs.GlobalSetting import GlobalSetting, get_files_names_absolute_list, sort_names_like_windows
+from packages.Tabs.FolderScan import get_folder_scan
+from packages.Tabs.GlobalSetting import GlobalSetting, sort_names_like_windows
 from packages.Tabs.SubtitleTab.Widgets.ReloadSubtitleFilesDialog import ReloadSubtitleFilesDialog
 
 
@@ -196,21 +195,7 @@ class SubtitleExtensionsCheckableComboBox(QComboBox):
         self.updateText()
 
     def get_files_list(self, new_extensions):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(self.current_folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, self.current_folder_path)
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            for j in range(len(new_extensions)):
-                temp_file_extension_start_index = temp_files_names[i].rfind(".")
-                if temp_file_extension_start_index == -1:
-                    continue
-                temp_file_extension = temp_files_names[i][temp_file_extension_start_index + 1:]
-                if temp_file_extension.lower() == new_extensions[j].lower():
-                    result.append(temp_files_names[i])
-                    break
-        return result
+        return get_folder_scan(self.current_folder_path).get_files_names(new_extensions, skip_empty_files=False)
 
     def check_extensions_changes(self):
         new_extensions = self.currentData()
@@ -1,17 +1,20 @@
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QThread
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QTabWidget, QHBoxLayout, QWidget
 
 from packages.Startup import ColorThems
+from packages.Startup import GlobalFiles
 from packages.Startup.Options import Options
 from packages.Startup.SetupThems import get_dark_palette, get_light_palette
-from packages.Tabs.AttachmentTab.AttachmentSelection import AttachmentSelectionSetting
+from packages.Startup.StartupTiming import mark_startup_step, log_startup_timing_report, profile_widget_construction
 from packages.Tabs.AudioTab.AudioTabManager import AudioTabManager
-from packages.Tabs.ChapterTab.ChapterSelection import ChapterSelectionSetting
 from packages.Tabs.MuxSetting.MuxSetting import MuxSettingTab
 from packages.Tabs.SettingTab.SettingButton import SettingButton
 from packages.Tabs.SubtitleTab.SubtitleTabManager import SubtitleTabManager
 from packages.Tabs.VideoTab.VideoSelection import VideoSelectionSetting
+from packages.Widgets.DetectToolsWorker import DetectToolsWorker
+from packages.Widgets.LazyTabWidget import LazyTabWidget
+from packages.Widgets.MissingFilesMessage import MissingFilesMessage
 from packages.Widgets.ThemeButton import ThemeButton
 
 
@@ -33,12 +36,19 @@ class TabsManager(QTabWidget):
     theme_changed_signal=Signal()
     def __init__(self):
         super().__init__()
-        self.video_tab = VideoSelectionSetting()
-        self.subtitle_tab = SubtitleTabManager()
-        self.audio_tab = AudioTabManager()
-        self.attachment_tab = AttachmentSelectionSetting()
-        self.chapter_tab = ChapterSelectionSetting()
-        self.mux_setting_tab = MuxSettingTab()
+        with profile_widget_construction("VideoSelectionSetting"):
+            self.video_tab = VideoSelectionSetting()
+        with profile_widget_construction("SubtitleTabManager"):
+            self.subtitle_tab = SubtitleTabManager()
+        with profile_widget_construction("AudioTabManager"):
+            self.audio_tab = AudioTabManager()
+        # attachment and chapter tabs are disabled by default, so they are only created once they're opened
+        self.attachment_tab = None
+        self.chapter_tab = None
+        self.attachment_lazy_tab = LazyTabWidget(create_tab_function=self.create_attachment_tab)
+        self.chapter_lazy_tab = LazyTabWidget(create_tab_function=self.create_chapter_tab)
+        with profile_widget_construction("MuxSettingTab"):
+            self.mux_setting_tab = MuxSettingTab()
         self.tabs_ids = {
             "Video": 0,
             "Subtitle": 1,
@@ -50,8 +60,10 @@ class TabsManager(QTabWidget):
         self.tabs_status = [True, True, False, False, False, True]
         self.add_tabs()
 
-        self.setting_button = SettingButton()
-        self.theme_button = ThemeButton()
+        with profile_widget_construction("SettingButton"):
+            self.setting_button = SettingButton()
+        with profile_widget_construction("ThemeButton"):
+            self.theme_button = ThemeButton()
         self.button_layout = QHBoxLayout()
         self.buttons_widget = QWidget()
         self.button_layout.addWidget(self.theme_button)
@@ -66,18 +78,32 @@ class TabsManager(QTabWidget):
         self.addTab(self.video_tab, "Videos")
         self.addTab(self.subtitle_tab, "Subtitles")
         self.addTab(self.audio_tab, "Audios")
-        self.addTab(self.chapter_tab, "Chapters")
-        self.addTab(self.attachment_tab, "Attachments")
+        self.addTab(self.chapter_lazy_tab, "Chapters")
+        self.addTab(self.attachment_lazy_tab, "Attachments")
         self.addTab(self.mux_setting_tab, "Mux Setting")
 
+    def create_attachment_tab(self):
+        from packages.Tabs.AttachmentTab.AttachmentSelection import AttachmentSelectionSetting
+
+        with profile_widget_construction("AttachmentSelectionSetting"):
+            self.attachment_tab = AttachmentSelectionSetting()
+        self.attachment_tab.activation_signal.connect(self.change_attachment_activated_state)
+        return self.attachment_tab
+
+    def create_chapter_tab(self):
+        from packages.Tabs.ChapterTab.ChapterSelection import ChapterSelectionSetting
+
+        with profile_widget_construction("ChapterSelectionSetting"):
+            self.chapter_tab = ChapterSelectionSetting()
+        self.chapter_tab.activation_signal.connect(self.change_chapter_activated_state)
+        return self.chapter_tab
+
     def set_tab_color(self, tab_index, color_string):
         self.tabBar().setTabTextColor(tab_index, QColor(*color_string))
 
     def connect_signals(self):
-        self.attachment_tab.activation_signal.connect(self.change_attachment_activated_state)
         self.subtitle_tab.activation_signal.connect(self.change_subtitle_activated_state)
         self.audio_tab.activation_signal.connect(self.change_audio_activated_state)
-        self.chapter_tab.activation_signal.connect(self.change_chapter_activated_state)
         self.mux_setting_tab.start_muxing_signal.connect(self.start_muxing)
         self.mux_setting_tab.update_task_bar_progress_signal.connect(self.update_task_bar_progress_signal.emit)
         self.mux_setting_tab.update_task_bar_paused_signal.connect(self.update_task_bar_paused_signal.emit)
@@ -88,6 +114,29 @@ class TabsManager(QTabWidget):
     def start_muxing(self):
         self.task_bar_start_muxing_signal.emit()
 
+    # noinspection PyAttributeOutsideInit
+    def start_tools_detection(self):
+        self.detect_tools_thread = QThread()
+        self.detect_tools_worker = DetectToolsWorker()
+        self.detect_tools_worker.moveToThread(self.detect_tools_thread)
+        self.detect_tools_thread.started.connect(self.detect_tools_worker.run)
+        self.detect_tools_worker.finished_signal.connect(self.detect_tools_thread.quit)
+        self.detect_tools_worker.finished_signal.connect(self.detect_tools_worker.deleteLater)
+        self.detect_tools_thread.finished.connect(self.detect_tools_thread.deleteLater)
+        self.detect_tools_worker.finished_signal.connect(self.tools_detection_finished)
+        self.detect_tools_thread.start()
+
+    def tools_detection_finished(self, error_message):
+        mark_startup_step("tools detected")
+        log_startup_timing_report(extra_info="mkvmerge and mkvpropedit detection took " +
+                                             str(int(GlobalFiles.ToolsDetectionTime * 1000)) +
+                                             " ms in the background, " +
+                                             str(GlobalFiles.ToolsVersionChecksCount) + " version checks ran")
+        self.mux_setting_tab.tools_detection_finished(error_message)
+        if error_message != "":
+            missing_files_message = MissingFilesMessage(error_message=error_message)
+            missing_files_message.execute()
+
     def setup_tabs_theme(self):
         activate_color, disabled_color = get_activate_and_disabled_color_according_to_current_theme()
         self.set_tab_color(tab_index=self.tabs_ids["Video"], color_string=activate_color)
@@ -134,7 +183,8 @@ class TabsManager(QTabWidget):
         self.video_tab.update_theme_mode_state()
         self.subtitle_tab.update_theme_mode_state()
         self.audio_tab.update_theme_mode_state()
-        self.attachment_tab.update_theme_mode_state()
+        if self.attachment_lazy_tab.is_tab_created():
+            self.attachment_tab.update_theme_mode_state()
         self.mux_setting_tab.update_theme_mode_state()
         self.update_tabs_name_theme_mode_state()
         if Options.Dark_Mode:
@@ -159,9 +209,9 @@ class TabsManager(QTabWidget):
         elif index == self.tabs_ids["Audio"]:
             self.audio_tab.tab_clicked_signal.emit()
         elif index == self.tabs_ids["Attachment"]:
-            self.attachment_tab.tab_clicked_signal.emit()
+            self.attachment_lazy_tab.get_tab().tab_clicked_signal.emit()
         elif index == self.tabs_ids["Chapter"]:
-            self.chapter_tab.tab_clicked_signal.emit()
+            self.chapter_lazy_tab.get_tab().tab_clicked_signal.emit()
         elif index == self.tabs_ids["Mux Setting"]:
             self.mux_setting_tab.tab_clicked_signal.emit()
 
@@ -169,6 +219,9 @@ class TabsManager(QTabWidget):
         self.video_tab.set_preset_options()
         self.subtitle_tab.set_preset_options()
         self.audio_tab.set_preset_options()
-        self.chapter_tab.set_preset_options()
-        self.attachment_tab.set_preset_options()
+        # a preset with a default chapter or attachment folder activates its tab, so it's needed right away
+        if self.chapter_lazy_tab.is_tab_created() or Options.CurrentPreset.Default_Chapter_Directory != "":
+            self.chapter_lazy_tab.get_tab().set_preset_options()
+        if self.attachment_lazy_tab.is_tab_created() or Options.CurrentPreset.Default_Attachment_Directory != "":
+            self.attachment_lazy_tab.get_tab().set_preset_options()
         self.mux_setting_tab.set_preset_options()
@@ -1,9 +1,13 @@
 from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget
 
 from packages.Startup.Options import Options
+from packages.Tabs.FolderScan import get_folder_scan, forget_folder_scan
+from packages.Tabs.FolderWatcher import add_new_files_names, get_folder_watcher, get_watched_folder_changes, \
+    is_same_folder
 from packages.Tabs.GlobalSetting import *
-from packages.Tabs.GlobalSetting import sort_names_like_windows, get_readable_filesize, get_files_names_absolute_list, \
-    get_file_name_absolute_path
+from packages.Tabs.GlobalSetting import sort_names_like_windows, get_readable_filesize, get_files_names_absolute_list
+from packages.Tabs.MediaInfoCache import get_cached_media_info
 from packages.Tabs.VideoTab.Widgets.LoadingVideosInfoDialog import LoadingVideosInfoDialog
 from packages.Widgets.RefreshFilesButton import RefreshFilesButton
 from packages.Tabs.VideoTab.Widgets.VideoClearButton import VideoClearButton
@@ -14,6 +18,7 @@ from packages.Tabs.VideoTab.Widgets.ModifyOldTracksWidgtes.ModifyOldTracksButton
 from packages.Tabs.VideoTab.Widgets.VideoSourceButton import VideoSourceButton
 from packages.Tabs.VideoTab.Widgets.VideoSourceLineEdit import VideoSourceLineEdit
 from packages.Tabs.VideoTab.Widgets.VideoTable import VideoTable
+from packages.Tabs.WalkFolderWorker import WalkFolderWorker
 from packages.Widgets.ErrorDialog import ErrorDialog
 from packages.Widgets.InvalidPathDialog import *
 # noinspection PyAttributeOutsideInit
@@ -21,10 +26,10 @@ from packages.Widgets.WarningDialog import WarningDialog
 
 
 def get_files_size_list(files_list, folder_path):
+    folder_scan = get_folder_scan(folder_path)
     files_size_list = []
     for i in range(len(files_list)):
-        file_name_absolute = get_file_name_absolute_path(file_name=files_list[i], folder_path=folder_path)
-        file_size_bytes = os.path.getsize(file_name_absolute)
+        file_size_bytes = max(folder_scan.get_file_size(files_list[i]), 0)
         files_size_list.append(get_readable_filesize(size_bytes=file_size_bytes))
     return files_size_list
 
@@ -40,23 +45,15 @@ def get_files_size_with_absolute_path_list(files_name_absolute_path):
 
 
 def update_global_videos_tracks_info():
+    GlobalSetting.VIDEO_TRACKS_INDEX.set_videos(GlobalSetting.VIDEO_FILES_ABSOLUTE_PATH_LIST)
     GlobalSetting.MUX_SETTING_AUDIO_TRACKS_LIST = refresh_tracks("audio")
     GlobalSetting.MUX_SETTING_SUBTITLE_TRACKS_LIST = refresh_tracks("subtitles")
     refresh_old_tracks_info("video")
     refresh_old_tracks_info("audio")
     refresh_old_tracks_info("subtitles")
-    GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_MODIFIED_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_REORDER_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_VIDEOS_DELETED_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_MODIFIED_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_REORDER_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_SUBTITLES_DELETED_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_MODIFIED_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_REORDER_ACTIVATED = False
-    GlobalSetting.VIDEO_OLD_TRACKS_AUDIOS_DELETED_ACTIVATED = False
-
-
-class VideoSelectionSetting(GlobalSetting):
+
+
+class VideoSelectionSetting(QWidget, GlobalSetting):
     tab_clicked_signal = Signal()
 
     def __init__(self):
@@ -86,6 +83,8 @@ class VideoSelectionSetting(GlobalSetting):
         self.unsupported_files_list = []
         self.current_video_extensions = Options.CurrentPreset.Default_Video_Extensions
         self.is_drag_and_drop = False
+        self.include_subfolders = False
+        self.subfolders_duplicate_files_list = []
         self.setup_widgets()
         self.connect_signals()
 
@@ -105,6 +104,7 @@ class VideoSelectionSetting(GlobalSetting):
         self.side_buttons_layout.addWidget(self.video_info_button)
 
     def update_folder_path(self, new_path: str):
+        forget_folder_scan(new_path)
         if new_path != "":
             self.video_source_lineEdit.set_text_safe_change(new_path)
             self.update_files_lists(new_path)
@@ -179,35 +179,42 @@ class VideoSelectionSetting(GlobalSetting):
         try:
             self.is_drag_and_drop = False
             self.folder_path = folder_path
-            self.folders_paths = [Path(folder_path)]
-            self.files_names_list = self.get_files_list(self.folder_path)
-            self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list, self.folder_path)
-            self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
-            self.files_size_list = get_files_size_list(files_list=self.files_names_list, folder_path=self.folder_path)
-            self.files_names_checked_list = ([True] * len(self.files_names_absolute_list))
+            self.include_subfolders = Options.Subfolders_Depth > 0
             self.unsupported_files_list = []
-            if len(self.files_names_absolute_list) > 0:
-                self.unsupported_files_list = self.start_loading_new_videos_dialog(self.files_names_absolute_list)
-                if len(self.unsupported_files_list) > 0:
-                    new_files_absolute_path_list = []
-                    self.files_names_list = []
-                    self.folders_paths = []
-                    for file_absolute_path in self.files_names_absolute_list:
-                        if file_absolute_path not in self.unsupported_files_list:
-                            new_files_absolute_path_list.append(file_absolute_path)
-                            self.files_names_list.append(os.path.basename(file_absolute_path))
-                            if os.path.dirname(file_absolute_path) not in self.folders_paths:
-                                self.folders_paths.append(Path(os.path.dirname(file_absolute_path)))
-                    self.files_names_absolute_list = new_files_absolute_path_list.copy()
-                    self.files_size_list = get_files_size_with_absolute_path_list(new_files_absolute_path_list)
-                    self.files_names_absolute_list_with_dropped_files = new_files_absolute_path_list.copy()
-                    self.files_names_checked_list = ([True] * len(new_files_absolute_path_list))
-                    error_message = "One or more files couldn't be recognised as video:"
-                    for file_name_absolute in self.unsupported_files_list:
-                        error_message += "\n" + os.path.basename(file_name_absolute)
-                    error_dialog = ErrorDialog(window_title="Unrecognised files", error_message=error_message,
-                                               parent=self.window())
-                    error_dialog.execute_wth_no_block()
+            if self.include_subfolders:
+                self.unsupported_files_list = self.walk_subfolders_videos(self.folder_path)
+            else:
+                self.folders_paths = [Path(folder_path)]
+                self.files_names_list = self.get_files_list(self.folder_path)
+                self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list,
+                                                                               self.folder_path)
+                self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
+                self.files_size_list = get_files_size_list(files_list=self.files_names_list,
+                                                           folder_path=self.folder_path)
+                self.files_names_checked_list = ([True] * len(self.files_names_absolute_list))
+                if len(self.files_names_absolute_list) > 0:
+                    self.unsupported_files_list = self.start_loading_new_videos_dialog(
+                        self.files_names_absolute_list)
+            if len(self.unsupported_files_list) > 0:
+                new_files_absolute_path_list = []
+                self.files_names_list = []
+                self.folders_paths = []
+                for file_absolute_path in self.files_names_absolute_list:
+                    if file_absolute_path not in self.unsupported_files_list:
+                        new_files_absolute_path_list.append(file_absolute_path)
+                        self.files_names_list.append(os.path.basename(file_absolute_path))
+                        if os.path.dirname(file_absolute_path) not in self.folders_paths:
+                            self.folders_paths.append(Path(os.path.dirname(file_absolute_path)))
+                self.files_names_absolute_list = new_files_absolute_path_list.copy()
+                self.files_size_list = get_files_size_with_absolute_path_list(new_files_absolute_path_list)
+                self.files_names_absolute_list_with_dropped_files = new_files_absolute_path_list.copy()
+                self.files_names_checked_list = ([True] * len(new_files_absolute_path_list))
+                error_message = "One or more files couldn't be recognised as video:"
+                for file_name_absolute in self.unsupported_files_list:
+                    error_message += "\n" + os.path.basename(file_name_absolute)
+                error_dialog = ErrorDialog(window_title="Unrecognised files", error_message=error_message,
+                                           parent=self.window())
+                error_dialog.execute_wth_no_block()
         except Exception as e:
             invalid_path_dialog = InvalidPathDialog(parent=self)
             invalid_path_dialog.execute()
@@ -216,25 +223,31 @@ class VideoSelectionSetting(GlobalSetting):
         self.video_refresh_files_button.setEnabled(False)
         self.video_refresh_files_button.setToolTip("Disabled due to Drag/Drop mode")
 
+    def update_files_from_folder_watch(self, folder_path, changed_files_names):
+        if self.is_drag_and_drop or not is_same_folder(folder_path, self.folder_path):
+            return
+        listed_files_names = self.get_files_list(self.folder_path)
+        new_files, removed_files, modified_files = get_watched_folder_changes(
+            self.files_names_list, listed_files_names, changed_files_names)
+        if len(new_files) == 0 and len(removed_files) == 0 and len(modified_files) == 0:
+            return
+        # only the new and modified videos are scanned again
+        unsupported_files_list = self.start_loading_new_videos_dialog(
+            get_files_names_absolute_list(new_files + modified_files, self.folder_path))
+        removed_files = set(removed_files)
+        removed_files.update(os.path.basename(file_name_absolute) for file_name_absolute in unsupported_files_list)
+        files_checked = dict(zip(self.files_names_list, self.files_names_checked_list))
+        self.files_names_list = add_new_files_names(
+            [file_name for file_name in self.files_names_list if file_name not in removed_files],
+            [file_name for file_name in new_files if file_name not in removed_files], listed_files_names)
+        self.files_names_checked_list = [files_checked.get(file_name, True) for file_name in self.files_names_list]
+        self.files_names_absolute_list = get_files_names_absolute_list(self.files_names_list, self.folder_path)
+        self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
+        self.files_size_list = get_files_size_list(files_list=self.files_names_list, folder_path=self.folder_path)
+        self.show_files_list()
+
     def get_files_list(self, folder_path):
-        temp_files_names = sort_names_like_windows(names_list=os.listdir(folder_path))
-        temp_files_names_absolute = get_files_names_absolute_list(temp_files_names, folder_path)
-        current_extensions = self.video_extensions_comboBox.currentData()
-        result = []
-        for i in range(len(temp_files_names)):
-            if os.path.isdir(temp_files_names_absolute[i]):
-                continue
-            if os.path.getsize(temp_files_names_absolute[i]) == 0:
-                continue
-            for j in range(len(current_extensions)):
-                temp_file_extension_start_index = temp_files_names[i].rfind(".")
-                if temp_file_extension_start_index == -1:
-                    continue
-                temp_file_extension = temp_files_names[i][temp_file_extension_start_index + 1:]
-                if temp_file_extension.lower() == current_extensions[j].lower():
-                    result.append(temp_files_names[i])
-                    break
-        return result
+        return get_folder_scan(folder_path).get_files_names(self.video_extensions_comboBox.currentData())
 
     def move_video_file_down(self, video_index):
         self.files_names_list[video_index], self.files_names_list[video_index + 1] = self.files_names_list[
@@ -281,6 +294,8 @@ class VideoSelectionSetting(GlobalSetting):
         self.update_other_classes_variables()
 
     def update_other_classes_variables(self):
+        # only the chosen folder is watched, so the subfolders files would be seen as removed
+        get_folder_watcher().watch_folder(self, "" if self.include_subfolders else self.folder_path)
         self.change_global_last_path_directory()
         self.change_global_video_list()
         self.change_global_video_source_path()
@@ -382,6 +397,7 @@ class VideoSelectionSetting(GlobalSetting):
         GlobalSetting.VIDEO_SOURCE_PATHS = self.folders_paths
 
     def connect_signals(self):
+        get_folder_watcher().folder_changed_signal.connect(self.update_files_from_folder_watch)
         self.video_source_button.clicked_signal.connect(self.update_folder_path)
         self.video_source_lineEdit.edit_finished_signal.connect(self.update_folder_path)
         self.video_source_lineEdit.set_is_drag_and_drop_signal.connect(self.update_is_drag_and_drop)
@@ -425,6 +441,7 @@ class VideoSelectionSetting(GlobalSetting):
             else:
                 if os.path.dirname(path) not in self.folders_paths:
                     self.folders_paths.append(Path(os.path.dirname(path)))
+                forget_folder_scan(path)
                 new_files_absolute_path_list.extend(
                     sort_names_like_windows(get_files_names_absolute_list(self.get_files_list(path), path)))
 
@@ -484,9 +501,75 @@ class VideoSelectionSetting(GlobalSetting):
             warning_dialog.execute_wth_no_block()
 
     def start_loading_new_videos_dialog(self, new_videos_list):
-        loading_videos_info_dialog = LoadingVideosInfoDialog(new_videos_list, parent=self.window())
+        unsupported_files_list = []
+        not_cached_videos_list = []
+        for video_name in new_videos_list:
+            media_info = get_cached_media_info(video_name)
+            if media_info is None:
+                not_cached_videos_list.append(video_name)
+            elif not media_info.is_valid_video:
+                unsupported_files_list.append(video_name)
+        if len(not_cached_videos_list) > 0:
+            loading_videos_info_dialog = LoadingVideosInfoDialog(not_cached_videos_list, parent=self.window())
+            loading_videos_info_dialog.execute()
+            unsupported_files_list.extend(loading_videos_info_dialog.unsupported_files_list)
+        return unsupported_files_list
+
+    # the videos are added to the table folder by folder while the walk goes on, and each folder videos are scanned
+    # as soon as it's read, returns the unsupported videos
+    def walk_subfolders_videos(self, folder_path):
+        get_folder_scan(folder_path)  # a wrong path fails here like it does without subfolders
+        self.folders_paths = []
+        self.files_names_list = []
+        self.files_names_absolute_list = []
+        self.files_size_list = []
+        self.files_names_checked_list = []
+        self.subfolders_duplicate_files_list = []
+        self.table.setRowCount(0)
+        walk_folder_worker = WalkFolderWorker(folder_path, Options.Subfolders_Depth,
+                                              probe_extensions=self.video_extensions_comboBox.currentData())
+        walk_folder_worker.folder_found_signal.connect(self.add_subfolder_videos)
+        loading_videos_info_dialog = LoadingVideosInfoDialog([], parent=self.window(),
+                                                             media_info_worker=walk_folder_worker)
         loading_videos_info_dialog.execute()
-        return loading_videos_info_dialog.unsupported_files_list
+        self.files_names_absolute_list_with_dropped_files = self.files_names_absolute_list.copy()
+        if len(self.subfolders_duplicate_files_list) > 0:
+            info_message = "One or more files have the same name with files in other folders will be skipped:"
+            for file_name_absolute in self.subfolders_duplicate_files_list:
+                info_message += "\n" + file_name_absolute
+            warning_dialog = WarningDialog(window_title="Duplicate files names", info_message=info_message,
+                                           parent=self.window())
+            warning_dialog.execute_wth_no_block()
+        # the skipped duplicates are scanned too, only the listed videos matter
+        listed_files = set(self.files_names_absolute_list)
+        return [file_name for file_name in loading_videos_info_dialog.unsupported_files_list
+                if file_name in listed_files]
+
+    def add_subfolder_videos(self, walked_folder_path, folder_scan):
+        if not is_same_folder(walked_folder_path, self.folder_path):
+            return
+        files_names = folder_scan.get_files_names(self.video_extensions_comboBox.currentData())
+        if len(files_names) == 0:
+            return
+        # the output files are named after the videos, so two videos with the same name can't be muxed together
+        current_files_names = set(file_name.lower() for file_name in self.files_names_list)
+        for file_name in files_names:
+            file_name_absolute = os.path.join(folder_scan.folder_path, file_name)
+            if file_name.lower() in current_files_names:
+                self.subfolders_duplicate_files_list.append(file_name_absolute)
+                continue
+            current_files_names.add(file_name.lower())
+            self.files_names_list.append(file_name)
+            self.files_names_absolute_list.append(file_name_absolute)
+            self.files_size_list.append(get_readable_filesize(size_bytes=folder_scan.get_file_size(file_name)))
+            self.files_names_checked_list.append(True)
+        self.folders_paths.append(Path(folder_scan.folder_path))
+        # only the new rows are added to the table here, the other tabs get the videos once they are all scanned
+        self.table.checking_row_updates = False
+        self.table.append_files_list(files_names_list=self.files_names_list,
+                                     files_names_checked_list=self.files_names_checked_list,
+                                     files_size_list=self.files_size_list)
+        self.table.checking_row_updates = True
 
     def disable_editable_widgets(self):
         self.video_extensions_comboBox.setEnabled(False)
@@ -1,42 +1,11 @@
-import hashlib
-import json
-import os
-import subprocess
-import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6.QtCore import QObject, Signal
 
-from packages.Startup import GlobalFiles
+from packages.Startup.Options import Options
 from packages.Tabs.GlobalSetting import write_to_log_file
-
-
-def add_two_spaces():
-    return "  "
-
-
-def add_double_quotation(string):
-    return add_two_spaces() + "\"" + str(string) + "\""
-
-
-def get_attribute(data, attribute, default_value):
-    return data.get(attribute) or default_value
-
-
-def check_if_valid_video_input(file_name):
-    string_name_hash = hashlib.sha1((str(file_name)).encode('utf-8')).hexdigest()
-    media_info_file_path = os.path.join(GlobalFiles.MediaInfoFolderPath, string_name_hash + ".json")
-    with open(media_info_file_path, 'r', encoding="UTF-8") as media_info_file:
-        json_info = json.load(media_info_file)
-    tracks_json_info = get_attribute(json_info, "tracks", False)
-    if not tracks_json_info:
-        return False
-    is_valid_video = False
-    for track in tracks_json_info:
-        if get_attribute(track, "type", "not video") == "video":
-            is_valid_video = True
-            break
-    return is_valid_video
+from packages.Tabs.MediaInfoCache import probe_media_info
 
 
 class GenerateMediaInfoFilesWorker(QObject):
@@ -47,20 +16,24 @@ class GenerateMediaInfoFilesWorker(QObject):
     def __init__(self, video_list):
         super().__init__()
         self.video_list = video_list
+        self.max_concurrent_probes = max(1, Options.Max_Concurrent_Probes)
 
     def run(self):
         try:
-            for file_name in self.video_list:
-                string_name_hash = hashlib.sha1((str(file_name)).encode('utf-8')).hexdigest()
-                media_info_file_path = os.path.join(GlobalFiles.MediaInfoFolderPath, string_name_hash + ".json")
-                with open(media_info_file_path, 'w+', encoding="UTF-8") as media_info_file:
-                    command = add_double_quotation(GlobalFiles.MKVMERGE_PATH) + " -J " + add_double_quotation(
-                        file_name)
-                    subprocess.run(command, shell=True, stdout=media_info_file, env=GlobalFiles.ENVIRONMENT)
-                time.sleep(0.05)
-                if not check_if_valid_video_input(file_name):
-                    self.job_unsupported_file_signal.emit(file_name)
-                self.job_succeeded_signal.emit()
-            self.finished_all_jobs_signal.emit()
+            # each probe is a separate mkvmerge process, so the threads here only wait on them
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_probes) as probe_pool:
+                probe_jobs = {probe_pool.submit(probe_media_info, file_name): file_name
+                              for file_name in self.video_list}
+                for probe_job in as_completed(probe_jobs):
+                    file_name = probe_jobs[probe_job]
+                    try:
+                        is_valid_video = probe_job.result().is_valid_video
+                    except Exception as e:
+                        write_to_log_file(traceback.format_exc())
+                        is_valid_video = False
+                    if not is_valid_video:
+                        self.job_unsupported_file_signal.emit(file_name)
+                    self.job_succeeded_signal.emit()
         except Exception as e:
             write_to_log_file(traceback.format_exc())
+        self.finished_all_jobs_signal.emit()
@@ -10,10 +10,12 @@ from packages.Widgets.MyDialog import MyDialog
 
 
 class LoadingVideosInfoDialog(MyDialog):
-    def __init__(self, videos_list, parent=None):
+    # media_info_worker replaces the default worker, it's a WalkFolderWorker that finds the videos while scanning them
+    def __init__(self, videos_list, parent=None, media_info_worker=None):
         super().__init__(parent=parent)
         self.setWindowTitle("Loading Media Info")
         self.videos_list = videos_list
+        self.media_info_worker = media_info_worker
         self.videos_count = len(self.videos_list)
         self.current_video_done_index = 0
         self.unsupported_files_list = []
@@ -38,7 +40,11 @@ class LoadingVideosInfoDialog(MyDialog):
     # noinspection PyAttributeOutsideInit
     def generate_media_info_files(self):
         self.generate_media_info_files_thread = QThread()
-        self.generate_media_info_files_worker = GenerateMediaInfoFilesWorker(self.videos_list)
+        if self.media_info_worker is None:
+            self.generate_media_info_files_worker = GenerateMediaInfoFilesWorker(self.videos_list)
+        else:
+            self.generate_media_info_files_worker = self.media_info_worker
+            self.generate_media_info_files_worker.jobs_added_signal.connect(self.add_new_jobs)
         self.generate_media_info_files_worker.moveToThread(self.generate_media_info_files_thread)
         self.generate_media_info_files_thread.started.connect(self.generate_media_info_files_worker.run)
         self.generate_media_info_files_worker.job_succeeded_signal.connect(self.update_progress)
@@ -60,6 +66,11 @@ class LoadingVideosInfoDialog(MyDialog):
         self.status_label.setText(
             "  Scanning Video " + str(self.current_video_done_index) + "/" + str(self.videos_count))
 
+    def add_new_jobs(self, jobs_count):
+        self.videos_count += jobs_count
+        self.status_label.setText(
+            "  Scanning Video " + str(self.current_video_done_index) + "/" + str(self.videos_count))
+
     def add_new_unsupported_file(self, file_name):
         self.unsupported_files_list.append(file_name)
 
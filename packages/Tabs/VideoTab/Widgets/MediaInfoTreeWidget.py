@@ -1,11 +1,8 @@
-import hashlib
-import json
 import os
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QTreeWidgetItem
 
-from packages.Startup import GlobalFiles
 from packages.Tabs.GlobalSetting import GlobalSetting
 from packages.Widgets.SingleTrackData import SingleTrackData
 from packages.Widgets.TreeWidget import TreeWidget
@@ -43,14 +40,10 @@ class MediaInfoTreeWidget(TreeWidget):
             videos_track_info = []
             attachments_info = []
             chapter_num_entries = ""
-            string_name_hash = hashlib.sha1((str(video_name)).encode('utf-8')).hexdigest()
-            media_info_file_path = os.path.join(GlobalFiles.MediaInfoFolderPath, string_name_hash + ".json")
-            # if() not found
-            with open(media_info_file_path, 'r', encoding="UTF-8") as media_info_file:
-                json_info = json.load(media_info_file)
-            tracks_json_info = json_info["tracks"]
-            attachments_json_info = json_info["attachments"]
-            chapters_json_info = json_info["chapters"]
+            media_info = GlobalSetting.VIDEO_TRACKS_INDEX.get_media_info(video_name)
+            tracks_json_info = media_info.tracks
+            attachments_json_info = media_info.attachments
+            chapters_json_info = media_info.chapters
             for track in tracks_json_info:
                 new_track_info = SingleTrackData()
                 new_track_info.codec = str(track["codec"])
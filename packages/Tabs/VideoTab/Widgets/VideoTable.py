@@ -120,7 +120,17 @@ class VideoTable(TableWidget):
     def show_files_list(self, files_names_list, files_names_checked_list, files_size_list):
         self.setRowCount(len(files_names_list))
         self.set_row_height(new_height=screen_size.height() // 27)
-        for i in range(len(files_names_list)):
+        self.show_rows(files_names_list, files_names_checked_list, files_size_list, first_row_index=0)
+
+    # the lists hold the rows already shown followed by the new ones, only the new rows are filled
+    def append_files_list(self, files_names_list, files_names_checked_list, files_size_list):
+        first_row_index = self.rowCount()
+        self.setRowCount(len(files_names_list))
+        self.set_row_height(new_height=screen_size.height() // 27)
+        self.show_rows(files_names_list, files_names_checked_list, files_size_list, first_row_index=first_row_index)
+
+    def show_rows(self, files_names_list, files_names_checked_list, files_size_list, first_row_index):
+        for i in range(first_row_index, len(files_names_list)):
             self.set_row_number(row_number=i + 1, row_index=i)
             self.set_row_file_name(file_name=files_names_list[i], row_index=i, is_checked=files_names_checked_list[i])
             self.set_row_file_size(file_size=files_size_list[i], row_index=i)
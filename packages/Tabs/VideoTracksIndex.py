@@ -0,0 +1,161 @@
+# Here we index the tracks of every loaded video once, so the tabs and the muxing jobs don't have to walk
+# each video media info again whenever they need the list of track ids, languages or names
+import threading
+from collections import defaultdict
+
+from packages.Startup.PreDefined import ISO_639_2_SYMBOLS
+from packages.Tabs.MediaInfoCache import get_media_info, get_attribute, get_file_size_and_modified_time
+from packages.Widgets.SingleOldTrackData import SingleOldTrackData
+
+TRACK_TYPES = ["video", "audio", "subtitles"]
+TRACK_VALUE_ATTRIBUTES = ["track_name", "language", "is_default", "is_forced", "is_enabled"]
+
+
+def create_old_track_data(track):
+    new_track: SingleOldTrackData = SingleOldTrackData()
+    new_track.id = str(track["id"])
+    new_track.codec = str(get_attribute(data=track, attribute="codec", default_value=""))
+    language = str(get_attribute(data=track["properties"], attribute="language", default_value="UND"))
+    language_symbol = language.lower()
+    new_track.language = ISO_639_2_SYMBOLS.get(language_symbol, "Undetermined")
+    name = str(get_attribute(data=track["properties"], attribute="track_name", default_value="UnNamedTrackBeBo"))
+    if name != "UnNamedTrackBeBo":
+        new_track.track_name = name
+    new_track.is_default = get_attribute(data=track["properties"], attribute="default_track", default_value=False)
+    new_track.is_forced = get_attribute(data=track["properties"], attribute="forced_track", default_value=False)
+    new_track.is_enabled = True
+    new_track.uid = str(get_attribute(data=track["properties"], attribute="uid", default_value="-1"))
+    return new_track
+
+
+def update_counter(counter, key, change):
+    counter[key] += change
+    if counter[key] <= 0:
+        del counter[key]
+
+
+class VideoTracksIndex:
+    def __init__(self):
+        self.videos_media_info = {}  # video name -> MediaInfoData
+        self.videos_tracks = {}  # video name -> track type -> [SingleOldTrackData]
+        # track type -> value -> number of tracks having it among all indexed videos
+        self.track_ids = {track_type: defaultdict(int) for track_type in TRACK_TYPES}
+        self.track_languages = {track_type: defaultdict(int) for track_type in TRACK_TYPES}
+        self.track_names = {track_type: defaultdict(int) for track_type in TRACK_TYPES}
+        # track type -> track id -> attribute -> value -> number of tracks with this id having it
+        self.track_id_values = {track_type: {} for track_type in TRACK_TYPES}
+        # track ids whose tracks were added or removed since the last pop_touched_track_ids()
+        self.touched_track_ids = {track_type: set() for track_type in TRACK_TYPES}
+        # the muxing jobs read the media info from their own threads and can index a changed video again
+        self.index_lock = threading.RLock()
+
+    def set_videos(self, video_names):
+        # only index the difference with the current videos, reordering them costs nothing here
+        with self.index_lock:
+            new_videos = set(video_names)
+            for video_name in list(self.videos_tracks.keys()):
+                if video_name not in new_videos or self.is_video_changed(video_name):
+                    self.remove_video(video_name)
+            for video_name in video_names:
+                self.add_video(video_name)
+
+    def is_video_changed(self, video_name):
+        media_info = self.videos_media_info[video_name]
+        return (media_info.file_size, media_info.modified_time) != get_file_size_and_modified_time(video_name)
+
+    def add_video(self, video_name):
+        with self.index_lock:
+            if video_name in self.videos_tracks:
+                return
+            media_info = get_media_info(video_name)
+            video_tracks = {track_type: [] for track_type in TRACK_TYPES}
+            for track in media_info.tracks:
+                track_type = track["type"]
+                if track_type not in video_tracks:
+                    continue
+                new_track = create_old_track_data(track)
+                video_tracks[track_type].append(new_track)
+                self.count_track(track_type, new_track, 1)
+            self.videos_media_info[video_name] = media_info
+            self.videos_tracks[video_name] = video_tracks
+
+    def remove_video(self, video_name):
+        with self.index_lock:
+            video_tracks = self.videos_tracks.pop(video_name, None)
+            self.videos_media_info.pop(video_name, None)
+            if video_tracks is None:
+                return
+            for track_type in TRACK_TYPES:
+                for track in video_tracks[track_type]:
+                    self.count_track(track_type, track, -1)
+
+    def count_track(self, track_type, track, change):
+        update_counter(self.track_ids[track_type], track.id, change)
+        update_counter(self.track_languages[track_type], track.language, change)
+        if track.track_name != "":
+            update_counter(self.track_names[track_type], track.track_name, change)
+        track_id_values = self.track_id_values[track_type]
+        if track.id not in track_id_values:
+            track_id_values[track.id] = {attribute: defaultdict(int) for attribute in TRACK_VALUE_ATTRIBUTES}
+        for attribute in TRACK_VALUE_ATTRIBUTES:
+            update_counter(track_id_values[track.id][attribute], getattr(track, attribute), change)
+        if track.id not in self.track_ids[track_type]:
+            del track_id_values[track.id]
+        self.touched_track_ids[track_type].add(track.id)
+
+    # a video replaced or edited since it was loaded is probed and indexed again, so the jobs never use old track ids
+    # keep_in_cache=False probes it again without touching the index or the media info cache, like when validating
+    def get_media_info(self, video_name, keep_in_cache=True):
+        with self.index_lock:
+            media_info = self.videos_media_info.get(video_name)
+            if media_info is None:
+                return get_media_info(video_name, keep_in_cache)
+            if media_info.probe_error != "" or self.is_video_changed(video_name):
+                if not keep_in_cache:
+                    return get_media_info(video_name, keep_in_cache=False)
+                self.remove_video(video_name)
+                self.add_video(video_name)
+                media_info = self.videos_media_info[video_name]
+            return media_info
+
+    def get_video_tracks(self, video_name, track_type):
+        video_tracks = self.videos_tracks.get(video_name)
+        if video_tracks is None:
+            return []
+        return video_tracks[track_type]
+
+    def get_track_ids(self, track_type):
+        return list(self.track_ids[track_type].keys())
+
+    def get_track_languages(self, track_type):
+        return list(self.track_languages[track_type].keys())
+
+    def get_track_names(self, track_type):
+        return list(self.track_names[track_type].keys())
+
+    def has_track_id(self, track_type, track_id):
+        return track_id in self.track_ids[track_type]
+
+    def get_track_id_values(self, track_type, track_id, attribute):
+        return list(self.track_id_values[track_type][track_id][attribute].keys())
+
+    def get_track_ids_in_videos_order(self, track_type, video_names):
+        track_ids_count = len(self.track_ids[track_type])
+        ordered_track_ids = {}
+        for video_name in video_names:
+            if len(ordered_track_ids) == track_ids_count:
+                break
+            for track in self.get_video_tracks(video_name, track_type):
+                ordered_track_ids.setdefault(track.id)
+        return list(ordered_track_ids.keys())
+
+    def pop_touched_track_ids(self, track_type):
+        touched_track_ids = self.touched_track_ids[track_type]
+        self.touched_track_ids[track_type] = set()
+        return touched_track_ids
+
+    def has_track_language(self, track_type, language):
+        return language in self.track_languages[track_type]
+
+    def has_track_name(self, track_type, track_name):
+        return track_name in self.track_names[track_type]
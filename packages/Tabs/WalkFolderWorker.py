@@ -0,0 +1,76 @@
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from packages.Startup.Options import Options
+from packages.Tabs.FolderScan import walk_folder
+from packages.Tabs.GlobalSetting import write_to_log_file
+from packages.Tabs.MediaInfoCache import get_media_info
+
+running_walks_workers = []  # the walks still reading folders, their files lists aren't complete yet
+
+
+# the jobs are built from the files lists, so they can't be made while a walk still adds files to them, a stopped walk
+# only finishes the folder it's reading and its files are dropped
+def is_walking_subfolders():
+    return any(not walk_folder_worker.stop for walk_folder_worker in running_walks_workers)
+
+
+# Walks the folder and its subfolders and sends each folder scan as soon as it's read, with probe_extensions the
+# videos found are scanned for media info right away while the walk goes on
+class WalkFolderWorker(QObject):
+    folder_found_signal = Signal(str, object)  # walked folder path, FolderScan of it or one of its subfolders
+    jobs_added_signal = Signal(int)  # number of found videos sent to be scanned
+    job_succeeded_signal = Signal()
+    job_unsupported_file_signal = Signal(str)
+    finished_all_jobs_signal = Signal()
+
+    def __init__(self, folder_path, max_depth, probe_extensions=None):
+        super().__init__()
+        self.folder_path = folder_path
+        self.max_depth = max_depth
+        self.probe_extensions = probe_extensions
+        self.max_concurrent_probes = max(1, Options.Max_Concurrent_Probes)
+        self.stop = False
+
+    def run(self):
+        running_walks_workers.append(self)
+        try:
+            # each probe is a separate mkvmerge process, so the threads here only wait on them, the videos that
+            # are already in the media info cache are done right away
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_probes) as probe_pool:
+                for folder_scan in walk_folder(self.folder_path, self.max_depth):
+                    if self.stop or QThread.currentThread().isInterruptionRequested():
+                        probe_pool.shutdown(cancel_futures=True)
+                        break
+                    self.folder_found_signal.emit(self.folder_path, folder_scan)
+                    if self.probe_extensions is None:
+                        continue
+                    files_names = folder_scan.get_files_names(self.probe_extensions)
+                    if len(files_names) == 0:
+                        continue
+                    self.jobs_added_signal.emit(len(files_names))
+                    for file_name in files_names:
+                        file_path = os.path.join(folder_scan.folder_path, file_name)
+                        probe_job = probe_pool.submit(get_media_info, file_path)
+                        probe_job.add_done_callback(
+                            lambda done_probe_job, path=file_path: self.probe_finished(done_probe_job, path))
+        except Exception as e:
+            write_to_log_file(traceback.format_exc())
+        running_walks_workers.remove(self)
+        self.finished_all_jobs_signal.emit()
+
+    # called from the probe pool threads, the signals are queued to the receivers threads
+    def probe_finished(self, probe_job, file_name):
+        if probe_job.cancelled():
+            return
+        try:
+            is_valid_video = probe_job.result().is_valid_video
+        except Exception as e:
+            write_to_log_file(traceback.format_exc())
+            is_valid_video = False
+        if not is_valid_video:
+            self.job_unsupported_file_signal.emit(file_name)
+        self.job_succeeded_signal.emit()
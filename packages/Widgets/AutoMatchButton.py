@@ -0,0 +1,48 @@
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QPushButton
+
+from packages.Tabs.GlobalSetting import GlobalSetting
+
+
+class AutoMatchButton(QPushButton):
+    clicked_signal = Signal()
+
+    def __init__(self, files_type_name):
+        super().__init__()
+        self.setText("Auto Match")
+        self.hint_when_enabled = ""
+        self.files_type_name = files_type_name
+        self.setup_tool_tip_hint()
+        self.clicked.connect(self.clicked_button)
+
+    def clicked_button(self):
+        self.clicked_signal.emit()
+
+    def setup_tool_tip_hint(self):
+        self.setToolTip("Match each video with its " + self.files_type_name + " by season/episode and name (Ctrl+E)")
+        self.setToolTipDuration(3000)
+
+    def setEnabled(self, new_state: bool):
+        super().setEnabled(new_state)
+        if not new_state and not GlobalSetting.JOB_QUEUE_EMPTY:
+            if self.hint_when_enabled != "":
+                self.setToolTip("<nobr>" + self.hint_when_enabled + "<br>" + GlobalSetting.DISABLE_TOOLTIP)
+            else:
+                self.setToolTip("<nobr>" + GlobalSetting.DISABLE_TOOLTIP)
+        else:
+            self.setToolTip(self.hint_when_enabled)
+
+    def setDisabled(self, new_state: bool):
+        super().setDisabled(new_state)
+        if new_state and not GlobalSetting.JOB_QUEUE_EMPTY:
+            if self.hint_when_enabled != "":
+                self.setToolTip("<nobr>" + self.hint_when_enabled + "<br>" + GlobalSetting.DISABLE_TOOLTIP)
+            else:
+                self.setToolTip("<nobr>" + GlobalSetting.DISABLE_TOOLTIP)
+        else:
+            self.setToolTip(self.hint_when_enabled)
+
+    def setToolTip(self, new_tool_tip: str):
+        if self.isEnabled() or GlobalSetting.JOB_QUEUE_EMPTY:
+            self.hint_when_enabled = new_tool_tip
+        super().setToolTip(new_tool_tip)
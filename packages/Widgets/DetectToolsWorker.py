@@ -0,0 +1,22 @@
+import logging
+import traceback
+
+from PySide6.QtCore import QObject, Signal
+
+from packages.Startup import GlobalFiles
+
+
+class DetectToolsWorker(QObject):
+    finished_signal = Signal(str)  # error message, empty when both tools were found
+
+    def __init__(self):
+        super().__init__()
+
+    def run(self):
+        error_message = ""
+        try:
+            GlobalFiles.detect_tools()
+        except Exception as e:
+            logging.error(traceback.format_exc())
+            error_message = str(e)
+        self.finished_signal.emit(error_message)
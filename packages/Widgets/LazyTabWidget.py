@@ -0,0 +1,22 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+
+# A tab page that only creates its real tab the first time it's needed, so tabs the user never opens cost nothing
+# at startup
+class LazyTabWidget(QWidget):
+    def __init__(self, create_tab_function):
+        super().__init__()
+        self.create_tab_function = create_tab_function
+        self.tab = None
+        self.main_layout = QVBoxLayout()
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self.main_layout)
+
+    def is_tab_created(self):
+        return self.tab is not None
+
+    def get_tab(self):
+        if self.tab is None:
+            self.tab = self.create_tab_function()
+            self.main_layout.addWidget(self.tab)
+        return self.tab
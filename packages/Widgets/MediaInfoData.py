@@ -0,0 +1,11 @@
+class MediaInfoData:
+    def __init__(self):
+        self.file_name = ""
+        self.file_size = -1
+        self.modified_time = -1
+        self.is_valid_video = False
+        self.tracks = []
+        self.attachments = []
+        self.chapters = []
+        self.json_info = {}
+        self.probe_error = ""  # why mkvmerge couldn't identify the file, "" when the probe succeeded
@@ -4,3 +4,5 @@ class PathData:
         self.absolute_name = ""
         self.total_size = 0
         self.files_list = []
+        self.is_scanned = True  # False until the background scan fills files_list and total_size
+        self.is_attachable = True  # False for a folder that can't be read or an empty file, the scan drops it